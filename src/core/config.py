@@ -41,6 +41,10 @@ class OxigraphConfig(BaseModel):
     update_endpoint: str = "http://oxigraph:7878/update"
     default_graph_uri: str = "http://sundaygraph.org/graph"
     timeout: int = 30
+    cache_max_entries: int = 512  # LRU query-result cache size (0 disables)
+    cache_ttl: Optional[float] = None  # Seconds before a cached result expires
+    max_workers: int = 16  # Thread pool size for concurrent per-entity queries
+    http2: bool = False  # Use httpx HTTP/2 client (requires sundaygraph[http2])
 
 
 class MemoryGraphConfig(BaseModel):
@@ -303,7 +303,11 @@ class SundayGraph:
                     sparql_endpoint=oxigraph_config.sparql_endpoint,
                     update_endpoint=oxigraph_config.update_endpoint,
                     default_graph_uri=oxigraph_config.default_graph_uri,
-                    timeout=oxigraph_config.timeout
+                    timeout=oxigraph_config.timeout,
+                    cache_max_entries=oxigraph_config.cache_max_entries,
+                    cache_ttl=oxigraph_config.cache_ttl,
+                    max_workers=oxigraph_config.max_workers,
+                    http2=oxigraph_config.http2
                 )
             except Exception as e:
                 logger.warning(f"Failed to connect to Oxigraph: {e}. Falling back to memory store.")
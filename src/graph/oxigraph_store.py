@@ -1,17 +1,87 @@
 """Oxigraph SPARQL graph store implementation"""
 
-from typing import Dict, Any, List, Optional
+import functools
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
 from loguru import logger
 from urllib.parse import quote
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3.util.request import ACCEPT_ENCODING
 from .graph_store import GraphStore
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+try:
+    import httpx
+    _CONNECTION_ERRORS: Tuple[type, ...] = (RequestsConnectionError, httpx.ConnectError)
+except ImportError:
+    httpx = None
+    _CONNECTION_ERRORS = (RequestsConnectionError,)
+
+
+# Characters that must be escaped inside a quoted SPARQL string literal
+_SPARQL_LITERAL_TABLE = str.maketrans({
+    '\\': '\\\\',
+    '"': '\\"',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+
+
+def _escape_literal(value: str) -> str:
+    """Escape a string for use inside a double-quoted SPARQL literal"""
+    return value.translate(_SPARQL_LITERAL_TABLE)
+
+
+@functools.lru_cache(maxsize=8192)
+def _uri_encode_cached(value: str) -> str:
+    """Percent-encode a URI segment (memoized; ids and property keys repeat heavily)"""
+    return quote(value, safe='')
+
+
+@functools.lru_cache(maxsize=8192)
+def _prefixed_uri_cached(prefix: str, value: str) -> str:
+    """Build a URI from a namespace prefix and an encoded segment (memoized)"""
+    return prefix + _uri_encode_cached(value)
+
 
 class OxigraphGraphStore(GraphStore):
     """Oxigraph SPARQL graph store with workspace namespace support"""
     
-    def __init__(self, sparql_endpoint: str, update_endpoint: str, default_graph_uri: str = "http://sundaygraph.org/graph", timeout: int = 30):
+    _ENTITY_PREFIX = "http://sundaygraph.org/entity/"
+    _TYPE_PREFIX = "http://sundaygraph.org/type/"
+    _RELATION_PREFIX = "http://sundaygraph.org/relation/"
+    _PROPERTY_PREFIX = "http://sundaygraph.org/property/"
+    _RDF_TYPE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#type"
+    _XSD_BOOLEAN = "http://www.w3.org/2001/XMLSchema#boolean"
+    _XSD_INTEGER = "http://www.w3.org/2001/XMLSchema#integer"
+    _XSD_DOUBLE = "http://www.w3.org/2001/XMLSchema#double"
+    _GRAPH_URI_CACHE_SIZE = 1024
+    
+    def __init__(
+        self,
+        sparql_endpoint: str,
+        update_endpoint: str,
+        default_graph_uri: str = "http://sundaygraph.org/graph",
+        timeout: int = 30,
+        cache_max_entries: int = 512,
+        cache_ttl: Optional[float] = None,
+        max_workers: int = 16,
+        http2: bool = False
+    ):
         """
         Initialize Oxigraph graph store
         
@@ -20,81 +90,232 @@ class OxigraphGraphStore(GraphStore):
             update_endpoint: SPARQL update endpoint URL
             default_graph_uri: Default graph URI for data
             timeout: Request timeout in seconds
+            cache_max_entries: Maximum number of cached query results (0 disables the cache)
+            cache_ttl: Optional lifetime of a cached query result in seconds
+            max_workers: Thread pool size for fanning out independent per-entity queries
+            http2: Use an httpx HTTP/2 client (multiplexes concurrent queries on one
+                connection); falls back to requests when httpx/h2 are not installed
         """
         self.sparql_endpoint = sparql_endpoint
         self.update_endpoint = update_endpoint
         self.default_graph_uri = default_graph_uri
         self.timeout = timeout
         
+        # LRU cache of SELECT results, invalidated on every update
+        self.cache_max_entries = cache_max_entries
+        self.cache_ttl = cache_ttl
+        self._query_cache: "OrderedDict[Tuple[str, bytes], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_generation = 0
+        
+        # Workspace id -> named graph URI
+        self._graph_uri_cache: Dict[str, str] = {}
+        
+        # Per-entity follow-up queries are I/O-bound and independent
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="oxigraph")
+        
+        # Shared session: pooled keep-alive connections sized for the executor, and
+        # every response encoding the client can decode (URI-heavy result JSON
+        # compresses well). httpx advertises its decoders by default; requests only
+        # sends "gzip, deflate", so ask urllib3 which also adds br/zstd when installed.
+        self._session = self._create_http2_client(max_workers) if http2 else None
+        if self._session is not None:
+            self._body_kwarg = "content"
+        else:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=max(max_workers, 10))
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            self._session.headers.update({"Accept-Encoding": ACCEPT_ENCODING})
+            self._body_kwarg = "data"
+        
         # Test connection (non-blocking, allow graceful degradation)
         try:
-            response = requests.get(f"{sparql_endpoint}?query={quote('SELECT * WHERE { ?s ?p ?o } LIMIT 1')}", timeout=5)
+            response = self._session.get(f"{sparql_endpoint}?query={quote('SELECT * WHERE { ?s ?p ?o } LIMIT 1')}", timeout=5)
             response.raise_for_status()
             logger.info(f"Connected to Oxigraph at {sparql_endpoint}")
         except Exception as e:
             logger.warning(f"Could not verify Oxigraph connection: {e}. Will attempt connection on first use.")
     
+    def _create_http2_client(self, max_workers: int) -> Optional[Any]:
+        """Create an httpx HTTP/2 client, or None if httpx/h2 are unavailable"""
+        if httpx is None:
+            logger.warning("http2 requested but httpx is not installed. Falling back to requests.")
+            return None
+        try:
+            return httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=max(max_workers, 32), max_connections=max(max_workers, 64)),
+                timeout=self.timeout
+            )
+        except ImportError as e:
+            logger.warning(f"http2 requested but HTTP/2 support is missing ({e}). Falling back to requests.")
+            return None
+    
     def _get_graph_uri(self, workspace_id: Optional[str] = None) -> str:
         """Get graph URI for workspace"""
-        if workspace_id:
-            return f"{self.default_graph_uri}/workspace/{workspace_id}"
-        return self.default_graph_uri
-    
-    def _uri_encode(self, value: str) -> str:
-        """Encode value as URI"""
-        return quote(value, safe='')
+        if not workspace_id:
+            return self.default_graph_uri
+        uri = self._graph_uri_cache.get(workspace_id)
+        if uri is None:
+            uri = f"{self.default_graph_uri}/workspace/{workspace_id}"
+            # Size cap keeps the cache bounded if workspace ids are unbounded
+            if len(self._graph_uri_cache) >= self._GRAPH_URI_CACHE_SIZE:
+                self._graph_uri_cache.clear()
+            self._graph_uri_cache[workspace_id] = uri
+        return uri
     
     def _entity_to_uri(self, entity_id: str) -> str:
         """Convert entity ID to URI"""
-        return f"http://sundaygraph.org/entity/{self._uri_encode(entity_id)}"
+        return _prefixed_uri_cached(self._ENTITY_PREFIX, entity_id)
     
     def _type_to_uri(self, entity_type: str) -> str:
         """Convert entity type to URI"""
-        return f"http://sundaygraph.org/type/{self._uri_encode(entity_type)}"
+        return _prefixed_uri_cached(self._TYPE_PREFIX, entity_type)
     
     def _relation_to_uri(self, relation_type: str) -> str:
         """Convert relation type to URI"""
-        return f"http://sundaygraph.org/relation/{self._uri_encode(relation_type)}"
+        return _prefixed_uri_cached(self._RELATION_PREFIX, relation_type)
+    
+    def _format_literal(self, value: Any) -> str:
+        """Format a property value as an RDF literal with a matching XSD datatype"""
+        if isinstance(value, str):
+            return '"' + _escape_literal(value) + '"'
+        # bool must be checked before int (bool is an int subclass)
+        if isinstance(value, bool):
+            return f'"{"true" if value else "false"}"^^<{self._XSD_BOOLEAN}>'
+        if isinstance(value, int):
+            return f'"{value}"^^<{self._XSD_INTEGER}>'
+        if isinstance(value, float):
+            if math.isnan(value):
+                lexical = "NaN"
+            elif math.isinf(value):
+                lexical = "INF" if value > 0 else "-INF"
+            else:
+                lexical = repr(value)
+            return f'"{lexical}"^^<{self._XSD_DOUBLE}>'
+        return '"' + _escape_literal(str(value)) + '"'
+    
+    def _cache_key(self, query: str) -> Tuple[str, bytes]:
+        """Build query cache key from endpoint and query string"""
+        return (self.sparql_endpoint, hashlib.blake2b(query.encode("utf-8")).digest())
+    
+    def _invalidate_cache(self) -> None:
+        """Drop all cached query results"""
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._query_cache.clear()
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """Get query cache statistics"""
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._query_cache)
+            }
     
     def _execute_sparql_query(self, query: str) -> List[Dict[str, Any]]:
-        """Execute SPARQL SELECT query"""
+        """Execute SPARQL SELECT query, serving repeated queries from the LRU cache"""
+        if self.cache_max_entries <= 0:
+            return self._run_sparql_query(query) or []
+        
+        key = self._cache_key(query)
+        with self._cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                stored_at, bindings = cached
+                if self.cache_ttl is None or time.monotonic() - stored_at < self.cache_ttl:
+                    self._query_cache.move_to_end(key)
+                    self._cache_hits += 1
+                    return list(bindings)
+                del self._query_cache[key]
+            self._cache_misses += 1
+            generation = self._cache_generation
+        
+        bindings = self._run_sparql_query(query)
+        if bindings is None:
+            return []
+        
+        with self._cache_lock:
+            # Skip storing if an update ran while the query was in flight
+            if generation != self._cache_generation:
+                return list(bindings)
+            self._query_cache[key] = (time.monotonic(), bindings)
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self.cache_max_entries:
+                self._query_cache.popitem(last=False)
+        return list(bindings)
+    
+    def _run_sparql_query(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        """Send SPARQL SELECT query to Oxigraph (None on failure)"""
         try:
-            response = requests.get(
+            response = self._session.get(
                 self.sparql_endpoint,
                 params={"query": query},
                 headers={"Accept": "application/sparql-results+json"},
                 timeout=self.timeout
             )
             response.raise_for_status()
-            result = response.json()
+            # Parse raw bytes directly (orjson when installed, ~3-5x faster than stdlib)
+            result = _json_loads(response.content)
             
             if "results" in result and "bindings" in result["results"]:
                 return result["results"]["bindings"]
             return []
-        except RequestsConnectionError as e:
+        except _CONNECTION_ERRORS as e:
             logger.warning(f"Oxigraph connection failed: {e}. Is Oxigraph running? Returning empty results.")
-            return []
+            return None
         except Exception as e:
             logger.error(f"SPARQL query error: {e}")
-            return []
+            return None
     
-    def _execute_sparql_update(self, update: str) -> bool:
-        """Execute SPARQL UPDATE query"""
+    @staticmethod
+    def _build_insert_data(graph_uri: str, triples: List[str]) -> bytes:
+        """Encode an INSERT DATA update straight into a byte buffer"""
+        buf = bytearray(b"INSERT DATA { GRAPH <")
+        buf += graph_uri.encode("utf-8")
+        buf += b"> {\n"
+        for triple in triples:
+            buf += triple.encode("utf-8")
+            buf += b" .\n"
+        buf += b"} }"
+        return bytes(buf)
+    
+    def _execute_sparql_update(self, update: Union[str, bytes, Iterable[str]]) -> bool:
+        """
+        Execute SPARQL UPDATE query
+        
+        The update is sent as a raw application/sparql-update body. Passing an
+        iterable of string chunks streams it with chunked transfer-encoding, so
+        large bulk updates never need to be materialized as a single string.
+        """
+        if isinstance(update, bytes):
+            body = update
+        elif isinstance(update, str):
+            body = update.encode("utf-8")
+        else:
+            body = (chunk.encode("utf-8") for chunk in update)
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.update_endpoint,
-                data={"update": update},
                 headers={"Content-Type": "application/sparql-update"},
-                timeout=self.timeout
+                timeout=self.timeout,
+                **{self._body_kwarg: body}
             )
             response.raise_for_status()
             return True
-        except RequestsConnectionError as e:
+        except _CONNECTION_ERRORS as e:
             logger.warning(f"Oxigraph connection failed: {e}. Is Oxigraph running? Update operation failed.")
             return False
         except Exception as e:
             logger.error(f"SPARQL update error: {e}")
             return False
+        finally:
+            # Any write may change query results
+            self._invalidate_cache()
     
     def add_entity(
         self, 
@@ -109,35 +330,22 @@ class OxigraphGraphStore(GraphStore):
         type_uri = self._type_to_uri(entity_type)
         
         # Build SPARQL UPDATE to insert entity
+        property_prefix = f"<{entity_uri}> <{self._PROPERTY_PREFIX}"
         triples = [
-            f"<{entity_uri}> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <{type_uri}>",
-            f"<{entity_uri}> <http://sundaygraph.org/property/id> \"{entity_id}\"",
-            f"<{entity_uri}> <http://sundaygraph.org/property/type> \"{entity_type}\""
+            f"<{entity_uri}> <{self._RDF_TYPE}> <{type_uri}>",
+            f"{property_prefix}id> \"{_escape_literal(entity_id)}\"",
+            f"{property_prefix}type> \"{_escape_literal(entity_type)}\""
         ]
         
         if workspace_id:
-            triples.append(f"<{entity_uri}> <http://sundaygraph.org/property/workspace_id> \"{workspace_id}\"")
+            triples.append(f"{property_prefix}workspace_id> \"{workspace_id}\"")
         
         # Add properties as RDF triples
-        for key, value in properties.items():
-            if isinstance(value, str):
-                # Escape quotes in string values
-                value_escaped = value.replace('"', '\\"')
-                triples.append(f"<{entity_uri}> <http://sundaygraph.org/property/{self._uri_encode(key)}> \"{value_escaped}\"")
-            elif isinstance(value, (int, float, bool)):
-                triples.append(f"<{entity_uri}> <http://sundaygraph.org/property/{self._uri_encode(key)}> \"{value}\"^^<http://www.w3.org/2001/XMLSchema#string>")
-            else:
-                triples.append(f"<{entity_uri}> <http://sundaygraph.org/property/{self._uri_encode(key)}> \"{str(value)}\"")
-        
-        update_query = f"""
-        INSERT DATA {{
-            GRAPH <{graph_uri}> {{
-                {' . '.join(triples)}
-            }}
-        }}
-        """
-        
-        return self._execute_sparql_update(update_query)
+        triples.extend([
+            property_prefix + _uri_encode_cached(key) + "> " + self._format_literal(value)
+            for key, value in properties.items()
+        ])
+        return self._execute_sparql_update(self._build_insert_data(graph_uri, triples))
     
     def add_relation(
         self,
@@ -159,40 +367,41 @@ class OxigraphGraphStore(GraphStore):
         
         if workspace_id:
             # Store workspace_id as a property of the relation (using reification)
-            relation_node = f"<http://sundaygraph.org/relation/{self._uri_encode(f'{source_id}_{target_id}_{relation_type}')}>"
+            relation_node = f"<{self._relation_to_uri(f'{source_id}_{target_id}_{relation_type}')}>"
             triples.extend([
-                f"<{source_uri}> <{relation_uri}> <{target_uri}>",
-                f"{relation_node} <http://sundaygraph.org/property/workspace_id> \"{workspace_id}\"",
-                f"{relation_node} <http://sundaygraph.org/property/type> \"{relation_type}\""
+                f"{relation_node} <{self._PROPERTY_PREFIX}workspace_id> \"{workspace_id}\"",
+                f"{relation_node} <{self._PROPERTY_PREFIX}type> \"{_escape_literal(relation_type)}\""
             ])
         
         if properties:
-            for key, value in properties.items():
-                if isinstance(value, str):
-                    value_escaped = value.replace('"', '\\"')
-                    triples.append(f"<{source_uri}> <http://sundaygraph.org/relation/{self._uri_encode(relation_type)}/{self._uri_encode(key)}> \"{value_escaped}\"")
-                else:
-                    triples.append(f"<{source_uri}> <http://sundaygraph.org/relation/{self._uri_encode(relation_type)}/{self._uri_encode(key)}> \"{str(value)}\"")
-        
-        update_query = f"""
-        INSERT DATA {{
-            GRAPH <{graph_uri}> {{
-                {' . '.join(triples)}
-            }}
-        }}
-        """
-        
-        return self._execute_sparql_update(update_query)
+            # Relation property predicates live under the relation URI
+            property_prefix = f"<{source_uri}> <{relation_uri}/"
+            triples.extend([
+                property_prefix + _uri_encode_cached(key) + "> " + self._format_literal(value)
+                for key, value in properties.items()
+            ])
+        return self._execute_sparql_update(self._build_insert_data(graph_uri, triples))
     
     def get_entity(self, entity_id: str, workspace_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Get entity by ID"""
         graph_uri = self._get_graph_uri(workspace_id)
         entity_uri = self._entity_to_uri(entity_id)
         
+        # Property names are sliced off the predicate URI server-side; rdf:type
+        # only supplies "type" when no explicit type property was stored
         query = f"""
-        SELECT ?p ?o WHERE {{
+        SELECT ?key ?o WHERE {{
             GRAPH <{graph_uri}> {{
-                <{entity_uri}> ?p ?o
+                {{
+                    <{entity_uri}> ?p ?o .
+                    FILTER(STRSTARTS(STR(?p), "{self._PROPERTY_PREFIX}"))
+                    BIND(STRAFTER(STR(?p), "{self._PROPERTY_PREFIX}") AS ?key)
+                }} UNION {{
+                    <{entity_uri}> <{self._RDF_TYPE}> ?t .
+                    FILTER NOT EXISTS {{ <{entity_uri}> <{self._PROPERTY_PREFIX}type> ?declared }}
+                    BIND("type" AS ?key)
+                    BIND(STRAFTER(STR(?t), "{self._TYPE_PREFIX}") AS ?o)
+                }}
             }}
         }}
         """
@@ -203,18 +412,19 @@ class OxigraphGraphStore(GraphStore):
         
         entity = {"id": entity_id}
         for binding in results:
-            pred = binding.get("p", {}).get("value", "")
-            obj = binding.get("o", {}).get("value", "")
-            
-            # Extract property name from URI
-            if "property/" in pred:
-                prop_name = pred.split("property/")[-1]
-                entity[prop_name] = obj
-            elif "type" in pred:
-                entity["type"] = obj.split("/")[-1] if "/" in obj else obj
+            entity[binding["key"]["value"]] = binding["o"]["value"]
         
         return entity
     
+    def _get_entities(self, entity_ids: List[str], workspace_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch several entities concurrently, preserving order and skipping missing ones"""
+        if len(entity_ids) <= 1:
+            entities = [self.get_entity(entity_id, workspace_id) for entity_id in entity_ids]
+        else:
+            futures = [self._executor.submit(self.get_entity, entity_id, workspace_id) for entity_id in entity_ids]
+            entities = [future.result() for future in futures]
+        return [entity for entity in entities if entity]
+    
     def query_entities(
         self,
         entity_type: Optional[str] = None,
@@ -228,14 +438,15 @@ class OxigraphGraphStore(GraphStore):
         where_clauses = ["?s ?p ?o"]
         if entity_type:
             type_uri = self._type_to_uri(entity_type)
-            where_clauses.append(f"?s <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <{type_uri}>")
+            where_clauses.append(f"?s <{self._RDF_TYPE}> <{type_uri}>")
         
         if workspace_id:
-            where_clauses.append(f"?s <http://sundaygraph.org/property/workspace_id> \"{workspace_id}\"")
+            where_clauses.append(f"?s <{self._PROPERTY_PREFIX}workspace_id> \"{workspace_id}\"")
         
         if filters:
             for key, value in filters.items():
-                where_clauses.append(f"?s <http://sundaygraph.org/property/{self._uri_encode(key)}> \"{value}\"")
+                # Use the same typed literal as add_entity so the index lookup matches
+                where_clauses.append(f"?s <{self._PROPERTY_PREFIX}{_uri_encode_cached(key)}> {self._format_literal(value)}")
         
         query = f"""
         SELECT DISTINCT ?s WHERE {{
@@ -246,18 +457,15 @@ class OxigraphGraphStore(GraphStore):
         """
         
         results = self._execute_sparql_query(query)
-        entities = []
+        entity_ids = []
         
         for binding in results:
             entity_uri = binding.get("s", {}).get("value", "")
             if entity_uri:
                 # Extract entity ID from URI
-                entity_id = entity_uri.split("/")[-1] if "/" in entity_uri else entity_uri
-                entity = self.get_entity(entity_id, workspace_id)
-                if entity:
-                    entities.append(entity)
+                entity_ids.append(entity_uri.split("/")[-1] if "/" in entity_uri else entity_uri)
         
-        return entities
+        return self._get_entities(entity_ids, workspace_id)
     
     def query_relations(
         self,
@@ -286,7 +494,7 @@ class OxigraphGraphStore(GraphStore):
             where_clauses.append(f"?s <{relation_uri}> ?o")
         
         if workspace_id:
-            where_clauses.append(f"?s <http://sundaygraph.org/property/workspace_id> \"{workspace_id}\"")
+            where_clauses.append(f"?s <{self._PROPERTY_PREFIX}workspace_id> \"{workspace_id}\"")
         
         query = f"""
         SELECT ?s ?p ?o WHERE {{
@@ -358,7 +566,7 @@ class OxigraphGraphStore(GraphStore):
             """
         
         results = self._execute_sparql_query(query)
-        neighbors = []
+        neighbor_ids = []
         
         for binding in results:
             if direction == "out":
@@ -369,12 +577,9 @@ class OxigraphGraphStore(GraphStore):
                 neighbor_uri = binding.get("o", {}).get("value") or binding.get("s", {}).get("value", "")
             
             if neighbor_uri and neighbor_uri != entity_uri:
-                neighbor_id = neighbor_uri.split("/")[-1] if "/" in neighbor_uri else neighbor_uri
-                neighbor = self.get_entity(neighbor_id, workspace_id)
-                if neighbor:
-                    neighbors.append(neighbor)
+                neighbor_ids.append(neighbor_uri.split("/")[-1] if "/" in neighbor_uri else neighbor_uri)
         
-        return neighbors
+        return self._get_entities(neighbor_ids, workspace_id)
     
     def delete_entity(self, entity_id: str) -> bool:
         """Delete an entity"""
@@ -399,22 +604,34 @@ class OxigraphGraphStore(GraphStore):
         """Get graph statistics"""
         graph_uri = self._get_graph_uri(workspace_id)
         
-        query = f"""
-        SELECT (COUNT(DISTINCT ?s) AS ?nodes) (COUNT(?p) AS ?edges) WHERE {{
+        # Only typed subjects are entities
+        nodes_query = f"""
+        SELECT (COUNT(DISTINCT ?s) AS ?nodes) WHERE {{
             GRAPH <{graph_uri}> {{
-                ?s ?p ?o
+                ?s <{self._RDF_TYPE}> ?t
             }}
         }}
         """
         
-        results = self._execute_sparql_query(query)
-        if results:
-            binding = results[0]
-            return {
-                "nodes": int(binding.get("nodes", {}).get("value", 0)),
-                "edges": int(binding.get("edges", {}).get("value", 0)),
-                "workspace_id": workspace_id,
-                "backend": "oxigraph"
-            }
+        # Edges are relation predicates pointing at another resource
+        # (relation properties share the namespace but have literal objects)
+        edges_query = f"""
+        SELECT (COUNT(*) AS ?edges) WHERE {{
+            GRAPH <{graph_uri}> {{
+                ?s ?p ?o .
+                FILTER(STRSTARTS(STR(?p), "{self._RELATION_PREFIX}") && isIRI(?o))
+            }}
+        }}
+        """
         
-        return {"nodes": 0, "edges": 0, "workspace_id": workspace_id, "backend": "oxigraph"}
+        node_results = self._execute_sparql_query(nodes_query)
+        edge_results = self._execute_sparql_query(edges_query)
+        nodes = int(node_results[0].get("nodes", {}).get("value", 0)) if node_results else 0
+        edges = int(edge_results[0].get("edges", {}).get("value", 0)) if edge_results else 0
+        
+        return {"nodes": nodes, "edges": edges, "workspace_id": workspace_id, "backend": "oxigraph"}
+    
+    def close(self) -> None:
+        """Shut down the query thread pool and HTTP session"""
+        self._executor.shutdown(wait=False)
+        self._session.close()
@@ -0,0 +1,88 @@
+"""Optional Numba-compiled kernels for ODL relationship graph analysis."""
+
+from typing import List, Tuple
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+    _njit = numba.njit(cache=True)
+except ImportError:
+    # Kernels still run (slowly) as plain Python, so results stay testable
+    NUMBA_AVAILABLE = False
+    
+    def _njit(fn):
+        return fn
+
+
+@_njit
+def _find(parent, i):
+    """Root of i's set, compressing the path on the way."""
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    while parent[i] != root:
+        nxt = parent[i]
+        parent[i] = root
+        i = nxt
+    return root
+
+
+@_njit
+def dsu_cycle_edges(from_idx, to_idx, n):
+    """
+    Union edge endpoints in order.
+    
+    Returns:
+        Tuple of (root of every node, mask of edges whose endpoints were
+        already connected, i.e. edges that close a cycle)
+    """
+    parent = np.arange(n, dtype=np.int32)
+    rank = np.zeros(n, dtype=np.int32)
+    closes_cycle = np.zeros(from_idx.shape[0], dtype=np.bool_)
+    
+    for e in range(from_idx.shape[0]):
+        a = _find(parent, from_idx[e])
+        b = _find(parent, to_idx[e])
+        if a == b:
+            closes_cycle[e] = True
+            continue
+        if rank[a] < rank[b]:
+            a, b = b, a
+        parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+    
+    roots = np.empty(n, dtype=np.int32)
+    for i in range(n):
+        roots[i] = _find(parent, i)
+    return roots, closes_cycle
+
+
+def analyze_relationship_graph(
+    object_names: List[str],
+    edges: List[Tuple[str, str, str]]
+) -> Tuple[List[List[str]], List[Tuple[str, str, str]]]:
+    """
+    Connected components and cycle-closing edges of the relationship graph.
+    
+    Args:
+        object_names: Unique object names
+        edges: (from_object, to_object, relationship_name) with both ends in object_names
+    
+    Returns:
+        Same shape as ODLEvaluator._analyze_relationship_graph
+    """
+    name_to_idx = {name: i for i, name in enumerate(object_names)}
+    from_idx = np.fromiter((name_to_idx[e[0]] for e in edges), dtype=np.int32, count=len(edges))
+    to_idx = np.fromiter((name_to_idx[e[1]] for e in edges), dtype=np.int32, count=len(edges))
+    
+    roots, closes_cycle = dsu_cycle_edges(from_idx, to_idx, len(object_names))
+    
+    components = {}
+    for name, root in zip(object_names, roots.tolist()):
+        components.setdefault(root, []).append(name)
+    cycle_edges = [edges[e] for e in np.flatnonzero(closes_cycle).tolist()]
+    
+    return list(components.values()), cycle_edges
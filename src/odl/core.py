@@ -1,7 +1,13 @@
 """ODL core module - main entry point."""
 
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import Hashable, List, Optional, Sequence, Tuple, Union
 
 try:
     from loguru import logger
@@ -9,46 +15,196 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _canonical_bytes(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+
+    def _canonical_bytes(data: dict) -> bytes:
+        return json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
 from .loader import ODLLoader
 from .validator import ODLValidator
 from .normalizer import ODLNormalizer
 from .ir import ODLIR
 
 
+ProcessResult = Tuple[ODLIR, bool, List[str]]
+
+# Per-worker processor used by ODLProcessor.process_many
+_worker_processor: Optional["ODLProcessor"] = None
+
+
+def _init_worker(schema_path: Union[str, Path, None]) -> None:
+    """Build one processor per worker process instead of pickling it per task."""
+    global _worker_processor
+    _worker_processor = ODLProcessor(schema_path, cache_size=0)
+
+
+def _process_in_worker(file_path: Union[str, Path]) -> ProcessResult:
+    """Process a single file with the worker's processor."""
+    return _worker_processor.process(file_path)
+
+
 class ODLProcessor:
     """Main ODL processor that loads, validates, and normalizes ODL files."""
     
-    def __init__(self, schema_path: Union[str, Path, None] = None):
+    def __init__(self, schema_path: Union[str, Path, None] = None, cache_size: int = 0):
         """
         Initialize ODL processor.
         
         Args:
             schema_path: Path to JSON Schema file (optional)
+            cache_size: Maximum number of memoized process results (0, the
+                default, disables caching). Cache hits return deep copies, so
+                caching only pays off when validation dominates, e.g. for
+                large files re-processed unchanged.
         """
+        self.schema_path = schema_path
         self.loader = ODLLoader()
         self.validator = ODLValidator(schema_path)
         self.normalizer = ODLNormalizer()
+        self.cache_size = cache_size
+        self._process_cache: "OrderedDict[Hashable, ProcessResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def clear_cache(self) -> None:
+        """Drop all memoized process results."""
+        with self._cache_lock:
+            self._process_cache.clear()
+    
+    def _cache_get(self, key: Optional[Hashable]) -> Optional[ProcessResult]:
+        """Return a copy of a cached result, or None on miss."""
+        if key is None or self.cache_size <= 0:
+            return None
+        with self._cache_lock:
+            cached = self._process_cache.get(key)
+            if cached is None:
+                return None
+            self._process_cache.move_to_end(key)
+        ir, is_valid, error_messages = cached
+        # IR dataclasses are mutable; never hand out the cached instance
+        return copy.deepcopy(ir), is_valid, list(error_messages)
+    
+    def _cache_put(self, key: Optional[Hashable], result: ProcessResult) -> None:
+        """Store a copy of a result, evicting least recently used entries."""
+        if key is None or self.cache_size <= 0:
+            return
+        ir, is_valid, error_messages = result
+        with self._cache_lock:
+            self._process_cache[key] = (copy.deepcopy(ir), is_valid, list(error_messages))
+            self._process_cache.move_to_end(key)
+            while len(self._process_cache) > self.cache_size:
+                self._process_cache.popitem(last=False)
+    
+    @staticmethod
+    def _dict_cache_key(odl_dict: dict) -> Optional[Hashable]:
+        """Content hash of an ODL dict (None if it cannot be serialized)."""
+        try:
+            return ("dict", hashlib.blake2b(_canonical_bytes(odl_dict)).digest())
+        except (TypeError, ValueError) as e:
+            logger.debug(f"ODL dict not hashable for caching: {e}")
+            return None
+    
+    @staticmethod
+    def _file_cache_key(file_path: Union[str, Path]) -> Optional[Hashable]:
+        """File identity key from resolved path, mtime and size (None if missing)."""
+        try:
+            path = Path(file_path).resolve()
+            stat = path.stat()
+        except OSError:
+            return None
+        return ("file", str(path), stat.st_mtime_ns, stat.st_size)
+    
+    def _validate_and_normalize(self, odl_data: dict) -> ProcessResult:
+        """Validate and normalize loaded ODL data."""
+        # Validate
+        is_valid, error_messages = self.validator.validate(odl_data)
+        
+        # Normalize (even if validation fails, for debugging)
+        ir = self.normalizer.normalize(odl_data)
+        
+        return ir, is_valid, error_messages
     
     def process(self, file_path: Union[str, Path]) -> Tuple[ODLIR, bool, List[str]]:
         """
         Load, validate, and normalize ODL file.
         
+        With caching enabled, results are memoized on (path, mtime, size), so
+        unchanged files are not re-read or re-validated.
+        
         Args:
             file_path: Path to ODL JSON file
             
         Returns:
             Tuple of (normalized_ir, is_valid, error_messages)
         """
+        key = self._file_cache_key(file_path) if self.cache_size > 0 else None
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         # Load
         odl_data = self.loader.load(file_path)
         
-        # Validate
-        is_valid, error_messages = self.validator.validate(odl_data)
+        result = self._validate_and_normalize(odl_data)
+        self._cache_put(key, result)
+        return result
+    
+    def process_many(
+        self,
+        file_paths: Sequence[Union[str, Path]],
+        workers: Optional[int] = None
+    ) -> List[Tuple[ODLIR, bool, List[str]]]:
+        """
+        Load, validate, and normalize many ODL files across worker processes.
         
-        # Normalize (even if validation fails, for debugging)
-        ir = self.normalizer.normalize(odl_data)
+        Cached results are served locally; only the remaining files are sent to
+        the pool. Results are returned in input order.
         
-        return ir, is_valid, error_messages
+        Args:
+            file_paths: Paths to ODL JSON files
+            workers: Number of worker processes (defaults to CPU count)
+            
+        Returns:
+            List of (normalized_ir, is_valid, error_messages) tuples
+        """
+        results: List[Optional[ProcessResult]] = [None] * len(file_paths)
+        pending: List[Tuple[int, Union[str, Path], Optional[Hashable]]] = []
+        for index, file_path in enumerate(file_paths):
+            key = self._file_cache_key(file_path) if self.cache_size > 0 else None
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append((index, file_path, key))
+        
+        workers = min(workers or os.cpu_count() or 1, len(pending)) if pending else 0
+        if workers <= 1:
+            for index, file_path, _ in pending:
+                results[index] = self.process(file_path)
+            return results
+        
+        logger.info(f"Processing {len(pending)} ODL files with {workers} worker processes")
+        chunksize = max(1, len(pending) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.schema_path,)
+        ) as executor:
+            processed = executor.map(
+                _process_in_worker,
+                [file_path for _, file_path, _ in pending],
+                chunksize=chunksize
+            )
+            for (index, _, key), result in zip(pending, processed):
+                self._cache_put(key, result)
+                results[index] = result
+        
+        return results
     
     def process_from_string(self, json_string: str) -> Tuple[ODLIR, bool, List[str]]:
         """
@@ -63,28 +219,26 @@ class ODLProcessor:
         # Load
         odl_data = self.loader.load_from_string(json_string)
         
-        # Validate
-        is_valid, error_messages = self.validator.validate(odl_data)
-        
-        # Normalize
-        ir = self.normalizer.normalize(odl_data)
-        
-        return ir, is_valid, error_messages
+        return self.process_from_dict(odl_data)
     
     def process_from_dict(self, odl_dict: dict) -> Tuple[ODLIR, bool, List[str]]:
         """
         Load, validate, and normalize ODL from dictionary.
         
+        With caching enabled, results are memoized on a content hash of the
+        dictionary, so re-processing identical input skips validation.
+        
         Args:
             odl_dict: Dictionary containing ODL data
             
         Returns:
             Tuple of (normalized_ir, is_valid, error_messages)
         """
-        # Validate
-        is_valid, error_messages = self.validator.validate(odl_dict)
-        
-        # Normalize
-        ir = self.normalizer.normalize(odl_dict)
+        key = self._dict_cache_key(odl_dict) if self.cache_size > 0 else None
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         
-        return ir, is_valid, error_messages
+        result = self._validate_and_normalize(odl_dict)
+        self._cache_put(key, result)
+        return result
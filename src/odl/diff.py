@@ -1,12 +1,23 @@
 """ODL diff engine - compares two ODL versions and identifies breaking/non-breaking changes."""
 
-from typing import Dict, List, Any, Optional, Tuple
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Final, IO, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
 from .ir import ODLIR, ObjectIR, RelationshipIR, MetricIR, DimensionIR, PropertyIR
 
 
+# Cardinality strictness; moving to a higher value tightens a relationship
+_CARDINALITY_ORDER: Final[Dict[str, int]] = {
+    "many_to_many": 0,
+    "many_to_one": 1,
+    "one_to_many": 1,
+    "one_to_one": 2
+}
+
+
 class ChangeType(Enum):
     """Type of change."""
     BREAKING = "breaking"
@@ -47,7 +58,7 @@ class ChangeCategory(Enum):
     DIMENSION_DESCRIPTION_CHANGED = "dimension_description_changed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Change:
     """Represents a single change."""
     category: ChangeCategory
@@ -56,12 +67,19 @@ class Change:
     old_value: Any = None
     new_value: Any = None
     details: Dict[str, Any] = field(default_factory=dict)
+    # Enum values resolved once for serialization
+    category_value: str = field(init=False, repr=False, compare=False)
+    change_type_value: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.category_value = self.category.value
+        self.change_type_value = self.change_type.value
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "category": self.category.value,
-            "change_type": self.change_type.value,
+            "category": self.category_value,
+            "change_type": self.change_type_value,
             "element_name": self.element_name,
             "old_value": self.old_value,
             "new_value": self.new_value,
@@ -69,7 +87,7 @@ class Change:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffResult:
     """Result of comparing two ODL versions."""
     old_version: str
@@ -78,6 +96,16 @@ class DiffResult:
     non_breaking_changes: List[Change] = field(default_factory=list)
     summary: Dict[str, int] = field(default_factory=dict)
     
+    def compute_summary(self) -> Dict[str, int]:
+        """Count breaking and non-breaking changes."""
+        total_breaking = len(self.breaking_changes)
+        total_non_breaking = len(self.non_breaking_changes)
+        return {
+            "total_breaking": total_breaking,
+            "total_non_breaking": total_non_breaking,
+            "total_changes": total_breaking + total_non_breaking
+        }
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -85,17 +113,109 @@ class DiffResult:
             "new_version": self.new_version,
             "breaking_changes": [c.to_dict() for c in self.breaking_changes],
             "non_breaking_changes": [c.to_dict() for c in self.non_breaking_changes],
-            "summary": {
-                "total_breaking": len(self.breaking_changes),
-                "total_non_breaking": len(self.non_breaking_changes),
-                "total_changes": len(self.breaking_changes) + len(self.non_breaking_changes)
-            }
+            # Reuse the summary computed by diff() when present
+            "summary": dict(self.summary) if self.summary else self.compute_summary()
         }
+    
+    def iter_change_dicts(self) -> Iterator[Dict[str, Any]]:
+        """Yield each change as a dictionary, breaking changes first."""
+        for change in self.breaking_changes:
+            yield change.to_dict()
+        for change in self.non_breaking_changes:
+            yield change.to_dict()
+    
+    def dump_json(self, fp: IO[str]) -> None:
+        """
+        Stream the `to_dict()` document as JSON, one change at a time.
+        
+        Args:
+            fp: Text file-like object to write to
+        """
+        dumps = json.dumps
+        fp.write('{"old_version":' + dumps(self.old_version))
+        fp.write(',"new_version":' + dumps(self.new_version))
+        for key, changes in (
+            ("breaking_changes", self.breaking_changes),
+            ("non_breaking_changes", self.non_breaking_changes)
+        ):
+            fp.write(',"' + key + '":[')
+            for i, change in enumerate(changes):
+                if i:
+                    fp.write(",")
+                fp.write(dumps(change.to_dict(), separators=(",", ":"), default=str))
+            fp.write("]")
+        summary = dict(self.summary) if self.summary else self.compute_summary()
+        fp.write(',"summary":' + dumps(summary, separators=(",", ":")) + "}")
+
+
+# Per-collection diff methods, in the order their changes are reported
+_DIFF_SECTIONS: Final[Tuple[str, ...]] = (
+    "_diff_objects",
+    "_diff_relationships",
+    "_diff_metrics",
+    "_diff_dimensions"
+)
+
+_worker_irs: Optional[Tuple[ODLIR, ODLIR]] = None
+
+
+def _ir_size(ir: ODLIR) -> int:
+    """Number of elements the diff has to visit."""
+    return (
+        len(ir.objects) + sum(len(obj.properties) for obj in ir.objects)
+        + len(ir.relationships) + len(ir.metrics) + len(ir.dimensions)
+    )
+
+
+def _by_name(items: List[Any]) -> Dict[str, Any]:
+    """
+    Key elements by name.
+    
+    Built per diff instead of using the IR's cached indexes, so lists edited
+    in place are always compared as they are now.
+    """
+    return {item.name: item for item in items}
+
+
+def _unchanged(old_ir: ODLIR, new_ir: ODLIR, collection: str) -> bool:
+    """Whether a collection is identical in both IRs (nothing to report)."""
+    # Differing fingerprints rule out equality cheaply; a match is confirmed with ==
+    return (
+        old_ir.fingerprint(collection) == new_ir.fingerprint(collection)
+        and getattr(old_ir, collection) == getattr(new_ir, collection)
+    )
+
+
+def _init_diff_worker(old_ir: ODLIR, new_ir: ODLIR) -> None:
+    """Receive both IRs once per worker process instead of once per section."""
+    global _worker_irs
+    _worker_irs = (old_ir, new_ir)
+
+
+def _diff_section_in_worker(section: str) -> Tuple[List[Change], List[Change]]:
+    """Run one diff section against the worker's IRs."""
+    old_ir, new_ir = _worker_irs
+    partial = DiffResult(old_version=old_ir.version, new_version=new_ir.version)
+    getattr(ODLDiffEngine(), section)(old_ir, new_ir, partial)
+    return partial.breaking_changes, partial.non_breaking_changes
 
 
 class ODLDiffEngine:
     """Engine for comparing ODL versions."""
     
+    def __init__(self, parallel_threshold: Optional[int] = None, max_workers: int = 4):
+        """
+        Initialize diff engine.
+        
+        Args:
+            parallel_threshold: Combined element count of both IRs from which the
+                diff sections run in worker processes (None, the default, keeps the
+                diff in-process; pickling both IRs usually outweighs the gain)
+            max_workers: Maximum number of worker processes
+        """
+        self.parallel_threshold = parallel_threshold
+        self.max_workers = max_workers
+    
     def diff(self, old_ir: ODLIR, new_ir: ODLIR) -> DiffResult:
         """
         Compare two ODL IRs and generate diff.
@@ -112,66 +232,109 @@ class ODLDiffEngine:
             new_version=new_ir.version
         )
         
-        # Compare objects
-        self._diff_objects(old_ir, new_ir, result)
-        
-        # Compare relationships
-        self._diff_relationships(old_ir, new_ir, result)
-        
-        # Compare metrics
-        self._diff_metrics(old_ir, new_ir, result)
-        
-        # Compare dimensions
-        self._diff_dimensions(old_ir, new_ir, result)
+        if (
+            self.parallel_threshold is not None
+            and _ir_size(old_ir) + _ir_size(new_ir) >= self.parallel_threshold
+        ):
+            self._diff_parallel(old_ir, new_ir, result)
+        else:
+            # Compare objects, relationships, metrics and dimensions
+            for section in _DIFF_SECTIONS:
+                getattr(self, section)(old_ir, new_ir, result)
         
         # Calculate summary
-        result.summary = {
-            "total_breaking": len(result.breaking_changes),
-            "total_non_breaking": len(result.non_breaking_changes),
-            "total_changes": len(result.breaking_changes) + len(result.non_breaking_changes)
-        }
+        result.summary = result.compute_summary()
         
         return result
     
-    def _diff_objects(self, old_ir: ODLIR, new_ir: ODLIR, result: DiffResult):
-        """Compare objects between two ODL IRs."""
-        old_objects = {obj.name: obj for obj in old_ir.objects}
-        new_objects = {obj.name: obj for obj in new_ir.objects}
+    def _diff_parallel(self, old_ir: ODLIR, new_ir: ODLIR, result: DiffResult):
+        """Run the independent diff sections in worker processes, merging in order."""
+        workers = max(1, min(self.max_workers, len(_DIFF_SECTIONS)))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_diff_worker,
+            initargs=(old_ir, new_ir)
+        ) as pool:
+            for breaking, non_breaking in pool.map(_diff_section_in_worker, _DIFF_SECTIONS):
+                result.breaking_changes.extend(breaking)
+                result.non_breaking_changes.extend(non_breaking)
+    
+    def _diff_collection(
+        self,
+        old_items: Dict[str, Any],
+        new_items: Dict[str, Any],
+        added_category: ChangeCategory,
+        removed_category: ChangeCategory,
+        common_fn: Callable[[Any, Any, str, DiffResult], None],
+        result: DiffResult,
+        prefix: str = ""
+    ):
+        """
+        Compare two name-keyed collections.
+        
+        Added names are non-breaking, removed names are breaking; elements on both
+        sides that are not equal are passed to `common_fn`.
         
-        # Find added objects (non-breaking)
-        for name, obj in new_objects.items():
-            if name not in old_objects:
+        Args:
+            old_items: Old elements keyed by name
+            new_items: New elements keyed by name
+            added_category: Category reported for added elements
+            removed_category: Category reported for removed elements
+            common_fn: Detail comparison, called as (old, new, element_name, result)
+            result: DiffResult to append changes to
+            prefix: Prefix for reported element names
+        """
+        # Single pass over all names: added, removed or common
+        for name in sorted(old_items.keys() | new_items.keys()):
+            old_item = old_items.get(name)
+            new_item = new_items.get(name)
+            element_name = prefix + name
+            
+            if old_item is None:
                 result.non_breaking_changes.append(Change(
-                    category=ChangeCategory.OBJECT_ADDED,
+                    category=added_category,
                     change_type=ChangeType.NON_BREAKING,
-                    element_name=name,
-                    new_value=obj.name
+                    element_name=element_name,
+                    new_value=name
                 ))
-        
-        # Find removed objects (breaking)
-        for name, obj in old_objects.items():
-            if name not in new_objects:
+                continue
+            
+            if new_item is None:
                 result.breaking_changes.append(Change(
-                    category=ChangeCategory.OBJECT_REMOVED,
+                    category=removed_category,
                     change_type=ChangeType.BREAKING,
-                    element_name=name,
+                    element_name=element_name,
                     old_value=name
                 ))
+                continue
+            
+            # Identical content cannot produce any change
+            if old_item == new_item:
+                continue
+            
+            common_fn(old_item, new_item, element_name, result)
+    
+    def _diff_objects(self, old_ir: ODLIR, new_ir: ODLIR, result: DiffResult):
+        """Compare objects between two ODL IRs."""
+        if _unchanged(old_ir, new_ir, "objects"):
+            return
         
-        # Compare existing objects
-        for name in set(old_objects.keys()) & set(new_objects.keys()):
-            old_obj = old_objects[name]
-            new_obj = new_objects[name]
-            self._diff_object_details(old_obj, new_obj, result)
+        self._diff_collection(
+            _by_name(old_ir.objects), _by_name(new_ir.objects),
+            ChangeCategory.OBJECT_ADDED, ChangeCategory.OBJECT_REMOVED,
+            self._diff_object_details, result
+        )
     
-    def _diff_object_details(self, old_obj: ObjectIR, new_obj: ObjectIR, result: DiffResult):
+    def _diff_object_details(
+        self, old_obj: ObjectIR, new_obj: ObjectIR, element_name: str, result: DiffResult
+    ):
         """Compare details of a single object."""
         # Description changes (non-breaking)
         if old_obj.description != new_obj.description:
             result.non_breaking_changes.append(Change(
                 category=ChangeCategory.OBJECT_DESCRIPTION_CHANGED,
                 change_type=ChangeType.NON_BREAKING,
-                element_name=old_obj.name,
+                element_name=element_name,
                 old_value=old_obj.description,
                 new_value=new_obj.description
             ))
@@ -185,277 +348,206 @@ class ODLDiffEngine:
             added = new_identifiers - old_identifiers
             
             if removed:
+                removed_list = sorted(removed)
                 result.breaking_changes.append(Change(
                     category=ChangeCategory.IDENTIFIER_REMOVED,
                     change_type=ChangeType.BREAKING,
-                    element_name=old_obj.name,
-                    old_value=list(removed),
-                    details={"removed_identifiers": list(removed)}
+                    element_name=element_name,
+                    old_value=removed_list,
+                    details={"removed_identifiers": removed_list}
                 ))
             
             if added:
                 # Adding identifiers is non-breaking if old ones still exist
                 if old_identifiers & new_identifiers:
+                    added_list = sorted(added)
                     result.non_breaking_changes.append(Change(
                         category=ChangeCategory.IDENTIFIER_ADDED,
                         change_type=ChangeType.NON_BREAKING,
-                        element_name=old_obj.name,
-                        new_value=list(added),
-                        details={"added_identifiers": list(added)}
+                        element_name=element_name,
+                        new_value=added_list,
+                        details={"added_identifiers": added_list}
                     ))
                 else:
                     # Complete replacement is breaking
                     result.breaking_changes.append(Change(
                         category=ChangeCategory.IDENTIFIER_CHANGED,
                         change_type=ChangeType.BREAKING,
-                        element_name=old_obj.name,
-                        old_value=list(old_identifiers),
-                        new_value=list(new_identifiers)
+                        element_name=element_name,
+                        old_value=sorted(old_identifiers),
+                        new_value=sorted(new_identifiers)
                     ))
         
         # Property changes
-        self._diff_properties(old_obj, new_obj, result)
+        self._diff_collection(
+            _by_name(old_obj.properties), _by_name(new_obj.properties),
+            ChangeCategory.PROPERTY_ADDED, ChangeCategory.PROPERTY_REMOVED,
+            self._diff_property_details, result,
+            prefix=element_name + "."
+        )
     
-    def _diff_properties(self, old_obj: ObjectIR, new_obj: ObjectIR, result: DiffResult):
-        """Compare properties of an object."""
-        old_props = {prop.name: prop for prop in old_obj.properties}
-        new_props = {prop.name: prop for prop in new_obj.properties}
-        
-        # Added properties (non-breaking)
-        for name, prop in new_props.items():
-            if name not in old_props:
-                result.non_breaking_changes.append(Change(
-                    category=ChangeCategory.PROPERTY_ADDED,
-                    change_type=ChangeType.NON_BREAKING,
-                    element_name=f"{old_obj.name}.{name}",
-                    new_value=prop.name
-                ))
-        
-        # Removed properties (breaking)
-        for name, prop in old_props.items():
-            if name not in new_props:
-                result.breaking_changes.append(Change(
-                    category=ChangeCategory.PROPERTY_REMOVED,
-                    change_type=ChangeType.BREAKING,
-                    element_name=f"{old_obj.name}.{name}",
-                    old_value=prop.name
-                ))
+    def _diff_property_details(
+        self, old_prop: PropertyIR, new_prop: PropertyIR, element_name: str, result: DiffResult
+    ):
+        """Compare details of a single property."""
+        # Type changes (breaking)
+        if old_prop.type != new_prop.type:
+            result.breaking_changes.append(Change(
+                category=ChangeCategory.PROPERTY_TYPE_CHANGED,
+                change_type=ChangeType.BREAKING,
+                element_name=element_name,
+                old_value=old_prop.type,
+                new_value=new_prop.type
+            ))
         
-        # Changed properties
-        for name in set(old_props.keys()) & set(new_props.keys()):
-            old_prop = old_props[name]
-            new_prop = new_props[name]
-            
-            # Type changes (breaking)
-            if old_prop.type != new_prop.type:
-                result.breaking_changes.append(Change(
-                    category=ChangeCategory.PROPERTY_TYPE_CHANGED,
-                    change_type=ChangeType.BREAKING,
-                    element_name=f"{old_obj.name}.{name}",
-                    old_value=old_prop.type,
-                    new_value=new_prop.type
-                ))
-            
-            # Description changes (non-breaking)
-            if old_prop.description != new_prop.description:
-                result.non_breaking_changes.append(Change(
-                    category=ChangeCategory.PROPERTY_DESCRIPTION_CHANGED,
-                    change_type=ChangeType.NON_BREAKING,
-                    element_name=f"{old_obj.name}.{name}",
-                    old_value=old_prop.description,
-                    new_value=new_prop.description
-                ))
+        # Description changes (non-breaking)
+        if old_prop.description != new_prop.description:
+            result.non_breaking_changes.append(Change(
+                category=ChangeCategory.PROPERTY_DESCRIPTION_CHANGED,
+                change_type=ChangeType.NON_BREAKING,
+                element_name=element_name,
+                old_value=old_prop.description,
+                new_value=new_prop.description
+            ))
     
     def _diff_relationships(self, old_ir: ODLIR, new_ir: ODLIR, result: DiffResult):
         """Compare relationships between two ODL IRs."""
-        old_rels = {rel.name: rel for rel in old_ir.relationships}
-        new_rels = {rel.name: rel for rel in new_ir.relationships}
+        if _unchanged(old_ir, new_ir, "relationships"):
+            return
         
-        # Added relationships (non-breaking)
-        for name, rel in new_rels.items():
-            if name not in old_rels:
-                result.non_breaking_changes.append(Change(
-                    category=ChangeCategory.RELATIONSHIP_ADDED,
-                    change_type=ChangeType.NON_BREAKING,
-                    element_name=name,
-                    new_value=name
-                ))
+        self._diff_collection(
+            _by_name(old_ir.relationships), _by_name(new_ir.relationships),
+            ChangeCategory.RELATIONSHIP_ADDED, ChangeCategory.RELATIONSHIP_REMOVED,
+            self._diff_relationship_details, result
+        )
+    
+    def _diff_relationship_details(
+        self, old_rel: RelationshipIR, new_rel: RelationshipIR, element_name: str, result: DiffResult
+    ):
+        """Compare details of a single relationship."""
+        # Join keys changes (breaking)
+        old_join_keys = set(old_rel.join_keys)
+        new_join_keys = set(new_rel.join_keys)
         
-        # Removed relationships (breaking)
-        for name, rel in old_rels.items():
-            if name not in new_rels:
-                result.breaking_changes.append(Change(
-                    category=ChangeCategory.RELATIONSHIP_REMOVED,
-                    change_type=ChangeType.BREAKING,
-                    element_name=name,
-                    old_value=name
-                ))
+        if old_join_keys != new_join_keys:
+            result.breaking_changes.append(Change(
+                category=ChangeCategory.RELATIONSHIP_JOIN_KEYS_CHANGED,
+                change_type=ChangeType.BREAKING,
+                element_name=element_name,
+                old_value=sorted(old_join_keys),
+                new_value=sorted(new_join_keys)
+            ))
         
-        # Compare existing relationships
-        for name in set(old_rels.keys()) & set(new_rels.keys()):
-            old_rel = old_rels[name]
-            new_rel = new_rels[name]
-            
-            # Join keys changes (breaking)
-            old_join_keys = set(old_rel.join_keys)
-            new_join_keys = set(new_rel.join_keys)
-            
-            if old_join_keys != new_join_keys:
-                result.breaking_changes.append(Change(
-                    category=ChangeCategory.RELATIONSHIP_JOIN_KEYS_CHANGED,
-                    change_type=ChangeType.BREAKING,
-                    element_name=name,
-                    old_value=list(old_join_keys),
-                    new_value=list(new_join_keys)
-                ))
-            
-            # Cardinality changes
-            cardinality_order = {
-                "many_to_many": 0,
-                "many_to_one": 1,
-                "one_to_many": 1,
-                "one_to_one": 2
-            }
-            
-            old_card = cardinality_order.get(old_rel.cardinality, 0)
-            new_card = cardinality_order.get(new_rel.cardinality, 0)
-            
-            if old_card < new_card:
-                # Tightened (breaking)
-                result.breaking_changes.append(Change(
-                    category=ChangeCategory.RELATIONSHIP_CARDINALITY_TIGHTENED,
-                    change_type=ChangeType.BREAKING,
-                    element_name=name,
-                    old_value=old_rel.cardinality,
-                    new_value=new_rel.cardinality
-                ))
-            elif old_card > new_card:
-                # Relaxed (non-breaking)
-                result.non_breaking_changes.append(Change(
-                    category=ChangeCategory.RELATIONSHIP_CARDINALITY_RELAXED,
-                    change_type=ChangeType.NON_BREAKING,
-                    element_name=name,
-                    old_value=old_rel.cardinality,
-                    new_value=new_rel.cardinality
-                ))
-            
-            # Description changes (non-breaking)
-            if old_rel.description != new_rel.description:
-                result.non_breaking_changes.append(Change(
-                    category=ChangeCategory.RELATIONSHIP_DESCRIPTION_CHANGED,
-                    change_type=ChangeType.NON_BREAKING,
-                    element_name=name,
-                    old_value=old_rel.description,
-                    new_value=new_rel.description
-                ))
+        # Cardinality changes
+        old_card = _CARDINALITY_ORDER.get(old_rel.cardinality, 0)
+        new_card = _CARDINALITY_ORDER.get(new_rel.cardinality, 0)
+        
+        if old_card < new_card:
+            # Tightened (breaking)
+            result.breaking_changes.append(Change(
+                category=ChangeCategory.RELATIONSHIP_CARDINALITY_TIGHTENED,
+                change_type=ChangeType.BREAKING,
+                element_name=element_name,
+                old_value=old_rel.cardinality,
+                new_value=new_rel.cardinality
+            ))
+        elif old_card > new_card:
+            # Relaxed (non-breaking)
+            result.non_breaking_changes.append(Change(
+                category=ChangeCategory.RELATIONSHIP_CARDINALITY_RELAXED,
+                change_type=ChangeType.NON_BREAKING,
+                element_name=element_name,
+                old_value=old_rel.cardinality,
+                new_value=new_rel.cardinality
+            ))
+        
+        # Description changes (non-breaking)
+        if old_rel.description != new_rel.description:
+            result.non_breaking_changes.append(Change(
+                category=ChangeCategory.RELATIONSHIP_DESCRIPTION_CHANGED,
+                change_type=ChangeType.NON_BREAKING,
+                element_name=element_name,
+                old_value=old_rel.description,
+                new_value=new_rel.description
+            ))
     
     def _diff_metrics(self, old_ir: ODLIR, new_ir: ODLIR, result: DiffResult):
         """Compare metrics between two ODL IRs."""
-        old_metrics = {m.name: m for m in old_ir.metrics}
-        new_metrics = {m.name: m for m in new_ir.metrics}
+        if _unchanged(old_ir, new_ir, "metrics"):
+            return
         
-        # Added metrics (non-breaking)
-        for name, metric in new_metrics.items():
-            if name not in old_metrics:
-                result.non_breaking_changes.append(Change(
-                    category=ChangeCategory.METRIC_ADDED,
-                    change_type=ChangeType.NON_BREAKING,
-                    element_name=name,
-                    new_value=name
-                ))
+        self._diff_collection(
+            _by_name(old_ir.metrics), _by_name(new_ir.metrics),
+            ChangeCategory.METRIC_ADDED, ChangeCategory.METRIC_REMOVED,
+            self._diff_metric_details, result
+        )
+    
+    def _diff_metric_details(
+        self, old_metric: MetricIR, new_metric: MetricIR, element_name: str, result: DiffResult
+    ):
+        """Compare details of a single metric."""
+        # Expression changes (breaking)
+        if old_metric.expression != new_metric.expression:
+            result.breaking_changes.append(Change(
+                category=ChangeCategory.METRIC_EXPRESSION_CHANGED,
+                change_type=ChangeType.BREAKING,
+                element_name=element_name,
+                old_value=old_metric.expression,
+                new_value=new_metric.expression
+            ))
         
-        # Removed metrics (breaking)
-        for name, metric in old_metrics.items():
-            if name not in new_metrics:
-                result.breaking_changes.append(Change(
-                    category=ChangeCategory.METRIC_REMOVED,
-                    change_type=ChangeType.BREAKING,
-                    element_name=name,
-                    old_value=name
-                ))
+        # Grain changes (breaking)
+        if set(old_metric.grain) != set(new_metric.grain):
+            result.breaking_changes.append(Change(
+                category=ChangeCategory.METRIC_GRAIN_CHANGED,
+                change_type=ChangeType.BREAKING,
+                element_name=element_name,
+                old_value=old_metric.grain,
+                new_value=new_metric.grain
+            ))
         
-        # Compare existing metrics
-        for name in set(old_metrics.keys()) & set(new_metrics.keys()):
-            old_metric = old_metrics[name]
-            new_metric = new_metrics[name]
-            
-            # Expression changes (breaking)
-            if old_metric.expression != new_metric.expression:
-                result.breaking_changes.append(Change(
-                    category=ChangeCategory.METRIC_EXPRESSION_CHANGED,
-                    change_type=ChangeType.BREAKING,
-                    element_name=name,
-                    old_value=old_metric.expression,
-                    new_value=new_metric.expression
-                ))
-            
-            # Grain changes (breaking)
-            if set(old_metric.grain) != set(new_metric.grain):
-                result.breaking_changes.append(Change(
-                    category=ChangeCategory.METRIC_GRAIN_CHANGED,
-                    change_type=ChangeType.BREAKING,
-                    element_name=name,
-                    old_value=old_metric.grain,
-                    new_value=new_metric.grain
-                ))
-            
-            # Description changes (non-breaking)
-            if old_metric.description != new_metric.description:
-                result.non_breaking_changes.append(Change(
-                    category=ChangeCategory.METRIC_DESCRIPTION_CHANGED,
-                    change_type=ChangeType.NON_BREAKING,
-                    element_name=name,
-                    old_value=old_metric.description,
-                    new_value=new_metric.description
-                ))
+        # Description changes (non-breaking)
+        if old_metric.description != new_metric.description:
+            result.non_breaking_changes.append(Change(
+                category=ChangeCategory.METRIC_DESCRIPTION_CHANGED,
+                change_type=ChangeType.NON_BREAKING,
+                element_name=element_name,
+                old_value=old_metric.description,
+                new_value=new_metric.description
+            ))
     
     def _diff_dimensions(self, old_ir: ODLIR, new_ir: ODLIR, result: DiffResult):
         """Compare dimensions between two ODL IRs."""
-        old_dims = {d.name: d for d in old_ir.dimensions}
-        new_dims = {d.name: d for d in new_ir.dimensions}
+        if _unchanged(old_ir, new_ir, "dimensions"):
+            return
         
-        # Added dimensions (non-breaking)
-        for name, dim in new_dims.items():
-            if name not in old_dims:
-                result.non_breaking_changes.append(Change(
-                    category=ChangeCategory.DIMENSION_ADDED,
-                    change_type=ChangeType.NON_BREAKING,
-                    element_name=name,
-                    new_value=name
-                ))
-        
-        # Removed dimensions (breaking)
-        for name, dim in old_dims.items():
-            if name not in new_dims:
-                result.breaking_changes.append(Change(
-                    category=ChangeCategory.DIMENSION_REMOVED,
-                    change_type=ChangeType.BREAKING,
-                    element_name=name,
-                    old_value=name
-                ))
+        self._diff_collection(
+            _by_name(old_ir.dimensions), _by_name(new_ir.dimensions),
+            ChangeCategory.DIMENSION_ADDED, ChangeCategory.DIMENSION_REMOVED,
+            self._diff_dimension_details, result
+        )
+    
+    def _diff_dimension_details(
+        self, old_dim: DimensionIR, new_dim: DimensionIR, element_name: str, result: DiffResult
+    ):
+        """Compare details of a single dimension."""
+        # Source property changes (breaking)
+        if old_dim.source_property != new_dim.source_property:
+            result.breaking_changes.append(Change(
+                category=ChangeCategory.DIMENSION_REMOVED,  # Treat as removal + addition
+                change_type=ChangeType.BREAKING,
+                element_name=element_name,
+                old_value=old_dim.source_property,
+                new_value=new_dim.source_property,
+                details={"source_property_changed": True}
+            ))
         
-        # Compare existing dimensions (only description changes are non-breaking)
-        for name in set(old_dims.keys()) & set(new_dims.keys()):
-            old_dim = old_dims[name]
-            new_dim = new_dims[name]
-            
-            # Source property changes (breaking)
-            if old_dim.source_property != new_dim.source_property:
-                result.breaking_changes.append(Change(
-                    category=ChangeCategory.DIMENSION_REMOVED,  # Treat as removal + addition
-                    change_type=ChangeType.BREAKING,
-                    element_name=name,
-                    old_value=old_dim.source_property,
-                    new_value=new_dim.source_property,
-                    details={"source_property_changed": True}
-                ))
-            
-            # Description changes (non-breaking)
-            if old_dim.description != new_dim.description:
-                result.non_breaking_changes.append(Change(
-                    category=ChangeCategory.DIMENSION_DESCRIPTION_CHANGED,
-                    change_type=ChangeType.NON_BREAKING,
-                    element_name=name,
-                    old_value=old_dim.description,
-                    new_value=new_dim.description
-                ))
+        # Description changes (non-breaking)
+        if old_dim.description != new_dim.description:
+            result.non_breaking_changes.append(Change(
+                category=ChangeCategory.DIMENSION_DESCRIPTION_CHANGED,
+                change_type=ChangeType.NON_BREAKING,
+                element_name=element_name,
+                old_value=old_dim.description,
+                new_value=new_dim.description
+            ))
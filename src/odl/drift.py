@@ -1,15 +1,101 @@
 """ODL drift detection - mapping drift and semantic view drift."""
 
-from typing import Dict, List, Any, Optional, Set
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterator, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import yaml
 from pathlib import Path
 
+try:
+    from loguru import logger
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+# libyaml-backed loader is ~10x faster; PyYAML wheels bundle libyaml on common platforms
+try:
+    from yaml import CSafeLoader as _SafeLoader
+    YAML_C_LOADER = True
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+    YAML_C_LOADER = False
+    logger.warning("PyYAML built without libyaml; semantic view drift checks use the slower pure-Python loader")
+
 from .ir import ODLIR, ObjectIR
 from ..snowflake.provider import SnowflakeProvider, TableSchema, SemanticViewYAML
 
 
+# ODL type -> Snowflake type roots (type name without precision/length) it is compatible with
+_TYPE_ROOTS: Dict[str, FrozenSet[str]] = {
+    "string": frozenset({"VARCHAR", "TEXT", "STRING"}),
+    "integer": frozenset({"INTEGER", "INT", "BIGINT"}),
+    "number": frozenset({"NUMBER", "DECIMAL", "FLOAT", "DOUBLE"}),
+    "decimal": frozenset({"DECIMAL", "NUMBER"}),
+    "boolean": frozenset({"BOOLEAN", "BOOL"}),
+    "date": frozenset({"DATE"}),
+    "timestamp": frozenset({"TIMESTAMP", "TIMESTAMP_NTZ", "TIMESTAMP_LTZ"}),
+    "time": frozenset({"TIME"})
+}
+
+# Inverse of _TYPE_ROOTS: Snowflake type root -> compatible ODL types
+_ODL_TYPES_BY_ROOT: Dict[str, FrozenSet[str]] = {
+    root: frozenset(odl_type for odl_type, roots in _TYPE_ROOTS.items() if root in roots)
+    for root in frozenset().union(*_TYPE_ROOTS.values())
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _matching_odl_types(snowflake_type: str) -> FrozenSet[str]:
+    """ODL types compatible with a Snowflake column type."""
+    snowflake_upper = snowflake_type.upper()
+    odl_types = _ODL_TYPES_BY_ROOT.get(snowflake_upper.split("(", 1)[0].strip())
+    if odl_types is not None:
+        return odl_types
+    # Unlisted spellings (e.g. "DOUBLE PRECISION", "TIMESTAMP_TZ") match by prefix
+    return frozenset(
+        odl_type for odl_type, roots in _TYPE_ROOTS.items()
+        if snowflake_upper.startswith(tuple(roots))
+    )
+
+
+def _canon_key(key: Any) -> Any:
+    """Hashable, order-independent form of a YAML join key."""
+    if isinstance(key, dict):
+        return tuple(sorted(key.items()))
+    if isinstance(key, list):
+        return tuple(key)
+    return key
+
+
+def _yaml_digest(content: str) -> bytes:
+    """Digest of YAML text with trailing whitespace removed from every line."""
+    normalized = "\n".join(line.rstrip() for line in content.strip().splitlines())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+def _parse_yaml(content: str, view: Optional[SemanticViewYAML]) -> Any:
+    """Parse YAML, memoizing the document on the view that holds it (if any)."""
+    if view is not None and view.parsed is not None:
+        return view.parsed
+    data = yaml.load(content, Loader=_SafeLoader)
+    if view is not None:
+        view.parsed = data
+    return data
+
+
+def _compile_cache_key(odl_ir: ODLIR, options: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Key identifying compiler output for an IR and compiler options."""
+    return (odl_ir.content_key(), json.dumps(options, sort_keys=True, default=str))
+
+
 class DriftType(Enum):
     """Type of drift detected."""
     MAPPING_DRIFT = "mapping_drift"
@@ -26,7 +112,7 @@ class DriftEventType(Enum):
     MANUAL_EDIT_DETECTED = "manual_edit_detected"
 
 
-@dataclass
+@dataclass(slots=True)
 class DriftEvent:
     """A single drift event."""
     event_type: DriftEventType
@@ -46,7 +132,7 @@ class DriftEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DriftDetectionResult:
     """Result of drift detection."""
     ontology_id: int
@@ -61,17 +147,159 @@ class DriftDetectionResult:
         }
 
 
+def _iter_column_drifts(obj: ObjectIR, table_schema: TableSchema) -> Iterator[DriftEvent]:
+    """Yield drift events from comparing ODL object properties with table columns."""
+    make = functools.partial(DriftEvent, drift_type=DriftType.MAPPING_DRIFT, element_name=obj.name)
+    
+    # Get expected columns from ODL
+    expected_columns = {prop.name: prop for prop in obj.properties}
+    
+    # Get actual columns from Snowflake
+    actual_columns = {col["name"]: col for col in table_schema.columns}
+    
+    missing_names = sorted(expected_columns.keys() - actual_columns.keys())
+    added_names = sorted(actual_columns.keys() - expected_columns.keys())
+    
+    # Find missing columns (in ODL but not in Snowflake)
+    missing_pairs = [(prop_name, expected_columns[prop_name]) for prop_name in missing_names]
+    for prop_name, prop in missing_pairs:
+        yield make(
+            event_type=DriftEventType.COLUMN_MISSING,
+            message=f"Column '{prop_name}' missing in table '{table_schema.table}'",
+            details={
+                "object_name": obj.name,
+                "table": table_schema.table,
+                "missing_column": prop_name,
+                "column_type": prop.type
+            }
+        )
+    
+    # Find added columns (in Snowflake but not in ODL)
+    added_pairs = [(col_name, actual_columns[col_name]) for col_name in added_names]
+    for col_name, col_info in added_pairs:
+        yield make(
+            event_type=DriftEventType.COLUMN_ADDED,
+            message=f"Column '{col_name}' added in table '{table_schema.table}' (not in ODL)",
+            details={
+                "object_name": obj.name,
+                "table": table_schema.table,
+                "added_column": col_name,
+                "column_type": col_info.get("type", "unknown")
+            }
+        )
+    
+    # Renames need a missing column and an unmatched added column
+    if not missing_pairs or not added_pairs:
+        return
+    
+    # Check for renamed columns (heuristic: similar names or type matches)
+    # This is a simplified check - in reality, you might use more sophisticated matching
+    # Bucket added columns by the ODL types they match so each lookup is O(1)
+    added_by_type: Dict[str, List[str]] = defaultdict(list)
+    for col_name, col_info in added_pairs:
+        for odl_type in _matching_odl_types(col_info.get("type", "")):
+            added_by_type[odl_type].append(col_name)
+    
+    for prop_name, prop in missing_pairs:
+        # Look for potential rename candidates
+        candidates = added_by_type.get(prop.type.lower(), [])
+        
+        if len(candidates) == 1:
+            # Likely a rename
+            yield make(
+                event_type=DriftEventType.COLUMN_RENAMED,
+                message=f"Column '{prop_name}' possibly renamed to '{candidates[0]}' in table '{table_schema.table}'",
+                details={
+                    "object_name": obj.name,
+                    "table": table_schema.table,
+                    "old_column": prop_name,
+                    "new_column": candidates[0],
+                    "column_type": prop.type
+                }
+            )
+
+
+def _object_drift(obj: ObjectIR, table_schema: TableSchema) -> List[DriftEvent]:
+    """Column drift events for one object; module-level so process pools can pickle it."""
+    return list(_iter_column_drifts(obj, table_schema))
+
+
 class DriftDetector:
     """Detects drift between ODL and Snowflake."""
     
-    def __init__(self, provider: SnowflakeProvider):
+    def __init__(
+        self,
+        provider: SnowflakeProvider,
+        bulk: bool = True,
+        parallelism: int = 16,
+        cache_ttl: float = 300,
+        cache_max_entries: int = 2048,
+        negative_cache_ttl: float = 5,
+        parallel_threshold: Optional[int] = None,
+        max_workers: int = 4
+    ):
         """
         Initialize drift detector.
         
         Args:
             provider: Snowflake provider for schema information
+            bulk: Fetch all table schemas with one bulk provider call
+            parallelism: Maximum concurrent per-table lookups when not using
+                (or falling back from) the bulk call; 1 keeps them serial
+            cache_ttl: Seconds provider lookups are reused across detections (0 disables)
+            cache_max_entries: Maximum number of cached provider lookups
+            negative_cache_ttl: Seconds a missing table or view is remembered, kept
+                short so newly created objects are picked up quickly (0 disables)
+            parallel_threshold: Compare columns in a process pool once this many
+                mapped tables are found (None, the default, keeps it serial; only
+                worth it for very large schemas, since pool startup dominates)
+            max_workers: Maximum worker processes for the column comparison pool
         """
         self.provider = provider
+        self.bulk = bulk
+        self.parallelism = parallelism
+        self.cache_ttl = cache_ttl
+        self.cache_max_entries = cache_max_entries
+        self.negative_cache_ttl = negative_cache_ttl
+        self.parallel_threshold = parallel_threshold
+        self.max_workers = max_workers
+        # (kind, database, schema, name) -> (expires_at, value); None values record misses
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # _compile_cache_key(...) -> (digest, SemanticViewYAML) of compiler output;
+        # the view memoizes its parsed document
+        self._generated_yaml: OrderedDict = OrderedDict()
+        self._compiler = None
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached provider lookups, e.g. after DDL changes."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _cache_get(self, key: Tuple[str, str, str, str]) -> Tuple[bool, Any]:
+        """Return (hit, value) for a cached provider lookup."""
+        if self.cache_ttl <= 0:
+            return False, None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._cache[key]
+                return False, None
+            self._cache.move_to_end(key)
+            return True, entry[1]
+    
+    def _cache_put(self, key: Tuple[str, str, str, str], value: Any) -> None:
+        """Store a provider lookup result; misses (None) expire after the shorter negative TTL."""
+        ttl = self.cache_ttl if value is not None else min(self.cache_ttl, self.negative_cache_ttl)
+        if ttl <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
     
     def detect_mapping_drift(self, odl_ir: ODLIR, ontology_id: int) -> DriftDetectionResult:
         """
@@ -84,29 +312,69 @@ class DriftDetector:
         Returns:
             DriftDetectionResult with mapping drift events
         """
-        result = DriftDetectionResult(ontology_id=ontology_id)
+        return DriftDetectionResult(
+            ontology_id=ontology_id,
+            drift_events=list(self.iter_mapping_drift(odl_ir))
+        )
+    
+    def iter_mapping_drift(self, odl_ir: ODLIR) -> Iterator[DriftEvent]:
+        """
+        Yield mapping drift events as they are found, for streaming consumers.
         
+        Args:
+            odl_ir: ODL IR to check
+        """
         if not odl_ir.snowflake:
-            return result
+            return
         
         database = odl_ir.snowflake.database
         schema = odl_ir.snowflake.schema
         
-        # Check each object's table mapping
-        for obj in odl_ir.objects:
-            # Get table name
-            table_name = (
-                obj.snowflake_table or
-                odl_ir.snowflake.table_mappings.get(obj.name) or
-                obj.name.lower()
-            )
-            
-            # Get actual table schema from Snowflake
-            table_schema = self.provider.get_table_schema(database, schema, table_name)
-            
-            if not table_schema:
+        # Resolve every object's table first so schemas can be fetched in one go
+        table_names = [
+            obj.snowflake_table or
+            odl_ir.snowflake.table_mappings.get(obj.name) or
+            obj.name.lower()
+            for obj in odl_ir.objects
+        ]
+        table_schemas = self._fetch_table_schemas(database, schema, table_names)
+        
+        found = [
+            (obj, table_schemas[table_name])
+            for obj, table_name in zip(odl_ir.objects, table_names)
+            if table_name in table_schemas
+        ]
+        if self.parallel_threshold is not None and found and len(found) >= self.parallel_threshold:
+            # Column comparison is CPU-bound, so spread objects across processes
+            workers = max(1, min(self.max_workers, os.cpu_count() or 1, len(found)))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                column_drifts = executor.map(
+                    _object_drift,
+                    [obj for obj, _ in found],
+                    [table_schema for _, table_schema in found],
+                    chunksize=max(1, len(found) // (4 * workers))
+                )
+                yield from self._iter_table_drifts(odl_ir, table_names, table_schemas, column_drifts)
+        else:
+            column_drifts = (_object_drift(obj, table_schema) for obj, table_schema in found)
+            yield from self._iter_table_drifts(odl_ir, table_names, table_schemas, column_drifts)
+    
+    def _iter_table_drifts(
+        self,
+        odl_ir: ODLIR,
+        table_names: List[str],
+        table_schemas: Dict[str, TableSchema],
+        column_drifts: Iterator[List[DriftEvent]]
+    ) -> Iterator[DriftEvent]:
+        """Yield drift events in object order, interleaving missing tables with column drift."""
+        database = odl_ir.snowflake.database
+        schema = odl_ir.snowflake.schema
+        column_drifts = iter(column_drifts)
+        
+        for obj, table_name in zip(odl_ir.objects, table_names):
+            if table_name not in table_schemas:
                 # Table doesn't exist
-                result.drift_events.append(DriftEvent(
+                yield DriftEvent(
                     event_type=DriftEventType.TABLE_MISSING,
                     drift_type=DriftType.MAPPING_DRIFT,
                     element_name=obj.name,
@@ -117,99 +385,65 @@ class DriftDetector:
                         "schema": schema,
                         "object_name": obj.name
                     }
-                ))
+                )
                 continue
             
             # Compare columns
-            self._compare_columns(obj, table_schema, result)
-        
-        return result
+            yield from next(column_drifts)
     
-    def _compare_columns(self, obj: ObjectIR, table_schema: TableSchema, result: DriftDetectionResult):
-        """Compare ODL object properties with table columns."""
-        # Get expected columns from ODL
-        expected_columns = {prop.name: prop for prop in obj.properties}
+    def _fetch_table_schemas(self, database: str, schema: str, table_names: List[str]) -> Dict[str, TableSchema]:
+        """Fetch schemas for all tables, falling back to per-table lookups if the bulk query fails."""
+        schemas: Dict[str, TableSchema] = {}
+        pending = []
+        for table_name in dict.fromkeys(table_names):
+            hit, table_schema = self._cache_get(("table", database, schema, table_name))
+            if not hit:
+                pending.append(table_name)
+            elif table_schema:
+                schemas[table_name] = table_schema
         
-        # Get actual columns from Snowflake
-        actual_columns = {col["name"]: col for col in table_schema.columns}
+        if pending:
+            fetched = self._fetch_uncached_table_schemas(database, schema, pending)
+            for table_name in pending:
+                table_schema = fetched.get(table_name)
+                self._cache_put(("table", database, schema, table_name), table_schema)
+                if table_schema:
+                    schemas[table_name] = table_schema
         
-        # Find missing columns (in ODL but not in Snowflake)
-        for prop_name, prop in expected_columns.items():
-            if prop_name not in actual_columns:
-                result.drift_events.append(DriftEvent(
-                    event_type=DriftEventType.COLUMN_MISSING,
-                    drift_type=DriftType.MAPPING_DRIFT,
-                    element_name=obj.name,
-                    message=f"Column '{prop_name}' missing in table '{table_schema.table}'",
-                    details={
-                        "object_name": obj.name,
-                        "table": table_schema.table,
-                        "missing_column": prop_name,
-                        "column_type": prop.type
-                    }
-                ))
+        return schemas
+    
+    def _fetch_uncached_table_schemas(
+        self, database: str, schema: str, table_names: List[str]
+    ) -> Dict[str, TableSchema]:
+        """Fetch table schemas from the provider, in bulk or per table."""
+        if self.bulk:
+            try:
+                return self.provider.get_table_schemas_bulk(database, schema, table_names)
+            except NotImplementedError:
+                pass
+            except Exception as e:
+                logger.warning(f"Bulk schema fetch failed, falling back to per-table lookups: {e}")
         
-        # Find added columns (in Snowflake but not in ODL)
-        for col_name, col_info in actual_columns.items():
-            if col_name not in expected_columns:
-                result.drift_events.append(DriftEvent(
-                    event_type=DriftEventType.COLUMN_ADDED,
-                    drift_type=DriftType.MAPPING_DRIFT,
-                    element_name=obj.name,
-                    message=f"Column '{col_name}' added in table '{table_schema.table}' (not in ODL)",
-                    details={
-                        "object_name": obj.name,
-                        "table": table_schema.table,
-                        "added_column": col_name,
-                        "column_type": col_info.get("type", "unknown")
-                    }
-                ))
+        def fetch(table_name: str) -> Optional[TableSchema]:
+            return self.provider.get_table_schema(database, schema, table_name)
         
-        # Check for renamed columns (heuristic: similar names or type matches)
-        # This is a simplified check - in reality, you might use more sophisticated matching
-        for prop_name, prop in expected_columns.items():
-            if prop_name not in actual_columns:
-                # Look for potential rename candidates
-                candidates = []
-                for col_name, col_info in actual_columns.items():
-                    if col_name not in expected_columns:
-                        # Check if types match (simplified)
-                        if self._types_match(prop.type, col_info.get("type", "")):
-                            candidates.append(col_name)
-                
-                if len(candidates) == 1:
-                    # Likely a rename
-                    result.drift_events.append(DriftEvent(
-                        event_type=DriftEventType.COLUMN_RENAMED,
-                        drift_type=DriftType.MAPPING_DRIFT,
-                        element_name=obj.name,
-                        message=f"Column '{prop_name}' possibly renamed to '{candidates[0]}' in table '{table_schema.table}'",
-                        details={
-                            "object_name": obj.name,
-                            "table": table_schema.table,
-                            "old_column": prop_name,
-                            "new_column": candidates[0],
-                            "column_type": prop.type
-                        }
-                    ))
+        workers = min(self.parallelism, len(table_names))
+        if workers > 1:
+            # Lookups are I/O-bound round-trips, so threads overlap them
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = list(executor.map(fetch, table_names))
+        else:
+            fetched = [fetch(table_name) for table_name in table_names]
+        
+        return {
+            table_name: table_schema
+            for table_name, table_schema in zip(table_names, fetched)
+            if table_schema
+        }
     
     def _types_match(self, odl_type: str, snowflake_type: str) -> bool:
         """Check if ODL type matches Snowflake type (simplified)."""
-        type_mapping = {
-            "string": ["VARCHAR", "TEXT", "STRING"],
-            "integer": ["INTEGER", "INT", "BIGINT"],
-            "number": ["NUMBER", "DECIMAL", "FLOAT", "DOUBLE"],
-            "decimal": ["DECIMAL", "NUMBER"],
-            "boolean": ["BOOLEAN", "BOOL"],
-            "date": ["DATE"],
-            "timestamp": ["TIMESTAMP", "TIMESTAMP_NTZ", "TIMESTAMP_LTZ"],
-            "time": ["TIME"]
-        }
-        
-        snowflake_upper = snowflake_type.upper()
-        odl_mappings = type_mapping.get(odl_type.lower(), [])
-        
-        return any(snowflake_upper.startswith(m) for m in odl_mappings)
+        return odl_type.lower() in _matching_odl_types(snowflake_type)
     
     def detect_semantic_view_drift(
         self,
@@ -239,17 +473,126 @@ class DriftDetector:
         schema = odl_ir.snowflake.schema
         
         # Get YAML from existing semantic view
-        semantic_view = self.provider.get_semantic_view_yaml(database, schema, view_name)
+        cache_key = ("view", database, schema, view_name)
+        hit, semantic_view = self._cache_get(cache_key)
+        if not hit:
+            semantic_view = self.provider.get_semantic_view_yaml(database, schema, view_name)
+            self._cache_put(cache_key, semantic_view)
         
-        if not semantic_view:
-            # View doesn't exist - not a drift, just not deployed
-            return result
+        if semantic_view:
+            self._check_semantic_view(odl_ir, view_name, semantic_view, compiler_options, result)
+        # Otherwise the view doesn't exist - not a drift, just not deployed
+        
+        return result
+    
+    def check_semantic_view(
+        self,
+        odl_ir: ODLIR,
+        ontology_id: int,
+        semantic_view: SemanticViewYAML,
+        compiler_options: Optional[Dict[str, Any]] = None
+    ) -> DriftDetectionResult:
+        """
+        Detect semantic view drift against an already-fetched semantic view.
+        
+        Reusing the same SemanticViewYAML across calls (e.g. against many ODL
+        snapshots) parses its YAML only once.
+        
+        Args:
+            odl_ir: ODL IR to check
+            ontology_id: Ontology ID
+            semantic_view: Deployed semantic view
+            compiler_options: Options for compiler
+            
+        Returns:
+            DriftDetectionResult with semantic view drift events
+        """
+        result = DriftDetectionResult(ontology_id=ontology_id)
+        
+        if odl_ir.snowflake:
+            self._check_semantic_view(odl_ir, semantic_view.view_name, semantic_view, compiler_options, result)
+        
+        return result
+    
+    def detect_semantic_view_drift_bulk(
+        self,
+        odl_ir: ODLIR,
+        ontology_id: int,
+        view_names: List[str],
+        compiler_options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, DriftDetectionResult]:
+        """
+        Detect semantic view drift for several views, fetching their YAML in one bulk call.
+        
+        Args:
+            odl_ir: ODL IR to check
+            ontology_id: Ontology ID
+            view_names: Semantic view names
+            compiler_options: Options for compiler, applied to every view with its own view_name
+            
+        Returns:
+            Dict of view name -> DriftDetectionResult
+        """
+        results = {view_name: DriftDetectionResult(ontology_id=ontology_id) for view_name in view_names}
+        
+        if not odl_ir.snowflake:
+            return results
+        
+        database = odl_ir.snowflake.database
+        schema = odl_ir.snowflake.schema
+        
+        semantic_views: Dict[str, Optional[SemanticViewYAML]] = {}
+        pending = []
+        for view_name in results:
+            hit, semantic_view = self._cache_get(("view", database, schema, view_name))
+            if hit:
+                semantic_views[view_name] = semantic_view
+            else:
+                pending.append(view_name)
+        
+        if pending:
+            try:
+                fetched = self.provider.get_semantic_view_yamls_bulk(database, schema, pending)
+            except Exception as e:
+                logger.warning(f"Bulk semantic view fetch failed, falling back to per-view lookups: {e}")
+                fetched = {}
+                for view_name in pending:
+                    semantic_view = self.provider.get_semantic_view_yaml(database, schema, view_name)
+                    if semantic_view:
+                        fetched[view_name] = semantic_view
+            for view_name in pending:
+                semantic_views[view_name] = fetched.get(view_name)
+                self._cache_put(("view", database, schema, view_name), semantic_views[view_name])
+        
+        for view_name, result in results.items():
+            semantic_view = semantic_views[view_name]
+            if semantic_view:
+                options = dict(compiler_options, view_name=view_name) if compiler_options else None
+                self._check_semantic_view(odl_ir, view_name, semantic_view, options, result)
+        
+        return results
+    
+    def _get_compiler(self):
+        """Get the Snowflake compiler, created on first use and reused afterwards."""
+        if self._compiler is None:
+            from ..snowflake.snowflake_compiler import SnowflakeCompiler
+            self._compiler = SnowflakeCompiler()
+        return self._compiler
+    
+    def _check_semantic_view(
+        self,
+        odl_ir: ODLIR,
+        view_name: str,
+        semantic_view: SemanticViewYAML,
+        compiler_options: Optional[Dict[str, Any]],
+        result: DriftDetectionResult
+    ):
+        """Compare a deployed semantic view with the YAML compiled from ODL."""
+        database = odl_ir.snowflake.database
+        schema = odl_ir.snowflake.schema
         
         # Generate YAML from ODL using compiler
         try:
-            from ..snowflake.snowflake_compiler import SnowflakeCompiler
-            
-            compiler = SnowflakeCompiler()
             options = compiler_options or {
                 "version_id": f"drift-check-{odl_ir.version}",
                 "view_name": view_name,
@@ -257,25 +600,46 @@ class DriftDetector:
                 "schema": schema
             }
             
-            bundle = compiler.compile(odl_ir, options)
-            generated_yaml_file = bundle.get_file("semantic_model.yaml")
+            # Compiled YAML depends only on the IR and options, so reuse it across checks
+            generated_key = _compile_cache_key(odl_ir, options)
+            with self._cache_lock:
+                generated = self._generated_yaml.get(generated_key)
             
-            if not generated_yaml_file:
-                result.drift_events.append(DriftEvent(
-                    event_type=DriftEventType.YAML_DIVERGENCE,
-                    drift_type=DriftType.SEMANTIC_VIEW_DRIFT,
-                    element_name=view_name,
-                    message="Failed to generate YAML from ODL",
-                    details={"view_name": view_name}
-                ))
-                return result
+            if generated is None:
+                bundle = self._get_compiler().compile(odl_ir, options)
+                generated_yaml_file = bundle.get_file("semantic_model.yaml")
+                
+                if not generated_yaml_file:
+                    result.drift_events.append(DriftEvent(
+                        event_type=DriftEventType.YAML_DIVERGENCE,
+                        drift_type=DriftType.SEMANTIC_VIEW_DRIFT,
+                        element_name=view_name,
+                        message="Failed to generate YAML from ODL",
+                        details={"view_name": view_name}
+                    ))
+                    return
+                
+                generated = (
+                    _yaml_digest(generated_yaml_file.content),
+                    SemanticViewYAML(view_name=view_name, yaml_content=generated_yaml_file.content)
+                )
+                with self._cache_lock:
+                    self._generated_yaml[generated_key] = generated
+                    while len(self._generated_yaml) > self.cache_max_entries:
+                        self._generated_yaml.popitem(last=False)
+            
+            # Identical content (modulo trailing whitespace) cannot drift
+            if generated[0] == _yaml_digest(semantic_view.yaml_content):
+                return
             
             # Compare YAMLs
             self._compare_yamls(
                 semantic_view.yaml_content,
-                generated_yaml_file.content,
+                generated[1].yaml_content,
                 view_name,
-                result
+                result,
+                semantic_view=semantic_view,
+                generated_view=generated[1]
             )
         except Exception as e:
             result.drift_events.append(DriftEvent(
@@ -285,14 +649,33 @@ class DriftDetector:
                 message=f"Error comparing YAMLs: {str(e)}",
                 details={"view_name": view_name, "error": str(e)}
             ))
-        
-        return result
     
-    def _compare_yamls(self, actual_yaml: str, expected_yaml: str, view_name: str, result: DriftDetectionResult):
-        """Compare two YAML strings and detect differences."""
+    def _compare_yamls(
+        self,
+        actual_yaml: str,
+        expected_yaml: str,
+        view_name: str,
+        result: DriftDetectionResult,
+        semantic_view: Optional[SemanticViewYAML] = None,
+        generated_view: Optional[SemanticViewYAML] = None
+    ):
+        """
+        Compare two YAML strings and detect differences.
+        
+        Args:
+            actual_yaml: Deployed YAML
+            expected_yaml: Compiler-generated YAML
+            view_name: Semantic view name
+            result: Result to append drift events to
+            semantic_view: Deployed view holding actual_yaml; its parsed document is reused and memoized
+            generated_view: Cached compiler output holding expected_yaml, memoized the same way
+        """
+        if actual_yaml == expected_yaml:
+            return
+        
         try:
-            actual_data = yaml.safe_load(actual_yaml)
-            expected_data = yaml.safe_load(expected_yaml)
+            actual_data = _parse_yaml(actual_yaml, semantic_view)
+            expected_data = _parse_yaml(expected_yaml, generated_view)
         except yaml.YAMLError as e:
             result.drift_events.append(DriftEvent(
                 event_type=DriftEventType.YAML_DIVERGENCE,
@@ -303,6 +686,10 @@ class DriftDetector:
             ))
             return
         
+        # Formatting-only differences parse to equal documents
+        if actual_data == expected_data:
+            return
+        
         # Compare semantic model structures
         actual_sm = actual_data.get("semantic_model", {})
         expected_sm = expected_data.get("semantic_model", {})
@@ -333,92 +720,87 @@ class DriftDetector:
     
     def _compare_logical_tables(self, actual_sm: Dict, expected_sm: Dict, view_name: str, result: DriftDetectionResult):
         """Compare logical tables between actual and expected YAML."""
+        make = functools.partial(DriftEvent, drift_type=DriftType.SEMANTIC_VIEW_DRIFT, element_name=view_name)
+        
         actual_tables = {t["name"]: t for t in actual_sm.get("logical_tables", [])}
         expected_tables = {t["name"]: t for t in expected_sm.get("logical_tables", [])}
         
         # Find missing tables
-        for name, table in expected_tables.items():
-            if name not in actual_tables:
-                result.drift_events.append(DriftEvent(
-                    event_type=DriftEventType.YAML_DIVERGENCE,
-                    drift_type=DriftType.SEMANTIC_VIEW_DRIFT,
-                    element_name=view_name,
-                    message=f"Logical table '{name}' missing in deployed view",
-                    details={"table_name": name, "view_name": view_name}
-                ))
+        for name in sorted(expected_tables.keys() - actual_tables.keys()):
+            result.drift_events.append(make(
+                event_type=DriftEventType.YAML_DIVERGENCE,
+                message=f"Logical table '{name}' missing in deployed view",
+                details={"table_name": name, "view_name": view_name}
+            ))
         
         # Find added tables
-        for name, table in actual_tables.items():
-            if name not in expected_tables:
-                result.drift_events.append(DriftEvent(
-                    event_type=DriftEventType.MANUAL_EDIT_DETECTED,
-                    drift_type=DriftType.SEMANTIC_VIEW_DRIFT,
-                    element_name=view_name,
-                    message=f"Logical table '{name}' added in deployed view (not in ODL)",
-                    details={"table_name": name, "view_name": view_name}
-                ))
+        for name in sorted(actual_tables.keys() - expected_tables.keys()):
+            result.drift_events.append(make(
+                event_type=DriftEventType.MANUAL_EDIT_DETECTED,
+                message=f"Logical table '{name}' added in deployed view (not in ODL)",
+                details={"table_name": name, "view_name": view_name}
+            ))
     
     def _compare_relationships(self, actual_sm: Dict, expected_sm: Dict, view_name: str, result: DriftDetectionResult):
         """Compare relationships between actual and expected YAML."""
+        make = functools.partial(DriftEvent, drift_type=DriftType.SEMANTIC_VIEW_DRIFT, element_name=view_name)
+        
         actual_rels = {r["name"]: r for r in actual_sm.get("relationships", [])}
         expected_rels = {r["name"]: r for r in expected_sm.get("relationships", [])}
         
         # Find missing relationships
-        for name, rel in expected_rels.items():
-            if name not in actual_rels:
-                result.drift_events.append(DriftEvent(
+        for name in sorted(expected_rels.keys() - actual_rels.keys()):
+            result.drift_events.append(make(
+                event_type=DriftEventType.YAML_DIVERGENCE,
+                message=f"Relationship '{name}' missing in deployed view",
+                details={"relationship_name": name, "view_name": view_name}
+            ))
+        
+        # Compare join keys of relationships present on both sides
+        for name in sorted(expected_rels.keys() & actual_rels.keys()):
+            actual_keys = frozenset(map(_canon_key, actual_rels[name].get("join_keys", [])))
+            expected_keys = frozenset(map(_canon_key, expected_rels[name].get("join_keys", [])))
+            
+            if actual_keys != expected_keys:
+                result.drift_events.append(make(
                     event_type=DriftEventType.YAML_DIVERGENCE,
-                    drift_type=DriftType.SEMANTIC_VIEW_DRIFT,
-                    element_name=view_name,
-                    message=f"Relationship '{name}' missing in deployed view",
-                    details={"relationship_name": name, "view_name": view_name}
+                    message=f"Relationship '{name}' join keys differ in deployed view",
+                    details={
+                        "relationship_name": name,
+                        "view_name": view_name,
+                        # Sorted so reports don't depend on the string hash seed
+                        "actual_keys": sorted(actual_keys, key=repr),
+                        "expected_keys": sorted(expected_keys, key=repr)
+                    }
                 ))
-            else:
-                # Compare join keys
-                actual_keys = set(tuple(k.items()) if isinstance(k, dict) else k for k in actual_rels[name].get("join_keys", []))
-                expected_keys = set(tuple(k.items()) if isinstance(k, dict) else k for k in expected_rels[name].get("join_keys", []))
-                
-                if actual_keys != expected_keys:
-                    result.drift_events.append(DriftEvent(
-                        event_type=DriftEventType.YAML_DIVERGENCE,
-                        drift_type=DriftType.SEMANTIC_VIEW_DRIFT,
-                        element_name=view_name,
-                        message=f"Relationship '{name}' join keys differ in deployed view",
-                        details={
-                            "relationship_name": name,
-                            "view_name": view_name,
-                            "actual_keys": list(actual_keys),
-                            "expected_keys": list(expected_keys)
-                        }
-                    ))
     
     def _compare_facts(self, actual_sm: Dict, expected_sm: Dict, view_name: str, result: DriftDetectionResult):
         """Compare facts/metrics between actual and expected YAML."""
+        make = functools.partial(DriftEvent, drift_type=DriftType.SEMANTIC_VIEW_DRIFT, element_name=view_name)
+        
         actual_facts = {f["name"]: f for f in actual_sm.get("facts", [])}
         expected_facts = {f["name"]: f for f in expected_sm.get("facts", [])}
         
         # Find missing facts
-        for name, fact in expected_facts.items():
-            if name not in actual_facts:
-                result.drift_events.append(DriftEvent(
-                    event_type=DriftEventType.YAML_DIVERGENCE,
-                    drift_type=DriftType.SEMANTIC_VIEW_DRIFT,
-                    element_name=view_name,
-                    message=f"Fact '{name}' missing in deployed view",
-                    details={"fact_name": name, "view_name": view_name}
+        for name in sorted(expected_facts.keys() - actual_facts.keys()):
+            result.drift_events.append(make(
+                event_type=DriftEventType.YAML_DIVERGENCE,
+                message=f"Fact '{name}' missing in deployed view",
+                details={"fact_name": name, "view_name": view_name}
+            ))
+        
+        # Compare expressions of facts present on both sides
+        for name in sorted(expected_facts.keys() & actual_facts.keys()):
+            actual_expression = actual_facts[name].get("expression")
+            expected_expression = expected_facts[name].get("expression")
+            if actual_expression != expected_expression:
+                result.drift_events.append(make(
+                    event_type=DriftEventType.MANUAL_EDIT_DETECTED,
+                    message=f"Fact '{name}' expression differs in deployed view",
+                    details={
+                        "fact_name": name,
+                        "view_name": view_name,
+                        "actual_expression": actual_expression,
+                        "expected_expression": expected_expression
+                    }
                 ))
-            else:
-                # Compare expressions
-                if actual_facts[name].get("expression") != fact.get("expression"):
-                    result.drift_events.append(DriftEvent(
-                        event_type=DriftEventType.MANUAL_EDIT_DETECTED,
-                        drift_type=DriftType.SEMANTIC_VIEW_DRIFT,
-                        element_name=view_name,
-                        message=f"Fact '{name}' expression differs in deployed view",
-                        details={
-                            "fact_name": name,
-                            "view_name": view_name,
-                            "actual_expression": actual_facts[name].get("expression"),
-                            "expected_expression": fact.get("expression")
-                        }
-                    ))
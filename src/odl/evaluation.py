@@ -1,12 +1,18 @@
 """ODL evaluation gates - structural, semantic, and deployability checks."""
 
-from typing import Dict, List, Any, Optional, Set, Tuple
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 from .ir import ODLIR, ObjectIR, RelationshipIR, MetricIR, DimensionIR
 
 
+# Object count from which the join graph is analyzed by the Numba kernel, if installed
+# (`pip install sundaygraph[fast]`)
+_NUMBA_MIN_OBJECTS = 2000
+
 class GateCategory(Enum):
     """Evaluation gate category."""
     STRUCTURAL = "structural"
@@ -22,7 +28,7 @@ class GateStatus(Enum):
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class GateResult:
     """Result of a single gate evaluation."""
     gate_name: str
@@ -42,7 +48,7 @@ class GateResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Result of full evaluation."""
     version_id: int
@@ -50,6 +56,8 @@ class EvaluationResult:
     overall_pass: bool
     gate_results: List[GateResult] = field(default_factory=list)
     metrics: Dict[str, Any] = field(default_factory=dict)
+    # Per-gate input hashes from ODLEvaluator.evaluate_update; process-local, never serialized
+    _input_hashes: Optional[Dict[str, int]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -62,6 +70,25 @@ class EvaluationResult:
         }
 
 
+# Gate -> IR parts its result depends on; see ODLEvaluator._input_hashes
+_GATE_INPUTS: Dict[GateCategory, Dict[str, Tuple[str, ...]]] = {
+    GateCategory.STRUCTURAL: {
+        "odl_validity": (),
+        "references_resolved": ("objects", "relationships", "metrics", "dimensions"),
+        "mapping_complete": ("objects", "snowflake"),
+    },
+    GateCategory.SEMANTIC: {
+        # Also skipped when references_resolved fails, so share its inputs
+        "connected_join_graph": ("objects", "relationships", "metrics", "dimensions"),
+        "no_ambiguous_joins": ("objects", "relationships", "metrics", "dimensions"),
+        "metric_grains_consistent": ("objects", "metrics"),
+    },
+    GateCategory.DEPLOYABILITY: {
+        "yaml_verify_passes": ("header", "objects", "relationships", "metrics", "dimensions", "snowflake"),
+    },
+}
+
+
 class ThresholdProfile:
     """Threshold profile for evaluation gates."""
     
@@ -107,17 +134,85 @@ class ThresholdProfile:
         return profiles.get(profile_name.lower(), cls.STRICT)
 
 
+class _DisjointSet:
+    """Union-find over object names with union by rank and path compression."""
+    
+    def __init__(self, items: List[str]):
+        self.parent: Dict[str, str] = {item: item for item in items}
+        self.rank: Dict[str, int] = dict.fromkeys(self.parent, 0)
+    
+    def find(self, item: str) -> str:
+        """Get the root of an item's set."""
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+    
+    def union(self, a: str, b: str) -> bool:
+        """Merge the sets of two items; returns False if they were already joined."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        return True
+
+
 class ODLEvaluator:
     """Evaluates ODL against gates before deployment."""
     
-    def __init__(self, threshold_profile: str = "strict"):
+    def __init__(self, threshold_profile: str = "strict", cache_max_entries: int = 256):
         """
         Initialize evaluator.
         
         Args:
             threshold_profile: Threshold profile name (strict, relaxed)
+            cache_max_entries: Maximum number of cached verify.sql compile outcomes
+                (0 disables)
         """
         self.threshold_profile = ThresholdProfile.get_profile(threshold_profile)
+        # Unknown profile names fall back to STRICT, so compare the profile itself
+        self._is_strict = self.threshold_profile is ThresholdProfile.STRICT
+        self._profile_name = "strict" if self._is_strict else "relaxed"
+        # Gate names are unique across categories, so one flat lookup suffices
+        self._thresholds: Dict[str, str] = {
+            gate_name: threshold
+            for category in self.threshold_profile.values()
+            for gate_name, threshold in category.items()
+        }
+        # The profile is fixed for the evaluator's lifetime, so resolve each
+        # gate's behavior once instead of comparing threshold strings per call
+        self._skipped_gates = frozenset(g for g, t in self._thresholds.items() if t == "skip")
+        self._non_required_gates = frozenset(g for g, t in self._thresholds.items() if t != "required")
+        self._fail_status: Dict[str, GateStatus] = {
+            gate_name: GateStatus.FAIL if self._thresholds.get(gate_name, "required") == "required" else GateStatus.WARNING
+            for gates in _GATE_INPUTS.values()
+            for gate_name in gates
+        }
+        self.cache_max_entries = cache_max_entries
+        # (ODLIR.content_key(), compiler options) -> whether verify.sql was generated,
+        # so repeated evaluations of one IR compile once
+        self._verify_cache: OrderedDict = OrderedDict()
+        self._verify_cache_lock = threading.Lock()
+        self._compiler = None
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached verify.sql compile outcomes, e.g. after a compiler change."""
+        with self._verify_cache_lock:
+            self._verify_cache.clear()
+    
+    def _get_compiler(self):
+        """Get the Snowflake compiler, created on first use and reused afterwards."""
+        if self._compiler is None:
+            # Imported lazily so a broken snowflake package only fails the deployability gate
+            from ..snowflake.snowflake_compiler import SnowflakeCompiler
+            self._compiler = SnowflakeCompiler()
+        return self._compiler
     
     def evaluate(self, odl_ir: ODLIR, version_id: int, odl_json: Optional[Dict[str, Any]] = None) -> EvaluationResult:
         """
@@ -131,21 +226,91 @@ class ODLEvaluator:
         Returns:
             EvaluationResult with gate results
         """
+        return self._evaluate(odl_ir, version_id, odl_json, {})
+    
+    def evaluate_update(
+        self,
+        prev_ir: ODLIR,
+        new_ir: ODLIR,
+        prev_result: EvaluationResult,
+        version_id: Optional[int] = None,
+        odl_json: Optional[Dict[str, Any]] = None
+    ) -> EvaluationResult:
+        """
+        Re-evaluate a changed ODL, reusing gate results whose inputs did not change.
+        
+        Gates run per category: a category is re-run if any of its gates reads
+        an IR part (objects, relationships, ...) whose content hash changed.
+        Input hashes are kept on the returned result (not in `metrics`) so
+        chained updates skip rehashing the previous IR; they are only valid
+        within one process.
+        
+        Args:
+            prev_ir: IR that prev_result was computed for
+            new_ir: Changed IR to evaluate
+            prev_result: Previous evaluation result (from this profile)
+            version_id: Version ID (defaults to prev_result's)
+            odl_json: Optional raw ODL JSON for additional checks
+            
+        Returns:
+            EvaluationResult with gate results
+        """
+        prev_hashes = prev_result._input_hashes or self._input_hashes(prev_ir)
+        new_hashes = self._input_hashes(new_ir)
+        
+        reuse: Dict[GateCategory, List[GateResult]] = {}
+        if prev_result.threshold_profile == self._profile_name:
+            for gate in prev_result.gate_results:
+                reuse.setdefault(gate.category, []).append(gate)
+            for category, gates in _GATE_INPUTS.items():
+                if any(prev_hashes.get(gate_name) != new_hashes[gate_name] for gate_name in gates):
+                    reuse.pop(category, None)
+        
+        result = self._evaluate(
+            new_ir,
+            prev_result.version_id if version_id is None else version_id,
+            odl_json,
+            reuse
+        )
+        result._input_hashes = new_hashes
+        return result
+    
+    def _evaluate(
+        self,
+        odl_ir: ODLIR,
+        version_id: int,
+        odl_json: Optional[Dict[str, Any]],
+        reuse: Dict[GateCategory, List[GateResult]]
+    ) -> EvaluationResult:
+        """Run all gate categories, taking results for categories in reuse as-is."""
         result = EvaluationResult(
             version_id=version_id,
-            threshold_profile="strict" if self.threshold_profile == ThresholdProfile.STRICT else "relaxed",
+            threshold_profile=self._profile_name,
             overall_pass=True,
             gate_results=[]
         )
         
         # Structural gates
-        result.gate_results.extend(self._evaluate_structural_gates(odl_ir, odl_json))
+        if GateCategory.STRUCTURAL in reuse:
+            result.gate_results.extend(reuse[GateCategory.STRUCTURAL])
+        else:
+            result.gate_results.extend(self._evaluate_structural_gates(odl_ir, odl_json))
+        references_ok = not any(
+            g.gate_name == "references_resolved" and g.status == GateStatus.FAIL
+            for g in result.gate_results
+        )
         
         # Semantic gates
-        result.gate_results.extend(self._evaluate_semantic_gates(odl_ir))
+        if GateCategory.SEMANTIC in reuse:
+            result.gate_results.extend(reuse[GateCategory.SEMANTIC])
+        else:
+            result.gate_results.extend(self._evaluate_semantic_gates(odl_ir, references_ok))
         
         # Deployability gates
-        result.gate_results.extend(self._evaluate_deployability_gates(odl_ir))
+        if GateCategory.DEPLOYABILITY in reuse:
+            result.gate_results.extend(reuse[GateCategory.DEPLOYABILITY])
+        else:
+            result.gate_results.extend(self._evaluate_deployability_gates(odl_ir))
         
         # Determine overall pass based on threshold profile
         result.overall_pass = self._determine_overall_pass(result.gate_results)
@@ -155,268 +320,302 @@ class ODLEvaluator:
         
         return result
     
-    def _evaluate_structural_gates(self, odl_ir: ODLIR, odl_json: Optional[Dict[str, Any]]) -> List[GateResult]:
-        """Evaluate structural gates."""
-        results = []
+    def _input_hashes(self, odl_ir: ODLIR) -> Dict[str, int]:
+        """Hash each gate's inputs (see _GATE_INPUTS)."""
+        snowflake = odl_ir.snowflake
+        parts = {
+            "header": hash((odl_ir.version, odl_ir.name, odl_ir.description)),
+            "snowflake": hash(snowflake and (
+                snowflake.database, snowflake.schema, snowflake.warehouse,
+                tuple(sorted(snowflake.table_mappings.items()))
+            )),
+        }
+        for collection in ("objects", "relationships", "metrics", "dimensions"):
+            parts[collection] = odl_ir.collection_digest(collection)
         
+        return {
+            gate_name: hash(tuple(parts[part] for part in inputs))
+            for gates in _GATE_INPUTS.values()
+            for gate_name, inputs in gates.items()
+        }
+    
+    def _evaluate_structural_gates(self, odl_ir: ODLIR, odl_json: Optional[Dict[str, Any]]) -> Iterator[GateResult]:
+        """Evaluate structural gates."""
         # Gate: ODL Validity (assumed valid if we have IR)
         gate_name = "odl_validity"
-        threshold = self.threshold_profile.get("structural", {}).get(gate_name, "required")
         
-        if threshold == "skip":
-            results.append(GateResult(
+        if gate_name in self._skipped_gates:
+            yield GateResult(
                 gate_name=gate_name,
                 category=GateCategory.STRUCTURAL,
                 status=GateStatus.SKIP,
                 message="ODL validity check skipped"
-            ))
+            )
         else:
             # If we have IR, ODL is valid (validation happens before normalization)
-            results.append(GateResult(
+            yield GateResult(
                 gate_name=gate_name,
                 category=GateCategory.STRUCTURAL,
                 status=GateStatus.PASS,
                 message="ODL is valid"
-            ))
+            )
         
         # Gate: References Resolved
         gate_name = "references_resolved"
-        threshold = self.threshold_profile.get("structural", {}).get(gate_name, "required")
         
-        if threshold == "skip":
-            results.append(GateResult(
+        if gate_name in self._skipped_gates:
+            yield GateResult(
                 gate_name=gate_name,
                 category=GateCategory.STRUCTURAL,
                 status=GateStatus.SKIP,
                 message="References check skipped"
-            ))
+            )
         else:
             unresolved = self._check_unresolved_references(odl_ir)
             if unresolved:
-                status = GateStatus.FAIL if threshold == "required" else GateStatus.WARNING
-                results.append(GateResult(
+                status = self._fail_status[gate_name]
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.STRUCTURAL,
                     status=status,
                     message=f"Unresolved references: {', '.join(unresolved)}",
                     details={"unresolved_references": unresolved}
-                ))
+                )
             else:
-                results.append(GateResult(
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.STRUCTURAL,
                     status=GateStatus.PASS,
                     message="All references resolved"
-                ))
+                )
         
         # Gate: Mapping Complete
         gate_name = "mapping_complete"
-        threshold = self.threshold_profile.get("structural", {}).get(gate_name, "required")
         
-        if threshold == "skip":
-            results.append(GateResult(
+        if gate_name in self._skipped_gates:
+            yield GateResult(
                 gate_name=gate_name,
                 category=GateCategory.STRUCTURAL,
                 status=GateStatus.SKIP,
                 message="Mapping check skipped"
-            ))
+            )
         else:
             incomplete = self._check_mapping_completeness(odl_ir)
             if incomplete:
-                status = GateStatus.FAIL if threshold == "required" else GateStatus.WARNING
-                results.append(GateResult(
+                status = self._fail_status[gate_name]
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.STRUCTURAL,
                     status=status,
                     message=f"Incomplete mappings: {', '.join(incomplete)}",
                     details={"incomplete_mappings": incomplete}
-                ))
+                )
             else:
-                results.append(GateResult(
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.STRUCTURAL,
                     status=GateStatus.PASS,
                     message="All mappings complete"
-                ))
-        
-        return results
+                )
     
-    def _evaluate_semantic_gates(self, odl_ir: ODLIR) -> List[GateResult]:
-        """Evaluate semantic gates."""
-        results = []
+    def _evaluate_semantic_gates(self, odl_ir: ODLIR, references_ok: bool = True) -> Iterator[GateResult]:
+        """
+        Evaluate semantic gates.
+        
+        Args:
+            odl_ir: Normalized ODL IR
+            references_ok: False if the references gate failed; the join graph
+                gates are then skipped since the evaluation already fails
+        """
+        graph_analysis = self._analyze_relationship_graph(odl_ir) if references_ok else None
         
         # Gate: Connected Join Graph
         gate_name = "connected_join_graph"
-        threshold = self.threshold_profile.get("semantic", {}).get(gate_name, "required")
         
-        if threshold == "skip":
-            results.append(GateResult(
+        if gate_name in self._skipped_gates:
+            yield GateResult(
                 gate_name=gate_name,
                 category=GateCategory.SEMANTIC,
                 status=GateStatus.SKIP,
                 message="Join graph check skipped"
-            ))
+            )
+        elif not references_ok:
+            yield GateResult(
+                gate_name=gate_name,
+                category=GateCategory.SEMANTIC,
+                status=GateStatus.SKIP,
+                message="Join graph check skipped due to unresolved references"
+            )
         else:
-            is_connected, disconnected = self._check_connected_join_graph(odl_ir)
+            is_connected, disconnected = self._check_connected_join_graph(odl_ir, graph_analysis)
             if not is_connected:
-                status = GateStatus.FAIL if threshold == "required" else GateStatus.WARNING
-                results.append(GateResult(
+                status = self._fail_status[gate_name]
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.SEMANTIC,
                     status=status,
                     message=f"Disconnected objects: {', '.join(disconnected)}",
                     details={"disconnected_objects": disconnected}
-                ))
+                )
             else:
-                results.append(GateResult(
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.SEMANTIC,
                     status=GateStatus.PASS,
                     message="All objects connected via relationships"
-                ))
+                )
         
         # Gate: No Ambiguous Join Paths
         gate_name = "no_ambiguous_joins"
-        threshold = self.threshold_profile.get("semantic", {}).get(gate_name, "required")
         
-        if threshold == "skip":
-            results.append(GateResult(
+        if gate_name in self._skipped_gates:
+            yield GateResult(
                 gate_name=gate_name,
                 category=GateCategory.SEMANTIC,
                 status=GateStatus.SKIP,
                 message="Ambiguous joins check skipped"
-            ))
+            )
+        elif not references_ok:
+            yield GateResult(
+                gate_name=gate_name,
+                category=GateCategory.SEMANTIC,
+                status=GateStatus.SKIP,
+                message="Ambiguous joins check skipped due to unresolved references"
+            )
         else:
-            ambiguous = self._check_ambiguous_join_paths(odl_ir)
+            ambiguous = self._check_ambiguous_join_paths(odl_ir, graph_analysis)
             join_key_mismatches = self._check_relationship_join_keys_mismatch(odl_ir)
             
             if join_key_mismatches:
-                status = GateStatus.FAIL if threshold == "required" else GateStatus.WARNING
-                results.append(GateResult(
+                status = self._fail_status[gate_name]
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.SEMANTIC,
                     status=status,
                     message=f"Join key mismatches: {'; '.join(join_key_mismatches)}",
                     details={"join_key_mismatches": join_key_mismatches}
-                ))
+                )
             elif ambiguous:
-                status = GateStatus.FAIL if threshold == "required" else GateStatus.WARNING
+                status = self._fail_status[gate_name]
                 messages = []
                 for obj1, obj2, paths in ambiguous:
-                    messages.append(f"{obj1}->{obj2}: {len(paths)} paths")
-                results.append(GateResult(
+                    # Path search stops at two, so this is a lower bound
+                    messages.append(f"{obj1}->{obj2}: {len(paths)}+ paths")
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.SEMANTIC,
                     status=status,
                     message=f"Ambiguous join paths: {'; '.join(messages)}",
                     details={"ambiguous_paths": ambiguous}
-                ))
+                )
             else:
-                results.append(GateResult(
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.SEMANTIC,
                     status=GateStatus.PASS,
                     message="No ambiguous join paths and all join keys valid"
-                ))
+                )
         
         # Gate: Metric Grains Consistent
         gate_name = "metric_grains_consistent"
-        threshold = self.threshold_profile.get("semantic", {}).get(gate_name, "required")
         
-        if threshold == "skip":
-            results.append(GateResult(
+        if gate_name in self._skipped_gates:
+            yield GateResult(
                 gate_name=gate_name,
                 category=GateCategory.SEMANTIC,
                 status=GateStatus.SKIP,
                 message="Metric grains check skipped"
-            ))
+            )
         else:
             inconsistent = self._check_metric_grains_consistent(odl_ir)
             if inconsistent:
-                status = GateStatus.FAIL if threshold == "required" else GateStatus.WARNING
+                status = self._fail_status[gate_name]
                 messages = []
                 for metric, grain, issue in inconsistent:
                     messages.append(f"{metric}: {issue}")
-                results.append(GateResult(
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.SEMANTIC,
                     status=status,
                     message=f"Inconsistent metric grains: {'; '.join(messages)}",
                     details={"inconsistent_grains": inconsistent}
-                ))
+                )
             else:
-                results.append(GateResult(
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.SEMANTIC,
                     status=GateStatus.PASS,
                     message="All metric grains consistent"
-                ))
-        
-        return results
+                )
     
-    def _evaluate_deployability_gates(self, odl_ir: ODLIR) -> List[GateResult]:
+    def _evaluate_deployability_gates(self, odl_ir: ODLIR) -> Iterator[GateResult]:
         """Evaluate deployability gates."""
-        results = []
-        
         # Gate: YAML Verify Passes
         gate_name = "yaml_verify_passes"
-        threshold = self.threshold_profile.get("deployability", {}).get(gate_name, "required")
         
-        if threshold == "skip":
-            results.append(GateResult(
+        if gate_name in self._skipped_gates:
+            yield GateResult(
                 gate_name=gate_name,
                 category=GateCategory.DEPLOYABILITY,
                 status=GateStatus.SKIP,
                 message="YAML verify check skipped"
-            ))
+            )
         else:
             # This gate prepares verify.sql but doesn't actually run it
             # Actual verification would require Snowflake connection
             # For now, we check that YAML can be generated
             try:
-                from ..snowflake.snowflake_compiler import SnowflakeCompiler
-                compiler = SnowflakeCompiler()
                 options = {
                     "version_id": f"eval-{odl_ir.version}",
                     "view_name": "eval_view",
                     "database": odl_ir.snowflake.database if odl_ir.snowflake else "DATABASE",
                     "schema": odl_ir.snowflake.schema if odl_ir.snowflake else "SCHEMA"
                 }
-                bundle = compiler.compile(odl_ir, options)
-                verify_file = bundle.get_file("verify.sql")
+                cache_key = (odl_ir.content_key(), tuple(sorted(options.items())))
+                with self._verify_cache_lock:
+                    verify_generated = self._verify_cache.get(cache_key)
+                    if verify_generated is not None:
+                        self._verify_cache.move_to_end(cache_key)
+                
+                if verify_generated is None:
+                    bundle = self._get_compiler().compile(odl_ir, options)
+                    verify_generated = bool(bundle.get_file("verify.sql"))
+                    if self.cache_max_entries > 0:
+                        with self._verify_cache_lock:
+                            self._verify_cache[cache_key] = verify_generated
+                            while len(self._verify_cache) > self.cache_max_entries:
+                                self._verify_cache.popitem(last=False)
                 
-                if verify_file:
-                    results.append(GateResult(
+                if verify_generated:
+                    yield GateResult(
                         gate_name=gate_name,
                         category=GateCategory.DEPLOYABILITY,
                         status=GateStatus.PASS,
                         message="verify.sql generated successfully (run in Snowflake to verify)",
                         details={"verify_sql_generated": True}
-                    ))
+                    )
                 else:
-                    status = GateStatus.FAIL if threshold == "required" else GateStatus.WARNING
-                    results.append(GateResult(
+                    status = self._fail_status[gate_name]
+                    yield GateResult(
                         gate_name=gate_name,
                         category=GateCategory.DEPLOYABILITY,
                         status=status,
                         message="Failed to generate verify.sql"
-                    ))
+                    )
             except Exception as e:
-                status = GateStatus.FAIL if threshold == "required" else GateStatus.WARNING
-                results.append(GateResult(
+                status = self._fail_status[gate_name]
+                yield GateResult(
                     gate_name=gate_name,
                     category=GateCategory.DEPLOYABILITY,
                     status=status,
                     message=f"Error generating verify.sql: {str(e)}",
                     details={"error": str(e)}
-                ))
-        
-        return results
+                )
     
     def _check_unresolved_references(self, odl_ir: ODLIR) -> List[str]:
         """Check for unresolved object references in relationships and metrics."""
         unresolved = []
-        object_names = {obj.name for obj in odl_ir.objects}
+        object_names = odl_ir.objects_by_name
         
         # Check relationship references
         for rel in odl_ir.relationships:
@@ -433,18 +632,15 @@ class ODLEvaluator:
         
         # Check dimension source property references
         for dim in odl_ir.dimensions:
-            parts = dim.source_property.split(".")
-            if len(parts) == 2:
-                obj_name, prop_name = parts
-                if obj_name not in object_names:
+            # Only "Object.property" references are checked
+            obj_name, sep, prop_name = dim.source_property.partition(".")
+            if sep and "." not in prop_name:
+                obj = object_names.get(obj_name)
+                if obj is None:
                     unresolved.append(f"Dimension '{dim.name}': source object '{obj_name}' not found")
-                else:
-                    # Check property exists
-                    obj = next((o for o in odl_ir.objects if o.name == obj_name), None)
-                    if obj:
-                        prop_names = {p.name for p in obj.properties}
-                        if prop_name not in prop_names:
-                            unresolved.append(f"Dimension '{dim.name}': property '{prop_name}' not found in '{obj_name}'")
+                elif prop_name not in obj.properties_by_name:
+                    # Property doesn't exist
+                    unresolved.append(f"Dimension '{dim.name}': property '{prop_name}' not found in '{obj_name}'")
         
         return unresolved
     
@@ -469,7 +665,49 @@ class ODLEvaluator:
         
         return incomplete
     
-    def _check_connected_join_graph(self, odl_ir: ODLIR) -> Tuple[bool, List[str]]:
+    def _analyze_relationship_graph(self, odl_ir: ODLIR) -> Tuple[List[List[str]], List[Tuple[str, str, str]]]:
+        """
+        Union relationship endpoints in one pass over the relationships.
+        
+        Returns:
+            Tuple of (connected components in object order, cycle-closing edges
+            as (from_object, to_object, relationship_name))
+        """
+        objects_by_name = odl_ir.objects_by_name
+        
+        if len(objects_by_name) >= _NUMBA_MIN_OBJECTS:
+            try:
+                from . import _graph_numba
+            except ImportError:
+                _graph_numba = None
+            if _graph_numba is not None and _graph_numba.NUMBA_AVAILABLE:
+                edges = [
+                    (rel.from_object, rel.to_object, rel.name)
+                    for rel in odl_ir.relationships
+                    if rel.from_object in objects_by_name and rel.to_object in objects_by_name
+                ]
+                return _graph_numba.analyze_relationship_graph(list(objects_by_name), edges)
+        
+        dsu = _DisjointSet(list(objects_by_name))
+        cycle_edges = []
+        
+        for rel in odl_ir.relationships:
+            if rel.from_object in objects_by_name and rel.to_object in objects_by_name:
+                if not dsu.union(rel.from_object, rel.to_object):
+                    # Endpoints already connected, so this edge adds a second path
+                    cycle_edges.append((rel.from_object, rel.to_object, rel.name))
+        
+        components: Dict[str, List[str]] = {}
+        for obj_name in objects_by_name:
+            components.setdefault(dsu.find(obj_name), []).append(obj_name)
+        
+        return list(components.values()), cycle_edges
+    
+    def _check_connected_join_graph(
+        self,
+        odl_ir: ODLIR,
+        graph_analysis: Optional[Tuple[List[List[str]], List[Tuple[str, str, str]]]] = None
+    ) -> Tuple[bool, List[str]]:
         """Check that relationships form a connected graph."""
         if not odl_ir.objects:
             return True, []
@@ -478,34 +716,7 @@ class ODLEvaluator:
             # No relationships means disconnected
             return False, [obj.name for obj in odl_ir.objects]
         
-        # Build adjacency list
-        graph: Dict[str, Set[str]] = {obj.name: set() for obj in odl_ir.objects}
-        
-        for rel in odl_ir.relationships:
-            if rel.from_object in graph and rel.to_object in graph:
-                graph[rel.from_object].add(rel.to_object)
-                graph[rel.to_object].add(rel.from_object)
-        
-        # BFS to find connected components
-        visited = set()
-        components = []
-        
-        for obj_name in graph:
-            if obj_name not in visited:
-                component = []
-                queue = [obj_name]
-                visited.add(obj_name)
-                
-                while queue:
-                    current = queue.pop(0)
-                    component.append(current)
-                    
-                    for neighbor in graph[current]:
-                        if neighbor not in visited:
-                            visited.add(neighbor)
-                            queue.append(neighbor)
-                
-                components.append(component)
+        components, _ = graph_analysis or self._analyze_relationship_graph(odl_ir)
         
         if len(components) == 1:
             return True, []
@@ -518,13 +729,26 @@ class ODLEvaluator:
                     disconnected.extend(component)
             return False, disconnected
     
-    def _check_ambiguous_join_paths(self, odl_ir: ODLIR) -> List[Tuple[str, str, List[List[str]]]]:
+    def _check_ambiguous_join_paths(
+        self,
+        odl_ir: ODLIR,
+        graph_analysis: Optional[Tuple[List[List[str]], List[Tuple[str, str, str]]]] = None
+    ) -> List[Tuple[str, str, List[List[str]]]]:
         """Check for ambiguous join paths between objects."""
         ambiguous = []
         
         if not odl_ir.relationships:
             return ambiguous
         
+        # A second path between two objects can only exist inside a component
+        # that has a cycle-closing edge
+        components, cycle_edges = graph_analysis or self._analyze_relationship_graph(odl_ir)
+        if not cycle_edges:
+            return ambiguous
+        
+        component_of = {name: i for i, component in enumerate(components) for name in component}
+        cyclic = {component_of[from_object] for from_object, _, _ in cycle_edges}
+        
         # Build graph
         graph: Dict[str, List[Tuple[str, str]]] = {obj.name: [] for obj in odl_ir.objects}
         
@@ -533,12 +757,18 @@ class ODLEvaluator:
                 graph[rel.from_object].append((rel.to_object, rel.name))
                 graph[rel.to_object].append((rel.from_object, rel.name))
         
-        # Find all paths between each pair of objects
+        # Check each pair of objects in a cyclic component
         object_names = list(graph.keys())
         
         for i, obj1 in enumerate(object_names):
+            component = component_of.get(obj1)
+            if component not in cyclic:
+                continue
             for obj2 in object_names[i+1:]:
-                paths = self._find_all_paths(graph, obj1, obj2, max_depth=5)
+                if component_of.get(obj2) != component:
+                    continue
+                # Two paths are enough to prove ambiguity, and all the report shows
+                paths = self._find_all_paths(graph, obj1, obj2, max_depth=5, limit=2)
                 if len(paths) > 1:
                     ambiguous.append((obj1, obj2, paths))
         
@@ -547,26 +777,28 @@ class ODLEvaluator:
     def _check_relationship_join_keys_mismatch(self, odl_ir: ODLIR) -> List[str]:
         """Check for join key mismatches in relationships."""
         mismatches = []
+        objects_by_name = odl_ir.objects_by_name
         
         for rel in odl_ir.relationships:
             # Find from object
-            from_obj = next((o for o in odl_ir.objects if o.name == rel.from_object), None)
-            to_obj = next((o for o in odl_ir.objects if o.name == rel.to_object), None)
+            from_obj = objects_by_name.get(rel.from_object)
+            to_obj = objects_by_name.get(rel.to_object)
             
             if not from_obj or not to_obj:
                 continue
             
+            from_props = from_obj.properties_by_name
+            to_props = to_obj.properties_by_name
+            
             # Check each join key pair
             for from_key, to_key in rel.join_keys:
                 # Check from_key exists in from_obj
-                from_props = {p.name for p in from_obj.properties}
                 if from_key not in from_props:
                     mismatches.append(
                         f"Relationship '{rel.name}': join key '{from_key}' not found in '{rel.from_object}'"
                     )
                 
                 # Check to_key exists in to_obj
-                to_props = {p.name for p in to_obj.properties}
                 if to_key not in to_props:
                     mismatches.append(
                         f"Relationship '{rel.name}': join key '{to_key}' not found in '{rel.to_object}'"
@@ -574,8 +806,24 @@ class ODLEvaluator:
         
         return mismatches
     
-    def _find_all_paths(self, graph: Dict[str, List[Tuple[str, str]]], start: str, end: str, max_depth: int = 5) -> List[List[str]]:
-        """Find all paths between two nodes."""
+    def _find_all_paths(
+        self,
+        graph: Dict[str, List[Tuple[str, str]]],
+        start: str,
+        end: str,
+        max_depth: int = 5,
+        limit: Optional[int] = None
+    ) -> List[List[str]]:
+        """
+        Find all paths between two nodes.
+        
+        Args:
+            graph: Adjacency list of (neighbor, relationship name)
+            start: Start node
+            end: End node
+            max_depth: Maximum number of nodes in a path
+            limit: Stop once this many paths are found (None finds all)
+        """
         if start == end:
             return [[start]]
         
@@ -583,31 +831,38 @@ class ODLEvaluator:
             return []
         
         paths = []
+        path = [start]
         visited = {start}
-        
-        def dfs(current: str, path: List[str]):
-            if current == end:
-                paths.append(path[:])
-                return
-            
-            if len(path) >= max_depth:
-                return
+        # One neighbor iterator per node on the current path; paths longer than
+        # max_depth are never expanded
+        stack = [iter(graph.get(start, []))] if max_depth > 1 else []
+        
+        while stack:
+            edge = next(stack[-1], None)
+            if edge is None:
+                # Exhausted this node: backtrack
+                stack.pop()
+                visited.discard(path.pop())
+                continue
             
-            for neighbor, _ in graph.get(current, []):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    path.append(neighbor)
-                    dfs(neighbor, path)
-                    path.pop()
-                    visited.remove(neighbor)
-        
-        dfs(start, [start])
+            neighbor = edge[0]
+            if neighbor in visited:
+                continue
+            if neighbor == end:
+                paths.append(path + [neighbor])
+                if limit is not None and len(paths) >= limit:
+                    break
+            elif len(path) + 1 < max_depth:
+                visited.add(neighbor)
+                path.append(neighbor)
+                stack.append(iter(graph.get(neighbor, [])))
+        
         return paths
     
     def _check_metric_grains_consistent(self, odl_ir: ODLIR) -> List[Tuple[str, List[str], str]]:
         """Check that metric grains reference valid objects and are consistent."""
         inconsistent = []
-        object_names = {obj.name for obj in odl_ir.objects}
+        object_names = odl_ir.objects_by_name
         
         for metric in odl_ir.metrics:
             # Check all grain objects exist
@@ -623,46 +878,46 @@ class ODLEvaluator:
     
     def _determine_overall_pass(self, gate_results: List[GateResult]) -> bool:
         """Determine overall pass based on threshold profile."""
+        # Local aliases keep the enum lookups out of the loop
+        FAIL, WARNING = GateStatus.FAIL, GateStatus.WARNING
+        non_required = self._non_required_gates
+        
         for result in gate_results:
-            threshold = self._get_threshold_for_gate(result.gate_name, result.category)
+            if result.gate_name in non_required:
+                continue
             
-            if threshold == "required" and result.status == GateStatus.FAIL:
+            if result.status is FAIL:
                 return False
-            elif threshold == "required" and result.status == GateStatus.WARNING:
+            elif result.status is WARNING:
                 # Warnings in required gates fail in strict mode
-                if self.threshold_profile == ThresholdProfile.STRICT:
+                if self._is_strict:
                     return False
         
         return True
     
-    def _get_threshold_for_gate(self, gate_name: str, category: GateCategory) -> str:
-        """Get threshold for a specific gate."""
-        category_key = category.value
-        return self.threshold_profile.get(category_key, {}).get(gate_name, "required")
-    
     def _calculate_metrics(self, gate_results: List[GateResult]) -> Dict[str, Any]:
         """Calculate evaluation metrics."""
-        total = len(gate_results)
-        passed = sum(1 for r in gate_results if r.status == GateStatus.PASS)
-        failed = sum(1 for r in gate_results if r.status == GateStatus.FAIL)
-        warnings = sum(1 for r in gate_results if r.status == GateStatus.WARNING)
-        skipped = sum(1 for r in gate_results if r.status == GateStatus.SKIP)
+        # One pass: count statuses overall and per category
+        totals: Counter = Counter()
+        counts: Dict[GateCategory, Counter] = {category: Counter() for category in GateCategory}
+        for r in gate_results:
+            totals[r.status] += 1
+            counts[r.category][r.status] += 1
         
         by_category = {}
-        for category in GateCategory:
-            category_results = [r for r in gate_results if r.category == category]
+        for category, category_counts in counts.items():
             by_category[category.value] = {
-                "total": len(category_results),
-                "passed": sum(1 for r in category_results if r.status == GateStatus.PASS),
-                "failed": sum(1 for r in category_results if r.status == GateStatus.FAIL),
-                "warnings": sum(1 for r in category_results if r.status == GateStatus.WARNING)
+                "total": sum(category_counts.values()),
+                "passed": category_counts[GateStatus.PASS],
+                "failed": category_counts[GateStatus.FAIL],
+                "warnings": category_counts[GateStatus.WARNING]
             }
         
         return {
-            "total_gates": total,
-            "passed": passed,
-            "failed": failed,
-            "warnings": warnings,
-            "skipped": skipped,
+            "total_gates": len(gate_results),
+            "passed": totals[GateStatus.PASS],
+            "failed": totals[GateStatus.FAIL],
+            "warnings": totals[GateStatus.WARNING],
+            "skipped": totals[GateStatus.SKIP],
             "by_category": by_category
         }
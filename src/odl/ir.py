@@ -1,10 +1,11 @@
 """ODL Intermediate Representation (IR)."""
 
+import hashlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class PropertyIR:
     """Normalized property representation."""
     name: str
@@ -14,7 +15,7 @@ class PropertyIR:
     required: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectIR:
     """Normalized object representation."""
     name: str
@@ -24,9 +25,29 @@ class ObjectIR:
     snowflake_table: Optional[str] = None
     snowflake_schema: Optional[str] = None
     snowflake_database: Optional[str] = None
+    # (properties list, its length, index); reused only while both still match
+    _properties_by_name: Optional[Tuple[List[PropertyIR], int, Dict[str, PropertyIR]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def properties_by_name(self) -> Dict[str, PropertyIR]:
+        """
+        Properties keyed by name.
+        
+        Rebuilt when `properties` is reassigned or changes length; after
+        replacing or renaming properties in place call `ODLIR.invalidate_indexes()`.
+        """
+        properties = self.properties
+        cached = self._properties_by_name
+        if cached is not None and cached[0] is properties and cached[1] == len(properties):
+            return cached[2]
+        index = {p.name: p for p in properties}
+        self._properties_by_name = (properties, len(properties), index)
+        return index
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipIR:
     """Normalized relationship representation."""
     name: str
@@ -37,7 +58,7 @@ class RelationshipIR:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricIR:
     """Normalized metric representation."""
     name: str
@@ -48,7 +69,7 @@ class MetricIR:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DimensionIR:
     """Normalized dimension representation."""
     name: str
@@ -57,7 +78,7 @@ class DimensionIR:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SnowflakeMappingIR:
     """Normalized Snowflake mapping representation."""
     database: str
@@ -66,9 +87,19 @@ class SnowflakeMappingIR:
     table_mappings: Dict[str, str] = field(default_factory=dict)  # object_name -> table_name
 
 
-@dataclass
+# ODLIR collections that get a cached name index and fingerprint
+_INDEXED_COLLECTIONS = ("objects", "relationships", "metrics", "dimensions")
+
+
+@dataclass(slots=True)
 class ODLIR:
-    """Normalized ODL Intermediate Representation."""
+    """
+    Normalized ODL Intermediate Representation.
+    
+    Name indexes (`objects_by_name`, ...) and collection fingerprints are
+    built on first use and rebuilt when the collection is reassigned or changes
+    length; replacing or editing elements in place needs `invalidate_indexes()`.
+    """
     version: str
     name: Optional[str] = None
     description: Optional[str] = None
@@ -77,3 +108,93 @@ class ODLIR:
     metrics: List[MetricIR] = field(default_factory=list)
     dimensions: List[DimensionIR] = field(default_factory=list)
     snowflake: Optional[SnowflakeMappingIR] = None
+    # collection -> (source list, its length, index)
+    _indexes: Dict[str, Tuple[List[Any], int, Dict[str, Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # collection -> (source list, its length, digest)
+    _fingerprints: Dict[str, Tuple[List[Any], int, bytes]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def invalidate_indexes(self) -> None:
+        """Drop cached name indexes and fingerprints after in-place mutation."""
+        self._indexes.clear()
+        self._fingerprints.clear()
+        for obj in self.objects:
+            obj._properties_by_name = None
+    
+    def collection_digest(self, collection: str) -> bytes:
+        """
+        blake2b digest of one collection's content, computed now.
+        
+        The dataclass reprs list every content field in order, so the digest
+        is stable across processes.
+        
+        Args:
+            collection: One of "objects", "relationships", "metrics", "dimensions"
+        """
+        return hashlib.blake2b(repr(getattr(self, collection)).encode("utf-8"), digest_size=16).digest()
+    
+    def fingerprint(self, collection: str) -> bytes:
+        """
+        Cached `collection_digest`, computed once per collection list.
+        
+        In-place edits to elements are not seen, so differing fingerprints
+        mean the collection changed but equal ones must be confirmed with ==.
+        
+        Args:
+            collection: One of "objects", "relationships", "metrics", "dimensions"
+        """
+        items = getattr(self, collection)
+        cached = self._fingerprints.get(collection)
+        if cached is not None and cached[0] is items and cached[1] == len(items):
+            return cached[2]
+        digest = self.collection_digest(collection)
+        self._fingerprints[collection] = (items, len(items), digest)
+        return digest
+    
+    def content_key(self) -> Tuple[Any, ...]:
+        """
+        Hashable key of the whole IR content.
+        
+        Equal keys mean equal input to the compiler, so compiled output can be
+        reused. Digests are recomputed on every call so in-place edits are seen.
+        """
+        return (
+            self.version,
+            self.name,
+            self.description,
+            repr(self.snowflake),
+            tuple(self.collection_digest(c) for c in _INDEXED_COLLECTIONS)
+        )
+    
+    def _index(self, collection: str) -> Dict[str, Any]:
+        """Get (building if needed) the name index for a collection."""
+        items = getattr(self, collection)
+        cached = self._indexes.get(collection)
+        if cached is not None and cached[0] is items and cached[1] == len(items):
+            return cached[2]
+        index = {item.name: item for item in items}
+        self._indexes[collection] = (items, len(items), index)
+        return index
+    
+    @property
+    def objects_by_name(self) -> Dict[str, ObjectIR]:
+        """Objects keyed by name."""
+        return self._index("objects")
+    
+    @property
+    def relationships_by_name(self) -> Dict[str, RelationshipIR]:
+        """Relationships keyed by name."""
+        return self._index("relationships")
+    
+    @property
+    def metrics_by_name(self) -> Dict[str, MetricIR]:
+        """Metrics keyed by name."""
+        return self._index("metrics")
+    
+    @property
+    def dimensions_by_name(self) -> Dict[str, DimensionIR]:
+        """Dimensions keyed by name."""
+        return self._index("dimensions")
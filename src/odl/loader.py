@@ -1,8 +1,12 @@
 """ODL JSON loader."""
 
 import json
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Union
+from typing import Dict, Any, List, Optional, Sequence, Union
 
 try:
     from loguru import logger
@@ -10,24 +14,83 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+from .ir import ODLIR
+from .normalizer import ODLNormalizer
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# Files at least this large are memory-mapped rather than read into a bytes
+# copy. Only done when the parser accepts buffers (stdlib json does not).
+_MMAP_MIN_BYTES = 1 << 20
+
+# Below this size orjson beats simdjson, whose per-document setup and
+# native-object materialization dominate on small inputs
+_SIMDJSON_MIN_BYTES = 64 * 1024
+
+# simdjson parsers keep their tape/index buffers between parses, but a
+# single parser must not be shared across threads
+_parser_local = threading.local()
+
+
+def _get_parser() -> "simdjson.Parser":
+    """Get this thread's reusable simdjson parser."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = simdjson.Parser()
+        _parser_local.parser = parser
+    return parser
+
+
+def _parse_json(buf: Union[bytes, memoryview]) -> Any:
+    """
+    Parse UTF-8 JSON bytes into plain Python objects.
+    
+    Args:
+        buf: UTF-8 encoded JSON document (bytes, or a memoryview when
+            SIMDJSON_AVAILABLE or ORJSON_AVAILABLE)
+        
+    Returns:
+        Parsed document
+    """
+    if SIMDJSON_AVAILABLE and (len(buf) >= _SIMDJSON_MIN_BYTES or not ORJSON_AVAILABLE):
+        # recursive=True materializes dicts/lists, so nothing keeps a
+        # reference into the parser's buffers once we return
+        return _get_parser().parse(buf, recursive=True)
+    return _json_loads(buf)
+
 
 class ODLLoader:
     """Loads ODL JSON files."""
     
     @staticmethod
-    def load(file_path: Union[str, Path]) -> Dict[str, Any]:
+    def load(file_path: Union[str, Path], lazy: bool = False) -> Dict[str, Any]:
         """
         Load ODL JSON file.
         
         Args:
             file_path: Path to ODL JSON file
+            lazy: Return a read-only simdjson document (when available) whose
+                values are materialized only as they are accessed. Suitable
+                for ODLNormalizer, which only walks the document once.
             
         Returns:
-            Parsed ODL dictionary
+            Parsed ODL dictionary, or a dict-like simdjson.Object if lazy
             
         Raises:
             FileNotFoundError: If file doesn't exist
-            json.JSONDecodeError: If file is not valid JSON
+            ValueError: If file is not valid JSON
         """
         path = Path(file_path)
         
@@ -36,13 +99,80 @@ class ODLLoader:
         
         logger.info(f"Loading ODL file: {file_path}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            odl_data = json.load(f)
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= _MMAP_MIN_BYTES and (SIMDJSON_AVAILABLE or ORJSON_AVAILABLE):
+                # Parse straight from the page cache; both parsers copy what
+                # they keep, so the mapping can be closed afterwards
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as view:
+                        odl_data = ODLLoader._parse_document(view, lazy)
+            else:
+                odl_data = ODLLoader._parse_document(f.read(), lazy)
         
         logger.info(f"Loaded ODL: {odl_data.get('name', 'unnamed')} (version {odl_data.get('version', 'unknown')})")
         
         return odl_data
     
+    @staticmethod
+    def load_and_normalize(
+        file_path: Union[str, Path],
+        normalizer: Optional[ODLNormalizer] = None
+    ) -> ODLIR:
+        """
+        Load an ODL JSON file straight into its normalized IR, without validation.
+        
+        With simdjson available the normalizer walks the lazy document, so no
+        intermediate dict/list tree is built for the whole file.
+        
+        Args:
+            file_path: Path to ODL JSON file
+            normalizer: Normalizer to use (defaults to a new ODLNormalizer)
+            
+        Returns:
+            Normalized ODLIR
+        """
+        odl_data = ODLLoader.load(file_path, lazy=True)
+        return (normalizer or ODLNormalizer()).normalize(odl_data)
+    
+    @staticmethod
+    def load_many(
+        file_paths: Sequence[Union[str, Path]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Load several ODL JSON files, overlapping their reads.
+        
+        File reads release the GIL, so a thread pool keeps several page-cache
+        misses in flight; each thread parses with its own parser.
+        
+        Args:
+            file_paths: Paths to ODL JSON files
+            max_workers: Number of reader threads (defaults to min(32, len(file_paths)))
+            
+        Returns:
+            Parsed ODL dictionaries, in input order
+            
+        Raises:
+            FileNotFoundError: If any file doesn't exist
+            ValueError: If any file is not valid JSON
+        """
+        if len(file_paths) <= 1:
+            return [ODLLoader.load(file_path) for file_path in file_paths]
+        
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(file_paths))) as executor:
+            return list(executor.map(ODLLoader.load, file_paths))
+    
+    @staticmethod
+    def _parse_document(buf: Union[bytes, memoryview], lazy: bool) -> Any:
+        """Parse a document read by load."""
+        if lazy and SIMDJSON_AVAILABLE:
+            # The proxy pins its parser's document, so it gets its own parser
+            return simdjson.Parser().parse(buf)
+        return _parse_json(buf)
+    
     @staticmethod
     def load_from_string(json_string: str) -> Dict[str, Any]:
         """
@@ -55,6 +185,6 @@ class ODLLoader:
             Parsed ODL dictionary
             
         Raises:
-            json.JSONDecodeError: If string is not valid JSON
+            ValueError: If string is not valid JSON
         """
-        return json.loads(json_string)
+        return _parse_json(json_string.encode('utf-8'))
@@ -1,5 +1,7 @@
 """ODL normalizer - converts ODL to stable internal representation."""
 
+import sys
+from operator import itemgetter
 from typing import Dict, Any, List
 
 try:
@@ -13,6 +15,20 @@ from .ir import (
     SnowflakeMappingIR
 )
 
+def _intern(value: Any) -> Any:
+    """Intern strings; other values (invalid ODL, still normalized for debugging) pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Records are sorted by their raw name before IR construction
+_by_name = itemgetter("name")
+
+# Required fields of each record, fetched in one C-level call
+_property_fields = itemgetter("name", "type")
+_relationship_fields = itemgetter("name", "from", "to")
+_metric_fields = itemgetter("name", "expression")
+_dimension_fields = itemgetter("name", "sourceProperty")
+
 
 class ODLNormalizer:
     """Normalizes ODL to stable internal representation."""
@@ -22,7 +38,8 @@ class ODLNormalizer:
         Normalize ODL data to internal representation.
         
         Args:
-            odl_data: ODL dictionary
+            odl_data: ODL dictionary, or a lazy document from
+                ODLLoader.load(..., lazy=True)
             
         Returns:
             Normalized ODLIR
@@ -31,19 +48,15 @@ class ODLNormalizer:
         
         # Normalize objects (sorted by name)
         objects = self._normalize_objects(odl_data.get("objects", []))
-        objects.sort(key=lambda o: o.name)
         
         # Normalize relationships (sorted by name)
         relationships = self._normalize_relationships(odl_data.get("relationships", []))
-        relationships.sort(key=lambda r: r.name)
         
         # Normalize metrics (sorted by name)
         metrics = self._normalize_metrics(odl_data.get("metrics", []))
-        metrics.sort(key=lambda m: m.name)
         
         # Normalize dimensions (sorted by name)
         dimensions = self._normalize_dimensions(odl_data.get("dimensions", []))
-        dimensions.sort(key=lambda d: d.name)
         
         # Normalize Snowflake mapping
         snowflake = None
@@ -70,21 +83,22 @@ class ODLNormalizer:
         return ir
     
     def _normalize_objects(self, objects: List[Dict[str, Any]]) -> List[ObjectIR]:
-        """Normalize objects."""
+        """Normalize objects, in name order."""
         normalized = []
         
-        for obj in objects:
+        for obj in sorted(objects, key=_by_name):
             # Normalize properties (sorted by name)
             properties = self._normalize_properties(obj.get("properties", []))
-            properties.sort(key=lambda p: p.name)
             
             # Get Snowflake mapping
             snowflake_obj = obj.get("snowflake", {})
             
+            # Names are interned: they recur as diff element names, relationship
+            # ends, join keys, grains and dimension sources
             normalized_obj = ObjectIR(
-                name=obj["name"],
+                name=_intern(obj["name"]),
                 description=obj.get("description"),
-                identifiers=sorted(obj.get("identifiers", [])),  # Sorted
+                identifiers=sorted(map(_intern, obj.get("identifiers", []))),  # Sorted
                 properties=properties,
                 snowflake_table=snowflake_obj.get("table"),
                 snowflake_schema=snowflake_obj.get("schema"),
@@ -95,73 +109,79 @@ class ODLNormalizer:
         return normalized
     
     def _normalize_properties(self, properties: List[Dict[str, Any]]) -> List[PropertyIR]:
-        """Normalize properties."""
+        """Normalize properties, in name order."""
         normalized = []
         
-        for prop in properties:
+        for prop in sorted(properties, key=_by_name):
+            name, prop_type = _property_fields(prop)
+            get = prop.get
             normalized_prop = PropertyIR(
-                name=prop["name"],
-                type=prop["type"],
-                description=prop.get("description"),
-                nullable=prop.get("nullable", True),
-                required=prop.get("required", False)
+                name=_intern(name),
+                type=prop_type,
+                description=get("description"),
+                nullable=get("nullable", True),
+                required=get("required", False)
             )
             normalized.append(normalized_prop)
         
         return normalized
     
     def _normalize_relationships(self, relationships: List[Dict[str, Any]]) -> List[RelationshipIR]:
-        """Normalize relationships."""
+        """Normalize relationships, in name order."""
         normalized = []
         
-        for rel in relationships:
+        for rel in sorted(relationships, key=_by_name):
+            name, from_object, to_object = _relationship_fields(rel)
+            get = rel.get
+            
             # Normalize join keys to tuples (sorted)
-            join_keys = [
-                tuple(pair) if isinstance(pair, list) and len(pair) == 2 else tuple(pair)
-                for pair in rel.get("joinKeys", [])
-            ]
+            join_keys = [tuple(map(_intern, pair)) for pair in get("joinKeys", [])]
             join_keys.sort()  # Sort for stability
             
             normalized_rel = RelationshipIR(
-                name=rel["name"],
-                from_object=rel["from"],
-                to_object=rel["to"],
+                name=_intern(name),
+                from_object=_intern(from_object),
+                to_object=_intern(to_object),
                 join_keys=join_keys,
-                cardinality=rel.get("cardinality", "many_to_one"),
-                description=rel.get("description")
+                cardinality=get("cardinality", "many_to_one"),
+                description=get("description")
             )
             normalized.append(normalized_rel)
         
         return normalized
     
     def _normalize_metrics(self, metrics: List[Dict[str, Any]]) -> List[MetricIR]:
-        """Normalize metrics."""
+        """Normalize metrics, in name order."""
         normalized = []
         
-        for metric in metrics:
+        for metric in sorted(metrics, key=_by_name):
+            name, expression = _metric_fields(metric)
+            get = metric.get
+            
             # Normalize grain (sorted)
-            grain = sorted(metric.get("grain", []))
+            grain = sorted(map(_intern, get("grain", [])))
             
             normalized_metric = MetricIR(
-                name=metric["name"],
-                expression=metric["expression"],
+                name=_intern(name),
+                expression=expression,
                 grain=grain,
-                type=metric.get("type", "custom"),
-                format=metric.get("format"),
-                description=metric.get("description")
+                type=get("type", "custom"),
+                format=get("format"),
+                description=get("description")
             )
             normalized.append(normalized_metric)
         
         return normalized
     
     def _normalize_dimensions(self, dimensions: List[Dict[str, Any]]) -> List[DimensionIR]:
-        """Normalize dimensions."""
+        """Normalize dimensions, in name order."""
         normalized = []
         
-        for dim in dimensions:
+        for dim in sorted(dimensions, key=_by_name):
+            name, source_property = _dimension_fields(dim)
             normalized_dim = DimensionIR(
-                name=dim["name"],
-                source_property=dim["sourceProperty"],
+                name=_intern(name),
+                source_property=_intern(source_property),
                 type=dim.get("type", "categorical"),
                 description=dim.get("description")
             )
@@ -176,7 +196,7 @@ class ODLNormalizer:
     ) -> SnowflakeMappingIR:
         """Normalize Snowflake mapping."""
         # Build table mappings from objects if not explicitly provided
-        table_mappings = snowflake.get("tableMappings", {}).copy()
+        table_mappings = dict(snowflake.get("tableMappings", {}))
         
         # Add per-object table mappings
         for obj in objects:
@@ -184,7 +204,7 @@ class ODLNormalizer:
                 table_mappings[obj.name] = obj.snowflake_table
         
         # Sort table mappings for stability
-        sorted_mappings = dict(sorted(table_mappings.items()))
+        sorted_mappings = {name: table_mappings[name] for name in sorted(table_mappings)}
         
         return SnowflakeMappingIR(
             database=snowflake["database"],
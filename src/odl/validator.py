@@ -1,6 +1,7 @@
 """ODL validator with actionable error messages."""
 
-from typing import Dict, Any, List, Optional, Tuple
+from collections import Counter
+from typing import Dict, Any, FrozenSet, Iterable, List, Optional, Tuple
 from pathlib import Path
 import json
 
@@ -41,6 +42,7 @@ class ODLValidator:
         """
         self.schema_path = schema_path or Path(__file__).parent.parent.parent / "odl" / "schema" / "odl.schema.json"
         self.errors: List[ODLValidationError] = []
+        self._sorted_names: Dict[str, List[str]] = {}
     
     def validate(self, odl_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -53,6 +55,7 @@ class ODLValidator:
             Tuple of (is_valid, list_of_error_messages)
         """
         self.errors = []
+        self._sorted_names = {}
         
         # Basic structure validation
         self._validate_structure(odl_data)
@@ -76,6 +79,19 @@ class ODLValidator:
         
         return is_valid, error_messages
     
+    def _available(self, label: str, names: Iterable[str]) -> List[str]:
+        """
+        Sorted names for "Available ..." error hints, computed once per validation.
+        
+        Args:
+            label: Cache key identifying the name collection
+            names: Names to sort on first use
+        """
+        available = self._sorted_names.get(label)
+        if available is None:
+            available = self._sorted_names[label] = sorted(names)
+        return available
+    
     def _validate_structure(self, odl_data: Dict[str, Any]) -> None:
         """Validate basic structure."""
         if "version" not in odl_data:
@@ -84,6 +100,12 @@ class ODLValidator:
                 path="version"
             ))
         
+        objects = odl_data.get("objects")
+        if not isinstance(objects, list) or not objects:
+            self._report_objects_error(odl_data)
+    
+    def _report_objects_error(self, odl_data: Dict[str, Any]) -> None:
+        """Report why the 'objects' field is missing, malformed or empty."""
         if "objects" not in odl_data:
             self.errors.append(ODLValidationError(
                 "Missing required field: 'objects'",
@@ -95,7 +117,7 @@ class ODLValidator:
                 path="objects",
                 value=type(odl_data["objects"]).__name__
             ))
-        elif len(odl_data["objects"]) == 0:
+        else:
             self.errors.append(ODLValidationError(
                 "Field 'objects' cannot be empty",
                 path="objects"
@@ -114,98 +136,88 @@ class ODLValidator:
             
             from_obj = rel["from"]
             to_obj = rel["to"]
-            
             if from_obj not in object_names:
-                self.errors.append(ODLValidationError(
-                    f"Relationship '{rel.get('name', f'#{i}')}' references unknown object '{from_obj}' in 'from' field. "
-                    f"Available objects: {sorted(object_names)}",
-                    path=f"relationships[{i}].from",
-                    value=from_obj
-                ))
-            
+                self._unknown_object(
+                    "Relationship", rel, i, from_obj, "'from' field", object_names,
+                    f"relationships[{i}].from", from_obj
+                )
             if to_obj not in object_names:
-                self.errors.append(ODLValidationError(
-                    f"Relationship '{rel.get('name', f'#{i}')}' references unknown object '{to_obj}' in 'to' field. "
-                    f"Available objects: {sorted(object_names)}",
-                    path=f"relationships[{i}].to",
-                    value=to_obj
-                ))
+                self._unknown_object(
+                    "Relationship", rel, i, to_obj, "'to' field", object_names,
+                    f"relationships[{i}].to", to_obj
+                )
         
         # Validate metric grain references
         metrics = odl_data.get("metrics", [])
         for i, metric in enumerate(metrics):
             grain = metric.get("grain", [])
-            if not isinstance(grain, list):
+            if not isinstance(grain, list) or object_names.issuperset(grain):
                 continue
             
             for j, grain_obj in enumerate(grain):
                 if grain_obj not in object_names:
-                    self.errors.append(ODLValidationError(
-                        f"Metric '{metric.get('name', f'#{i}')}' references unknown object '{grain_obj}' in grain. "
-                        f"Available objects: {sorted(object_names)}",
-                        path=f"metrics[{i}].grain[{j}]",
-                        value=grain_obj
-                    ))
+                    self._unknown_object(
+                        "Metric", metric, i, grain_obj, "grain", object_names,
+                        f"metrics[{i}].grain[{j}]", grain_obj
+                    )
         
         # Validate dimension sourceProperty references
         dimensions = odl_data.get("dimensions", [])
         for i, dim in enumerate(dimensions):
             source_prop = dim.get("sourceProperty", "")
-            if "." not in source_prop:
+            obj_name, sep, _ = source_prop.partition(".")
+            if not sep:
                 self.errors.append(ODLValidationError(
                     f"Dimension '{dim.get('name', f'#{i}')}' has invalid sourceProperty format '{source_prop}'. "
                     f"Expected format: 'Object.property'",
                     path=f"dimensions[{i}].sourceProperty",
                     value=source_prop
                 ))
-                continue
-            
-            obj_name, prop_name = source_prop.split(".", 1)
-            if obj_name not in object_names:
-                self.errors.append(ODLValidationError(
-                    f"Dimension '{dim.get('name', f'#{i}')}' references unknown object '{obj_name}' in sourceProperty. "
-                    f"Available objects: {sorted(object_names)}",
-                    path=f"dimensions[{i}].sourceProperty",
-                    value=source_prop
-                ))
+            elif obj_name not in object_names:
+                self._unknown_object(
+                    "Dimension", dim, i, obj_name, "sourceProperty", object_names,
+                    f"dimensions[{i}].sourceProperty", source_prop
+                )
+    
+    def _unknown_object(
+        self,
+        kind: str,
+        record: Dict[str, Any],
+        index: int,
+        obj_name: Any,
+        where: str,
+        object_names: Iterable[str],
+        path: str,
+        value: Any
+    ) -> None:
+        """
+        Report a reference to an unknown object.
+        
+        Message formatting lives here so the reference loops stay free of
+        string work while every reference resolves.
+        
+        Args:
+            kind: Referencing record kind (e.g. "Metric")
+            record: Referencing record
+            index: Record index within its section
+            obj_name: Unresolved object name
+            where: Field holding the reference, as shown in the message
+            object_names: Known object names
+            path: Error path
+            value: Offending value
+        """
+        self.errors.append(ODLValidationError(
+            f"{kind} '{record.get('name', f'#{index}')}' references unknown object '{obj_name}' in {where}. "
+            f"Available objects: {self._available('objects', object_names)}",
+            path=path,
+            value=value
+        ))
     
     def _validate_business_rules(self, odl_data: Dict[str, Any]) -> None:
         """Validate business rules (duplicates, invalid values, etc.)."""
-        # Check for duplicate metric names
-        metrics = odl_data.get("metrics", [])
-        metric_names = {}
-        for i, metric in enumerate(metrics):
-            name = metric.get("name")
-            if not name:
-                continue
-            
-            if name in metric_names:
-                self.errors.append(ODLValidationError(
-                    f"Duplicate metric name '{name}' found at metrics[{i}]. "
-                    f"First occurrence at metrics[{metric_names[name]}]",
-                    path=f"metrics[{i}].name",
-                    value=name
-                ))
-            else:
-                metric_names[name] = i
-        
-        # Check for duplicate object names
-        objects = odl_data.get("objects", [])
-        object_names = {}
-        for i, obj in enumerate(objects):
-            name = obj.get("name")
-            if not name:
-                continue
-            
-            if name in object_names:
-                self.errors.append(ODLValidationError(
-                    f"Duplicate object name '{name}' found at objects[{i}]. "
-                    f"First occurrence at objects[{object_names[name]}]",
-                    path=f"objects[{i}].name",
-                    value=name
-                ))
-            else:
-                object_names[name] = i
+        # Check for duplicate metric and object names
+        self._check_duplicate_names("metric", "metrics", odl_data.get("metrics", []))
+        self._check_duplicate_names("object", "objects", odl_data.get("objects", []))
         
         # Validate relationship cardinality
         relationships = odl_data.get("relationships", [])
@@ -215,11 +227,44 @@ class ODLValidator:
             if cardinality not in valid_cardinalities:
                 self.errors.append(ODLValidationError(
                     f"Relationship '{rel.get('name', f'#{i}')}' has invalid cardinality '{cardinality}'. "
-                    f"Valid values: {sorted(valid_cardinalities)}",
+                    f"Valid values: {self._available('cardinalities', valid_cardinalities)}",
                     path=f"relationships[{i}].cardinality",
                     value=cardinality
                 ))
     
+    def _check_duplicate_names(self, kind: str, field: str, records: List[Dict[str, Any]]) -> None:
+        """
+        Report records whose name repeats an earlier record's name.
+        
+        Args:
+            kind: Record kind used in messages (e.g. "metric")
+            field: Top-level ODL field holding the records (e.g. "metrics")
+            records: Records to check
+        """
+        names = [record.get("name") for record in records]
+        counts = Counter(names)
+        if len(counts) == len(names):
+            return
+        
+        duplicates = {name for name, count in counts.items() if count > 1 and name}
+        if not duplicates:
+            return
+        
+        first_seen: Dict[str, int] = {}
+        for i, name in enumerate(names):
+            if name not in duplicates:
+                continue
+            
+            if name in first_seen:
+                self.errors.append(ODLValidationError(
+                    f"Duplicate {kind} name '{name}' found at {field}[{i}]. "
+                    f"First occurrence at {field}[{first_seen[name]}]",
+                    path=f"{field}[{i}].name",
+                    value=name
+                ))
+            else:
+                first_seen[name] = i
+    
     def _validate_snowflake_mapping(self, odl_data: Dict[str, Any]) -> None:
         """Validate Snowflake mapping and join keys."""
         snowflake = odl_data.get("snowflake")
@@ -229,18 +274,18 @@ class ODLValidator:
         objects = odl_data.get("objects", [])
         relationships = odl_data.get("relationships", [])
         
-        # Build object property map
-        object_properties: Dict[str, Dict[str, Any]] = {}
+        # Build object property name sets
+        object_properties: Dict[str, FrozenSet[str]] = {}
         for obj in objects:
             obj_name = obj.get("name")
             if not obj_name:
                 continue
             
-            object_properties[obj_name] = {
-                prop.get("name"): prop
+            object_properties[obj_name] = frozenset(
+                prop.get("name")
                 for prop in obj.get("properties", [])
                 if prop.get("name")
-            }
+            )
         
         # Validate relationship join keys exist in mapped objects
         for i, rel in enumerate(relationships):
@@ -251,6 +296,19 @@ class ODLValidator:
             if not from_obj or not to_obj:
                 continue
             
+            # Common case: both objects are mapped and every key is present,
+            # checked with one set comparison per side
+            pairs = [pair for pair in join_keys if isinstance(pair, list) and len(pair) == 2]
+            from_props = object_properties.get(from_obj)
+            to_props = object_properties.get(to_obj)
+            if (
+                from_props is not None
+                and to_props is not None
+                and from_props.issuperset([pair[0] for pair in pairs])
+                and to_props.issuperset([pair[1] for pair in pairs])
+            ):
+                continue
+            
             for j, join_key_pair in enumerate(join_keys):
                 if not isinstance(join_key_pair, list) or len(join_key_pair) != 2:
                     continue
@@ -261,12 +319,12 @@ class ODLValidator:
                 if from_obj not in object_properties:
                     self.errors.append(ODLValidationError(
                         f"Relationship '{rel.get('name', f'#{i}')}' join key references unknown object '{from_obj}'. "
-                        f"Available objects: {sorted(object_properties.keys())}",
+                        f"Available objects: {self._available('mapped_objects', object_properties)}",
                         path=f"relationships[{i}].joinKeys[{j}][0]",
                         value=from_obj
                     ))
                 elif from_prop not in object_properties[from_obj]:
-                    available_props = sorted(object_properties[from_obj].keys())
+                    available_props = self._available(f'properties:{from_obj}', object_properties[from_obj])
                     self.errors.append(ODLValidationError(
                         f"Relationship '{rel.get('name', f'#{i}')}' join key references unknown property '{from_prop}' "
                         f"in object '{from_obj}'. Available properties: {available_props}",
@@ -278,12 +336,12 @@ class ODLValidator:
                 if to_obj not in object_properties:
                     self.errors.append(ODLValidationError(
                         f"Relationship '{rel.get('name', f'#{i}')}' join key references unknown object '{to_obj}'. "
-                        f"Available objects: {sorted(object_properties.keys())}",
+                        f"Available objects: {self._available('mapped_objects', object_properties)}",
                         path=f"relationships[{i}].joinKeys[{j}][1]",
                         value=to_obj
                     ))
                 elif to_prop not in object_properties[to_obj]:
-                    available_props = sorted(object_properties[to_obj].keys())
+                    available_props = self._available(f'properties:{to_obj}', object_properties[to_obj])
                     self.errors.append(ODLValidationError(
                         f"Relationship '{rel.get('name', f'#{i}')}' join key references unknown property '{to_prop}' "
                         f"in object '{to_obj}'. Available properties: {available_props}",
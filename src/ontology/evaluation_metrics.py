@@ -8,13 +8,95 @@ This module provides evaluation metrics for ontology quality:
 - Quality Score: Overall quality metric
 """
 
-from typing import Dict, Any, List, Optional
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Set
 from loguru import logger
 import json
 
 from .schema import OntologySchema, Entity, Relation, Property
 
 
+# Property names that indicate an entity carries basic identifying fields
+_COMMON_PROPERTIES = frozenset({"id", "name", "type", "created_at", "updated_at"})
+
+
+@dataclass(slots=True)
+class EntityStats:
+    """Entity aggregates used by the metric passes"""
+    names: List[str] = field(default_factory=list)
+    name_set: Set[str] = field(default_factory=set)
+    entities_with_properties: int = 0
+    entities_with_common_props: int = 0
+    entities_with_descriptions: int = 0
+    total_properties: int = 0
+    indexed_properties: int = 0
+    required_properties: int = 0
+    pascal_case_names: int = 0
+    camel_case_names: int = 0
+    snake_case_names: int = 0
+
+
+@dataclass(slots=True)
+class RelationStats:
+    """Relation aggregates used by the metric passes"""
+    names: List[str] = field(default_factory=list)
+    total_properties: int = 0
+    upper_case_names: int = 0
+    bidirectional: int = 0
+
+
+def _collect_entity_stats(entities: List[Entity]) -> EntityStats:
+    """Compute all entity aggregates in one pass over entities and their properties"""
+    stats = EntityStats()
+    names = stats.names
+    for entity in entities:
+        name = entity.name
+        names.append(name)
+        if "_" in name:
+            stats.snake_case_names += 1
+        elif name and name[0].isupper():
+            stats.pascal_case_names += 1
+        elif name and name[0].islower():
+            stats.camel_case_names += 1
+        
+        if entity.description:
+            stats.entities_with_descriptions += 1
+        
+        properties = entity.properties
+        if properties:
+            stats.entities_with_properties += 1
+            stats.total_properties += len(properties)
+        
+        has_common = False
+        for prop in properties:
+            if prop.indexed:
+                stats.indexed_properties += 1
+            if prop.required:
+                stats.required_properties += 1
+            if not has_common and prop.name.lower() in _COMMON_PROPERTIES:
+                has_common = True
+        if has_common:
+            stats.entities_with_common_props += 1
+    
+    stats.name_set = set(names)
+    return stats
+
+
+def _collect_relation_stats(relations: List[Relation]) -> RelationStats:
+    """Compute all relation aggregates in one pass"""
+    stats = RelationStats()
+    for relation in relations:
+        name = relation.name
+        stats.names.append(name)
+        if name.isupper() or "_" in name:
+            stats.upper_case_names += 1
+        if not relation.directed:
+            stats.bidirectional += 1
+        stats.total_properties += len(relation.properties)
+    return stats
+
+
 class OntologyEvaluator:
     """Evaluates ontology quality using multiple metrics"""
     
@@ -33,12 +115,13 @@ class OntologyEvaluator:
         Returns:
             Evaluation metrics dictionary
         """
+        ctx = self._build_context(schema)
         metrics = {
-            "completeness": self._evaluate_completeness(schema, domain_description),
-            "consistency": self._evaluate_consistency(schema),
-            "coherence": self._evaluate_coherence(schema),
-            "coverage": self._evaluate_coverage(schema),
-            "structure": self._evaluate_structure(schema),
+            "completeness": self._evaluate_completeness(schema, ctx, domain_description),
+            "consistency": self._evaluate_consistency(schema, ctx),
+            "coherence": self._evaluate_coherence(schema, ctx),
+            "coverage": self._evaluate_coverage(schema, ctx),
+            "structure": self._evaluate_structure(schema, ctx),
         }
         
         # Calculate overall quality score (weighted average)
@@ -63,7 +146,27 @@ class OntologyEvaluator:
         
         return metrics
     
-    def _evaluate_completeness(self, schema: OntologySchema, domain_description: Optional[str] = None) -> Dict[str, Any]:
+    def _build_context(self, schema: OntologySchema) -> Dict[str, Any]:
+        """
+        Collect the entity and relation aggregates shared by the metric passes
+        
+        Args:
+            schema: Ontology schema to evaluate
+        
+        Returns:
+            Context dictionary passed to each _evaluate_* method
+        """
+        return {
+            "entities": _collect_entity_stats(schema.entities),
+            "relations": _collect_relation_stats(schema.relations),
+        }
+    
+    def _evaluate_completeness(
+        self,
+        schema: OntologySchema,
+        ctx: Dict[str, Any],
+        domain_description: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Evaluate completeness: Are all important concepts covered?
         
@@ -72,19 +175,16 @@ class OntologyEvaluator:
         - Relation coverage
         - Property completeness
         """
-        entity_count = len(schema.entities)
-        relation_count = len(schema.relations)
+        entity_stats = ctx["entities"]
+        entity_count = len(entity_stats.names)
+        relation_count = len(ctx["relations"].names)
         
         # Check if entities have properties
-        entities_with_properties = sum(1 for e in schema.entities if len(e.properties) > 0)
+        entities_with_properties = entity_stats.entities_with_properties
         property_coverage = entities_with_properties / entity_count if entity_count > 0 else 0.0
         
         # Check for required properties (id, name, etc.)
-        common_properties = {"id", "name", "type", "created_at", "updated_at"}
-        entities_with_common_props = sum(
-            1 for e in schema.entities
-            if any(p.name.lower() in common_properties for p in e.properties)
-        )
+        entities_with_common_props = entity_stats.entities_with_common_props
         common_prop_coverage = entities_with_common_props / entity_count if entity_count > 0 else 0.0
         
         # Score based on various factors
@@ -110,7 +210,7 @@ class OntologyEvaluator:
             "common_property_coverage": common_prop_coverage,
         }
     
-    def _evaluate_consistency(self, schema: OntologySchema) -> Dict[str, Any]:
+    def _evaluate_consistency(self, schema: OntologySchema, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """
         Evaluate consistency: Are there logical inconsistencies?
         
@@ -124,21 +224,21 @@ class OntologyEvaluator:
         score = 1.0
         
         # Check for duplicate entity names
-        entity_names = [e.name for e in schema.entities]
-        duplicates = [name for name in entity_names if entity_names.count(name) > 1]
+        entity_names = ctx["entities"].names
+        duplicates = {name for name, count in Counter(entity_names).items() if count > 1}
         if duplicates:
-            issues.append(f"Duplicate entity names: {set(duplicates)}")
+            issues.append(f"Duplicate entity names: {duplicates}")
             score -= 0.2
         
         # Check for duplicate relation names
-        relation_names = [r.name for r in schema.relations]
-        duplicates = [name for name in relation_names if relation_names.count(name) > 1]
+        relation_names = ctx["relations"].names
+        duplicates = {name for name, count in Counter(relation_names).items() if count > 1}
         if duplicates:
-            issues.append(f"Duplicate relation names: {set(duplicates)}")
+            issues.append(f"Duplicate relation names: {duplicates}")
             score -= 0.2
         
         # Check relation source/target validity
-        valid_entity_names = {e.name for e in schema.entities}
+        valid_entity_names = ctx["entities"].name_set
         invalid_relations = []
         for relation in schema.relations:
             sources = relation.source if isinstance(relation.source, list) else [relation.source]
@@ -179,7 +279,7 @@ class OntologyEvaluator:
             "issue_count": len(issues),
         }
     
-    def _evaluate_coherence(self, schema: OntologySchema) -> Dict[str, Any]:
+    def _evaluate_coherence(self, schema: OntologySchema, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """
         Evaluate coherence: Semantic coherence and logical structure
         
@@ -189,38 +289,39 @@ class OntologyEvaluator:
         - Entity naming consistency
         """
         score = 0.0
+        entity_stats = ctx["entities"]
+        relation_stats = ctx["relations"]
         
         # Check for hierarchical relationships
         if schema.hierarchies and len(schema.hierarchies) > 0:
             score += 0.3
         
         # Check entity naming consistency (camelCase, PascalCase, etc.)
-        entity_names = [e.name for e in schema.entities]
+        entity_names = entity_stats.names
         naming_patterns = {
-            "PascalCase": sum(1 for n in entity_names if n and n[0].isupper() and "_" not in n),
-            "camelCase": sum(1 for n in entity_names if n and n[0].islower() and "_" not in n),
-            "snake_case": sum(1 for n in entity_names if "_" in n),
+            "PascalCase": entity_stats.pascal_case_names,
+            "camelCase": entity_stats.camel_case_names,
+            "snake_case": entity_stats.snake_case_names,
         }
         dominant_pattern = max(naming_patterns, key=naming_patterns.get)
         consistency = naming_patterns[dominant_pattern] / len(entity_names) if entity_names else 0.0
         score += consistency * 0.2
         
         # Check relation naming (UPPER_CASE or camelCase)
-        relation_names = [r.name for r in schema.relations]
+        relation_names = relation_stats.names
         if relation_names:
-            upper_case = sum(1 for n in relation_names if n.isupper() or "_" in n)
-            relation_consistency = upper_case / len(relation_names)
+            relation_consistency = relation_stats.upper_case_names / len(relation_names)
             score += relation_consistency * 0.2
         
         # Check for bidirectional relations where appropriate
-        bidirectional_count = sum(1 for r in schema.relations if not r.directed)
+        bidirectional_count = relation_stats.bidirectional
         if bidirectional_count > 0:
             score += min(0.1, bidirectional_count * 0.05)
         
         # Check entity descriptions
-        entities_with_descriptions = sum(1 for e in schema.entities if e.description)
+        entities_with_descriptions = entity_stats.entities_with_descriptions
         if entities_with_descriptions > 0:
-            desc_coverage = entities_with_descriptions / len(schema.entities)
+            desc_coverage = entities_with_descriptions / len(entity_names)
             score += desc_coverage * 0.2
         
         return {
@@ -230,7 +331,7 @@ class OntologyEvaluator:
             "entities_with_descriptions": entities_with_descriptions,
         }
     
-    def _evaluate_coverage(self, schema: OntologySchema) -> Dict[str, Any]:
+    def _evaluate_coverage(self, schema: OntologySchema, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """
         Evaluate coverage: How well does the schema cover the domain?
         
@@ -239,15 +340,15 @@ class OntologyEvaluator:
         - Relation type diversity
         - Property richness
         """
-        entity_count = len(schema.entities)
-        relation_count = len(schema.relations)
+        entity_count = len(ctx["entities"].names)
+        relation_count = len(ctx["relations"].names)
         
         # Average properties per entity
-        total_properties = sum(len(e.properties) for e in schema.entities)
+        total_properties = ctx["entities"].total_properties
         avg_properties_per_entity = total_properties / entity_count if entity_count > 0 else 0.0
         
         # Average properties per relation
-        total_relation_props = sum(len(r.properties) for r in schema.relations)
+        total_relation_props = ctx["relations"].total_properties
         avg_properties_per_relation = total_relation_props / relation_count if relation_count > 0 else 0.0
         
         # Score based on coverage
@@ -282,7 +383,7 @@ class OntologyEvaluator:
             "avg_properties_per_relation": avg_properties_per_relation,
         }
     
-    def _evaluate_structure(self, schema: OntologySchema) -> Dict[str, Any]:
+    def _evaluate_structure(self, schema: OntologySchema, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """
         Evaluate structure: Schema organization and structure quality
         
@@ -294,19 +395,14 @@ class OntologyEvaluator:
         score = 0.0
         
         # Check for indexed properties (important for query performance)
-        total_properties = sum(len(e.properties) for e in schema.entities)
-        indexed_properties = sum(
-            sum(1 for p in e.properties if p.indexed)
-            for e in schema.entities
-        )
+        entity_stats = ctx["entities"]
+        total_properties = entity_stats.total_properties
+        indexed_properties = entity_stats.indexed_properties
         indexing_rate = indexed_properties / total_properties if total_properties > 0 else 0.0
         score += indexing_rate * 0.3
         
         # Check for required properties
-        required_properties = sum(
-            sum(1 for p in e.properties if p.required)
-            for e in schema.entities
-        )
+        required_properties = entity_stats.required_properties
         required_rate = required_properties / total_properties if total_properties > 0 else 0.0
         score += required_rate * 0.3
         
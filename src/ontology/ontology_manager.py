@@ -1,13 +1,51 @@
 """Ontology manager for schema loading and validation"""
 
+import re
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from loguru import logger
 
 from .schema import OntologySchema, Entity, Relation, Property, Constraint
 
 
+# Python types accepted for each schema property type
+_PYTHON_TYPES = {
+    "string": str,
+    "integer": int,
+    "float": float,
+    "boolean": bool,
+    "text": str,
+    "date": str,  # Could be more strict
+    "datetime": str,
+}
+
+# (name, required, python_type or None, schema type) per property definition
+_PropertyCheck = Tuple[str, bool, Optional[type], str]
+
+
+def _property_checks(prop_defs: List[Property]) -> List[_PropertyCheck]:
+    """Precompute the per-property checks for a list of property definitions"""
+    return [
+        (prop_def.name, prop_def.required, _PYTHON_TYPES.get(prop_def.type), prop_def.type)
+        for prop_def in prop_defs
+    ]
+
+
+def _check_properties(checks: List[_PropertyCheck], properties: Dict[str, Any], errors: List[str]) -> None:
+    """Append missing-required and wrong-type errors for properties"""
+    for name, required, python_type, type_name in checks:
+        if name in properties:
+            value = properties[name]
+            if python_type is not None and not isinstance(value, python_type):
+                errors.append(
+                    f"Property {name} has wrong type. "
+                    f"Expected {type_name}, got {type(value).__name__}"
+                )
+        elif required:
+            errors.append(f"Missing required property: {name}")
+
+
 class OntologyManager:
     """Manages ontology schema and validation"""
     
@@ -21,9 +59,24 @@ class OntologyManager:
         """
         self.schema_path = Path(schema_path)
         self.strict_mode = strict_mode
-        self.schema: Optional[OntologySchema] = None
+        self.schema = None
         self._load_schema()
     
+    @property
+    def schema(self) -> Optional[OntologySchema]:
+        """Current schema; assigning a new one drops the cached validators"""
+        return self._schema
+    
+    @schema.setter
+    def schema(self, schema: Optional[OntologySchema]) -> None:
+        self._schema = schema
+        self.invalidate_validators()
+    
+    def invalidate_validators(self) -> None:
+        """Drop validators built from the schema, e.g. after mutating it in place"""
+        self._entity_validators: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {}
+        self._relation_validators: Dict[str, Callable[[str, str, Dict[str, Any]], List[str]]] = {}
+    
     def _load_schema(self) -> None:
         """Load ontology schema from YAML file"""
         if not self.schema_path.exists():
@@ -98,35 +151,16 @@ class OntologyManager:
         if not self.schema:
             return True, []
         
-        entity_def = self.schema.get_entity(entity_type)
-        if not entity_def:
-            if self.strict_mode:
-                return False, [f"Unknown entity type: {entity_type}"]
-            return True, []  # Allow custom entities in non-strict mode
-        
-        errors = []
-        
-        # Check required properties
-        for prop_def in entity_def.properties:
-            if prop_def.required and prop_def.name not in properties:
-                errors.append(f"Missing required property: {prop_def.name}")
-            
-            # Type validation
-            if prop_def.name in properties:
-                value = properties[prop_def.name]
-                if not self._validate_property_type(value, prop_def.type):
-                    errors.append(
-                        f"Property {prop_def.name} has wrong type. "
-                        f"Expected {prop_def.type}, got {type(value).__name__}"
-                    )
-        
-        # Check constraints
-        for constraint in self.schema.constraints:
-            if constraint.entity == entity_type and constraint.property in properties:
-                error = self._validate_constraint(constraint, properties[constraint.property])
-                if error:
-                    errors.append(error)
+        validator = self._entity_validators.get(entity_type)
+        if validator is None:
+            entity_def = self.schema.get_entity(entity_type)
+            if not entity_def:
+                if self.strict_mode:
+                    return False, [f"Unknown entity type: {entity_type}"]
+                return True, []  # Allow custom entities in non-strict mode
+            validator = self._entity_validators[entity_type] = self._build_entity_validator(entity_def)
         
+        errors = validator(properties)
         return len(errors) == 0, errors
     
     def validate_relation(
@@ -151,66 +185,111 @@ class OntologyManager:
         if not self.schema:
             return True, []
         
-        relation_def = self.schema.get_relation(relation_type)
-        if not relation_def:
-            if self.strict_mode:
-                return False, [f"Unknown relation type: {relation_type}"]
-            return True, []
+        validator = self._relation_validators.get(relation_type)
+        if validator is None:
+            relation_def = self.schema.get_relation(relation_type)
+            if not relation_def:
+                if self.strict_mode:
+                    return False, [f"Unknown relation type: {relation_type}"]
+                return True, []
+            validator = self._relation_validators[relation_type] = self._build_relation_validator(relation_def)
         
-        errors = []
-        properties = properties or {}
+        errors = validator(source_type, target_type, properties or {})
+        return len(errors) == 0, errors
+    
+    def _build_entity_validator(self, entity_def: Entity) -> Callable[[Dict[str, Any]], List[str]]:
+        """
+        Build a validator for one entity type
         
-        # Check source type
-        allowed_sources = self.schema.get_allowed_source_types(relation_type)
-        if source_type not in allowed_sources:
-            errors.append(
-                f"Source type {source_type} not allowed for relation {relation_type}. "
-                f"Allowed: {allowed_sources}"
-            )
+        Property checks and the entity's constraints are resolved once, so
+        validating a record only does dict lookups and isinstance checks.
+        
+        Args:
+            entity_def: Entity definition
+            
+        Returns:
+            Function mapping entity properties to a list of errors
+        """
+        checks = _property_checks(entity_def.properties)
+        constraints = [
+            (constraint, self._compile_pattern(constraint))
+            for constraint in self.schema.get_constraints(entity_def.name)
+        ]
+        validate_constraint = self._validate_constraint
+        
+        def validate(properties: Dict[str, Any]) -> List[str]:
+            errors: List[str] = []
+            _check_properties(checks, properties, errors)
+            for constraint, pattern in constraints:
+                if constraint.property in properties:
+                    error = validate_constraint(constraint, properties[constraint.property], pattern)
+                    if error:
+                        errors.append(error)
+            return errors
+        
+        return validate
+    
+    def _build_relation_validator(
+        self,
+        relation_def: Relation
+    ) -> Callable[[str, str, Dict[str, Any]], List[str]]:
+        """
+        Build a validator for one relation type
         
-        # Check target type
+        Args:
+            relation_def: Relation definition
+            
+        Returns:
+            Function mapping (source_type, target_type, properties) to a list of errors
+        """
+        relation_type = relation_def.name
+        allowed_sources = self.schema.get_allowed_source_types(relation_type)
         allowed_targets = self.schema.get_allowed_target_types(relation_type)
-        if target_type not in allowed_targets:
-            errors.append(
-                f"Target type {target_type} not allowed for relation {relation_type}. "
-                f"Allowed: {allowed_targets}"
-            )
+        allowed_source_set = frozenset(allowed_sources)
+        allowed_target_set = frozenset(allowed_targets)
+        checks = _property_checks(relation_def.properties)
         
-        # Validate relation properties
-        for prop_def in relation_def.properties:
-            if prop_def.required and prop_def.name not in properties:
-                errors.append(f"Missing required property: {prop_def.name}")
+        def validate(source_type: str, target_type: str, properties: Dict[str, Any]) -> List[str]:
+            errors: List[str] = []
+            
+            # Check source type
+            if source_type not in allowed_source_set:
+                errors.append(
+                    f"Source type {source_type} not allowed for relation {relation_type}. "
+                    f"Allowed: {allowed_sources}"
+                )
+            
+            # Check target type
+            if target_type not in allowed_target_set:
+                errors.append(
+                    f"Target type {target_type} not allowed for relation {relation_type}. "
+                    f"Allowed: {allowed_targets}"
+                )
             
-            if prop_def.name in properties:
-                value = properties[prop_def.name]
-                if not self._validate_property_type(value, prop_def.type):
-                    errors.append(
-                        f"Property {prop_def.name} has wrong type. "
-                        f"Expected {prop_def.type}, got {type(value).__name__}"
-                    )
+            # Validate relation properties
+            _check_properties(checks, properties, errors)
+            return errors
         
-        return len(errors) == 0, errors
+        return validate
     
-    def _validate_property_type(self, value: Any, expected_type: str) -> bool:
-        """Validate property value type"""
-        type_mapping = {
-            "string": str,
-            "integer": int,
-            "float": float,
-            "boolean": bool,
-            "text": str,
-            "date": str,  # Could be more strict
-            "datetime": str,
-        }
-        
-        expected_python_type = type_mapping.get(expected_type)
-        if expected_python_type is None:
-            return True  # Unknown type, allow it
-        
-        return isinstance(value, expected_python_type)
+    @staticmethod
+    def _compile_pattern(constraint: Constraint) -> Optional[re.Pattern]:
+        """Compile a pattern constraint's regex, or None if not applicable"""
+        if constraint.type != "pattern" or not constraint.pattern:
+            return None
+        try:
+            return re.compile(constraint.pattern)
+        except re.error:
+            # Leave it to _validate_constraint, which raises when a value is checked
+            return None
     
-    def _validate_constraint(self, constraint: Constraint, value: Any) -> Optional[str]:
-        """Validate constraint"""
+    def _validate_constraint(
+        self,
+        constraint: Constraint,
+        value: Any,
+        pattern: Optional[re.Pattern] = None
+    ) -> Optional[str]:
+        """Validate constraint, using pattern if precompiled"""
         if constraint.type == "unique":
             # This would need to check against existing entities
             return None  # Deferred to graph store
@@ -224,8 +303,8 @@ class OntologyManager:
         
         elif constraint.type == "pattern":
             if constraint.pattern and isinstance(value, str):
-                import re
-                if not re.match(constraint.pattern, value):
+                matched = pattern.match(value) if pattern is not None else re.match(constraint.pattern, value)
+                if not matched:
                     return f"Value {value} does not match pattern {constraint.pattern}"
         
         return None
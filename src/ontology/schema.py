@@ -1,7 +1,7 @@
 """Ontology schema definitions"""
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class Property(BaseModel):
@@ -44,26 +44,53 @@ class Constraint(BaseModel):
 
 
 class OntologySchema(BaseModel):
-    """Complete ontology schema"""
+    """
+    Complete ontology schema
+    
+    Lookup indexes are built on first use and rebuilt once a list is
+    replaced (including via `model_copy(update=...)`); lists mutated in
+    place need `invalidate_indexes()`.
+    """
     version: str = "1.0.0"
     entities: List[Entity] = Field(default_factory=list)
     relations: List[Relation] = Field(default_factory=list)
     hierarchies: List[Dict[str, Any]] = Field(default_factory=list)
     constraints: List[Constraint] = Field(default_factory=list)
+    # field name -> (source list, index); the index is reused only while that list is current
+    _indexes: Dict[str, Tuple[List[Any], Dict[str, Any]]] = PrivateAttr(default_factory=dict)
+    
+    def invalidate_indexes(self) -> None:
+        """Drop cached lookup indexes after in-place mutation"""
+        self._indexes.clear()
+    
+    def _index(self, field_name: str) -> Dict[str, Any]:
+        """Get (building if needed) the lookup index for a field"""
+        items = getattr(self, field_name)
+        entry = self._indexes.get(field_name)
+        if entry is not None and entry[0] is items:
+            return entry[1]
+        index = {}
+        if field_name == "constraints":
+            for constraint in items:
+                index.setdefault(constraint.entity, []).append(constraint)
+        else:
+            # First definition wins, as with a linear scan
+            for item in items:
+                index.setdefault(item.name, item)
+        self._indexes[field_name] = (items, index)
+        return index
     
     def get_entity(self, name: str) -> Optional[Entity]:
         """Get entity definition by name"""
-        for entity in self.entities:
-            if entity.name == name:
-                return entity
-        return None
+        return self._index("entities").get(name)
     
     def get_relation(self, name: str) -> Optional[Relation]:
         """Get relation definition by name"""
-        for relation in self.relations:
-            if relation.name == name:
-                return relation
-        return None
+        return self._index("relations").get(name)
+    
+    def get_constraints(self, entity_type: str) -> List[Constraint]:
+        """Get constraints defined on an entity type, in schema order"""
+        return self._index("constraints").get(entity_type, [])
     
     def validate_entity_type(self, entity_type: str) -> bool:
         """Check if entity type exists in schema"""
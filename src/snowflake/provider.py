@@ -1,8 +1,9 @@
 """Snowflake schema provider interface and implementations."""
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -19,6 +20,7 @@ class SemanticViewYAML:
     """Semantic view YAML from Snowflake."""
     view_name: str
     yaml_content: str
+    parsed: Any = field(default=None, repr=False, compare=False)  # Lazily parsed yaml_content; read-only
 
 
 class SnowflakeProvider(ABC):
@@ -39,6 +41,24 @@ class SnowflakeProvider(ABC):
         """
         pass
     
+    def get_table_schemas_bulk(self, database: str, schema: str, tables: List[str]) -> Dict[str, TableSchema]:
+        """
+        Get schema information for several tables of one schema.
+        
+        Providers backed by a remote catalog should override this with a single
+        query. The default raises NotImplementedError so callers fall back to
+        (concurrent) `get_table_schema` calls.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            tables: Table names
+            
+        Returns:
+            Dict of table name -> TableSchema (missing tables are omitted)
+        """
+        raise NotImplementedError(f"{type(self).__name__} has no bulk schema query")
+    
     @abstractmethod
     def get_semantic_view_yaml(self, database: str, schema: str, view_name: str) -> Optional[SemanticViewYAML]:
         """
@@ -53,6 +73,29 @@ class SnowflakeProvider(ABC):
             SemanticViewYAML or None if view doesn't exist
         """
         pass
+    
+    def get_semantic_view_yamls_bulk(
+        self, database: str, schema: str, view_names: List[str]
+    ) -> Dict[str, SemanticViewYAML]:
+        """
+        Get YAML for several semantic views of one schema.
+        
+        The default falls back to one `get_semantic_view_yaml` call per view.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            view_names: Semantic view names
+            
+        Returns:
+            Dict of view name -> SemanticViewYAML (missing views are omitted)
+        """
+        views = {}
+        for view_name in view_names:
+            semantic_view = self.get_semantic_view_yaml(database, schema, view_name)
+            if semantic_view:
+                views[view_name] = semantic_view
+        return views
 
 
 class MockSnowflakeProvider(SnowflakeProvider):
@@ -135,7 +178,11 @@ class MockSnowflakeProvider(SnowflakeProvider):
 
 
 class RealSnowflakeProvider(SnowflakeProvider):
-    """Real Snowflake provider using Snowflake connector (placeholder for future implementation)."""
+    """
+    Real Snowflake provider using Snowflake connector (placeholder for future implementation).
+    
+    Connections are kept per thread so concurrent schema lookups don't share a cursor.
+    """
     
     def __init__(self, connection_params: Dict[str, Any]):
         """
@@ -145,16 +192,17 @@ class RealSnowflakeProvider(SnowflakeProvider):
             connection_params: Snowflake connection parameters
         """
         self.connection_params = connection_params
-        self._connection = None
+        self._local = threading.local()
     
     def _get_connection(self):
-        """Get or create Snowflake connection."""
-        if self._connection is None:
+        """Get or create this thread's Snowflake connection."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
             # TODO: Implement actual Snowflake connection
             # import snowflake.connector
-            # self._connection = snowflake.connector.connect(**self.connection_params)
+            # connection = self._local.connection = snowflake.connector.connect(**self.connection_params)
             raise NotImplementedError("Real Snowflake provider not yet implemented")
-        return self._connection
+        return connection
     
     def get_table_schema(self, database: str, schema: str, table: str) -> Optional[TableSchema]:
         """Get table schema from Snowflake INFORMATION_SCHEMA."""
@@ -1,18 +1,19 @@
 """Tests for drift detection with mock provider."""
 
 import sys
+import threading
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.odl.drift import DriftDetector, DriftEventType, DriftType
+from src.odl.drift import DriftDetector, DriftDetectionResult, DriftEventType, DriftType
 from src.odl.ir import (
     ODLIR, ObjectIR, PropertyIR, RelationshipIR, MetricIR, DimensionIR,
     SnowflakeMappingIR
 )
-from src.snowflake.provider import MockSnowflakeProvider
+from src.snowflake.provider import MockSnowflakeProvider, SemanticViewYAML
 
 
 def create_test_odl_ir() -> ODLIR:
@@ -314,6 +315,351 @@ def test_no_drift():
     print("  [PASS] No drift detected when schemas match")
 
 
+class _CountingProvider(MockSnowflakeProvider):
+    """Mock provider that records schema lookups and can fail bulk fetches."""
+    
+    def __init__(self, fail_bulk: bool = False):
+        super().__init__()
+        self.fail_bulk = fail_bulk
+        self.bulk_calls = 0
+        self.single_calls = 0
+    
+    def get_table_schemas_bulk(self, database, schema, tables):
+        self.bulk_calls += 1
+        if self.fail_bulk:
+            raise RuntimeError("bulk query failed")
+        return {
+            table: self._table_schemas[(database, schema, table)]
+            for table in tables
+            if (database, schema, table) in self._table_schemas
+        }
+    
+    def get_table_schema(self, database, schema, table):
+        self.single_calls += 1
+        return super().get_table_schema(database, schema, table)
+
+
+def test_bulk_schema_fetch():
+    """Test: Table schemas are fetched in one bulk call, with per-table fallback."""
+    print("\nTest 9: Bulk schema fetch")
+    
+    for fail_bulk in (False, True):
+        odl_ir = create_test_odl_ir()
+        provider = _CountingProvider(fail_bulk=fail_bulk)
+        provider.add_table_schema(
+            "TEST_DB", "PUBLIC", "customers",
+            [{"name": "customer_id", "type": "VARCHAR", "nullable": False}]
+        )
+        
+        detector = DriftDetector(provider)
+        result = detector.detect_mapping_drift(odl_ir, ontology_id=1)
+        
+        assert provider.bulk_calls == 1
+        assert provider.single_calls == (2 if fail_bulk else 0)
+        missing_tables = [e for e in result.drift_events if e.event_type == DriftEventType.TABLE_MISSING]
+        assert [e.element_name for e in missing_tables] == ["Order"]
+    
+    print("  [PASS] Bulk schema fetch with fallback")
+
+
+def test_parallel_schema_fetch():
+    """Test: Per-table lookups run concurrently when bulk fetching is disabled."""
+    print("\nTest 10: Parallel schema fetch")
+    
+    odl_ir = create_test_odl_ir()
+    provider = _CountingProvider()
+    provider.add_table_schema(
+        "TEST_DB", "PUBLIC", "customers",
+        [{"name": "customer_id", "type": "VARCHAR", "nullable": False}]
+    )
+    
+    detector = DriftDetector(provider, bulk=False, parallelism=4)
+    result = detector.detect_mapping_drift(odl_ir, ontology_id=1)
+    
+    assert provider.bulk_calls == 0
+    assert provider.single_calls == 2
+    missing_tables = [e for e in result.drift_events if e.event_type == DriftEventType.TABLE_MISSING]
+    assert [e.element_name for e in missing_tables] == ["Order"]
+    
+    
+    # Providers without a bulk query get the concurrent per-table path by default
+    provider = MockSnowflakeProvider()
+    provider.add_table_schema(
+        "TEST_DB", "PUBLIC", "customers",
+        [{"name": "customer_id", "type": "VARCHAR", "nullable": False}]
+    )
+    threads = set()
+    original_lookup = provider.get_table_schema
+    
+    def recording_lookup(database, schema, table):
+        threads.add(threading.get_ident())
+        return original_lookup(database, schema, table)
+    
+    provider.get_table_schema = recording_lookup
+    result = DriftDetector(provider).detect_mapping_drift(odl_ir, ontology_id=1)
+    assert threads and threading.get_ident() not in threads
+    missing_tables = [e for e in result.drift_events if e.event_type == DriftEventType.TABLE_MISSING]
+    assert [e.element_name for e in missing_tables] == ["Order"]
+    
+    print("  [PASS] Parallel schema fetch")
+
+
+def test_schema_lookups_cached():
+    """Test: Provider lookups are reused across detections until invalidated."""
+    print("\nTest 11: Schema lookups cached")
+    
+    odl_ir = create_test_odl_ir()
+    provider = _CountingProvider()
+    provider.add_table_schema(
+        "TEST_DB", "PUBLIC", "customers",
+        [{"name": "customer_id", "type": "VARCHAR", "nullable": False}]
+    )
+    
+    detector = DriftDetector(provider)
+    first = detector.detect_mapping_drift(odl_ir, ontology_id=1)
+    second = detector.detect_mapping_drift(odl_ir, ontology_id=1)
+    assert provider.bulk_calls == 1
+    assert second.to_dict() == first.to_dict()
+    
+    detector.invalidate_cache()
+    detector.detect_mapping_drift(odl_ir, ontology_id=1)
+    assert provider.bulk_calls == 2
+    
+    uncached = DriftDetector(provider, cache_ttl=0)
+    uncached.detect_mapping_drift(odl_ir, ontology_id=1)
+    uncached.detect_mapping_drift(odl_ir, ontology_id=1)
+    assert provider.bulk_calls == 4
+    
+    # Misses are not remembered past the negative TTL, so new tables show up
+    fresh = DriftDetector(provider, negative_cache_ttl=0)
+    result = fresh.detect_mapping_drift(odl_ir, ontology_id=1)
+    assert "Order" in {e.element_name for e in result.drift_events if e.event_type == DriftEventType.TABLE_MISSING}
+    provider.add_table_schema(
+        "TEST_DB", "PUBLIC", "orders",
+        [{"name": "order_id", "type": "VARCHAR", "nullable": False}]
+    )
+    result = fresh.detect_mapping_drift(odl_ir, ontology_id=1)
+    assert "Order" not in {e.element_name for e in result.drift_events if e.event_type == DriftEventType.TABLE_MISSING}
+    
+    print("  [PASS] Schema lookups cached")
+
+
+def test_semantic_view_identical_yaml_short_circuits():
+    """Test: Deployed YAML identical to the compiler output reports no drift and compiles once."""
+    print("\nTest 12: Identical semantic view YAML short-circuits")
+    
+    from src.snowflake.snowflake_compiler import SnowflakeCompiler
+    
+    odl_ir = create_test_odl_ir()
+    options = {
+        "version_id": f"drift-check-{odl_ir.version}",
+        "view_name": "test_view",
+        "database": "TEST_DB",
+        "schema": "PUBLIC"
+    }
+    deployed_yaml = SnowflakeCompiler().compile(odl_ir, options).get_file("semantic_model.yaml").content
+    
+    provider = MockSnowflakeProvider()
+    provider.add_semantic_view("TEST_DB", "PUBLIC", "test_view", deployed_yaml + "\n")
+    
+    compile_calls = []
+    original_compile = SnowflakeCompiler.compile
+    
+    def counting_compile(self, *args, **kwargs):
+        compile_calls.append(1)
+        return original_compile(self, *args, **kwargs)
+    
+    SnowflakeCompiler.compile = counting_compile
+    try:
+        detector = DriftDetector(provider)
+        for _ in range(2):
+            result = detector.detect_semantic_view_drift(odl_ir, ontology_id=1, view_name="test_view")
+            assert result.drift_events == []
+    finally:
+        SnowflakeCompiler.compile = original_compile
+    
+    assert len(compile_calls) == 1
+    
+    print("  [PASS] Identical YAML short-circuits")
+
+
+def test_iter_mapping_drift_streams_events():
+    """Test: Streaming mapping drift yields the same events as the full result."""
+    print("\nTest 13: Streaming mapping drift")
+    
+    odl_ir = create_test_odl_ir()
+    provider = MockSnowflakeProvider()
+    provider.add_table_schema(
+        "TEST_DB", "PUBLIC", "customers",
+        [{"name": "customer_id", "type": "VARCHAR", "nullable": False}]
+    )
+    
+    detector = DriftDetector(provider)
+    events = detector.iter_mapping_drift(odl_ir)
+    first = next(events)
+    assert first.event_type == DriftEventType.COLUMN_MISSING
+    
+    streamed = [first.to_dict()] + [e.to_dict() for e in events]
+    result = detector.detect_mapping_drift(odl_ir, ontology_id=1)
+    assert streamed == result.to_dict()["events"]
+    
+    print("  [PASS] Streaming mapping drift")
+
+
+def test_join_key_order_is_not_drift():
+    """Test: Join keys that differ only in mapping key order are not drift."""
+    print("\nTest 14: Join key order is not drift")
+    
+    actual_yaml = """
+semantic_model:
+  relationships:
+    - name: placed_by
+      join_keys:
+        - to_column: customer_id
+          from_column: customer_id
+"""
+    expected_yaml = """
+semantic_model:
+  relationships:
+    - name: placed_by
+      join_keys:
+        - from_column: customer_id
+          to_column: customer_id
+"""
+    detector = DriftDetector(MockSnowflakeProvider())
+    result = DriftDetectionResult(ontology_id=1)
+    detector._compare_yamls(actual_yaml, expected_yaml, "test_view", result)
+    assert result.drift_events == []
+    
+    # Real differences list the keys in a deterministic order
+    changed_yaml = expected_yaml + """        - from_column: region
+          to_column: region
+        - from_column: account_id
+          to_column: account_id
+"""
+    detector._compare_yamls(actual_yaml, changed_yaml, "test_view", result)
+    [event] = result.drift_events
+    assert event.details["expected_keys"] == [
+        (("from_column", "account_id"), ("to_column", "account_id")),
+        (("from_column", "customer_id"), ("to_column", "customer_id")),
+        (("from_column", "region"), ("to_column", "region"))
+    ]
+    
+    print("  [PASS] Join key order ignored")
+
+
+def test_semantic_view_drift_bulk():
+    """Test: Several views are checked with one bulk YAML fetch."""
+    print("\nTest 15: Bulk semantic view drift")
+    
+    odl_ir = create_test_odl_ir()
+    provider = MockSnowflakeProvider()
+    provider.add_semantic_view(
+        "TEST_DB", "PUBLIC", "edited_view",
+        """
+semantic_model:
+  logical_tables:
+    - name: Customer
+"""
+    )
+    
+    bulk_calls = []
+    original_bulk = provider.get_semantic_view_yamls_bulk
+    
+    def counting_bulk(database, schema, view_names):
+        bulk_calls.append(list(view_names))
+        return original_bulk(database, schema, view_names)
+    
+    provider.get_semantic_view_yamls_bulk = counting_bulk
+    
+    detector = DriftDetector(provider)
+    results = detector.detect_semantic_view_drift_bulk(
+        odl_ir, ontology_id=1, view_names=["edited_view", "undeployed_view"]
+    )
+    
+    assert bulk_calls == [["edited_view", "undeployed_view"]]
+    assert results["undeployed_view"].drift_events == []
+    single = detector.detect_semantic_view_drift(odl_ir, ontology_id=1, view_name="edited_view")
+    assert results["edited_view"].to_dict() == single.to_dict()
+    assert single.drift_events
+    
+    print("  [PASS] Bulk semantic view drift")
+
+
+def test_formatting_only_yaml_difference_is_not_drift():
+    """Test: YAML that differs only in formatting parses equal and reports no drift."""
+    print("\nTest 16: Formatting-only YAML difference")
+    
+    actual_yaml = "semantic_model: {name: Test, logical_tables: [{name: Customer}]}\n"
+    expected_yaml = """
+semantic_model:
+  logical_tables:
+    - name: Customer
+  name: Test
+"""
+    detector = DriftDetector(MockSnowflakeProvider())
+    result = DriftDetectionResult(ontology_id=1)
+    detector._compare_yamls(actual_yaml, expected_yaml, "test_view", result)
+    assert result.drift_events == []
+    
+    print("  [PASS] Formatting-only difference ignored")
+
+
+def test_parallel_column_compare_matches_serial():
+    """Test: Comparing columns in a process pool yields the same events in order."""
+    print("\nTest 17: Parallel column comparison")
+    
+    odl_ir = create_test_odl_ir()
+    odl_ir.objects.insert(1, ObjectIR(
+        name="Product",
+        identifiers=["product_id"],
+        properties=[PropertyIR(name="product_id", type="string")],
+        snowflake_table="products"
+    ))
+    provider = MockSnowflakeProvider()
+    provider.add_table_schema(
+        "TEST_DB", "PUBLIC", "customers",
+        [
+            {"name": "customer_id", "type": "VARCHAR", "nullable": False},
+            {"name": "full_name", "type": "VARCHAR", "nullable": True}
+        ]
+    )
+    provider.add_table_schema(
+        "TEST_DB", "PUBLIC", "orders",
+        [{"name": "order_id", "type": "VARCHAR", "nullable": False}]
+    )
+    
+    serial = DriftDetector(provider, parallel_threshold=None).detect_mapping_drift(odl_ir, ontology_id=1)
+    parallel = DriftDetector(provider, parallel_threshold=1).detect_mapping_drift(odl_ir, ontology_id=1)
+    assert parallel.to_dict() == serial.to_dict()
+    assert DriftEventType.TABLE_MISSING in {e.event_type for e in parallel.drift_events}
+    
+    print("  [PASS] Parallel column comparison matches serial")
+
+
+def test_semantic_view_parsed_once():
+    """Test: A reused SemanticViewYAML keeps its parsed document across checks."""
+    print("\nTest 18: Semantic view YAML parsed once")
+    
+    odl_ir = create_test_odl_ir()
+    semantic_view = SemanticViewYAML(
+        view_name="test_view",
+        yaml_content="semantic_model:\n  name: Edited\n  logical_tables:\n    - name: Product\n"
+    )
+    detector = DriftDetector(MockSnowflakeProvider())
+    
+    first = detector.check_semantic_view(odl_ir, ontology_id=1, semantic_view=semantic_view)
+    parsed = semantic_view.parsed
+    assert parsed is not None
+    assert first.drift_events, "Edited view should drift"
+    
+    second = detector.check_semantic_view(odl_ir, ontology_id=1, semantic_view=semantic_view)
+    assert semantic_view.parsed is parsed
+    assert second.to_dict() == first.to_dict()
+    
+    print("  [PASS] Parsed YAML reused")
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -329,6 +675,16 @@ def main():
         test_semantic_view_yaml_divergence,
         test_semantic_view_manual_edit,
         test_no_drift,
+        test_bulk_schema_fetch,
+        test_parallel_schema_fetch,
+        test_schema_lookups_cached,
+        test_semantic_view_identical_yaml_short_circuits,
+        test_iter_mapping_drift_streams_events,
+        test_join_key_order_is_not_drift,
+        test_semantic_view_drift_bulk,
+        test_formatting_only_yaml_difference_is_not_drift,
+        test_parallel_column_compare_matches_serial,
+        test_semantic_view_parsed_once,
     ]
     
     passed = 0
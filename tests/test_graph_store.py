@@ -1,5 +1,10 @@
 """Tests for graph store"""
 
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
 import pytest
 from src.graph import MemoryGraphStore
 
@@ -38,3 +43,237 @@ def test_memory_graph_store():
     stats = store.get_stats()
     assert stats["nodes"] == 0
 
+
+
+class _FakeResponse:
+    """Minimal stand-in for requests.Response"""
+    
+    def __init__(self, payload=None):
+        self._payload = payload or {"results": {"bindings": []}}
+    
+    def raise_for_status(self):
+        pass
+    
+    @property
+    def content(self):
+        return json.dumps(self._payload).encode("utf-8")
+
+
+@pytest.fixture
+def oxigraph_store(monkeypatch):
+    """Oxigraph store with HTTP calls replaced by in-process fakes"""
+    from src.graph import oxigraph_store as module
+    
+    calls = {"get": 0, "post": 0}
+    payload = {"results": {"bindings": [{"key": {"value": "name"}, "o": {"value": "John"}}]}}
+    
+    def fake_get(*args, **kwargs):
+        calls["get"] += 1
+        return _FakeResponse(payload)
+    
+    def fake_post(*args, **kwargs):
+        calls["post"] += 1
+        return _FakeResponse()
+    
+    monkeypatch.setattr(module.requests.Session, "get", fake_get)
+    monkeypatch.setattr(module.requests.Session, "post", fake_post)
+    store = module.OxigraphGraphStore("http://localhost:7878/query", "http://localhost:7878/update")
+    calls["get"] = 0
+    yield store, calls
+    store.close()
+
+
+def test_oxigraph_query_cache(oxigraph_store):
+    """Repeated queries are served from cache until the next update"""
+    store, calls = oxigraph_store
+    
+    assert store.get_entity("person1")["name"] == "John"
+    assert store.get_entity("person1")["name"] == "John"
+    assert calls["get"] == 1
+    assert store.cache_stats() == {"hits": 1, "misses": 1, "size": 1}
+    
+    store.add_entity("Person", "person2", {"name": "Jane"})
+    assert store.cache_stats()["size"] == 0
+    
+    store.get_entity("person1")
+    assert calls["get"] == 2
+
+
+def test_oxigraph_update_sends_raw_body(oxigraph_store, monkeypatch):
+    """Updates are posted as a raw sparql-update body, not form-encoded"""
+    store, _ = oxigraph_store
+    sent = {}
+    
+    def fake_post(url, data=None, headers=None, timeout=None):
+        sent["data"] = data if isinstance(data, bytes) else b"".join(data)
+        sent["headers"] = headers
+        return _FakeResponse()
+    
+    monkeypatch.setattr(store._session, "post", fake_post)
+    
+    assert store._execute_sparql_update("CLEAR DEFAULT")
+    assert sent["data"] == b"CLEAR DEFAULT"
+    assert sent["headers"]["Content-Type"] == "application/sparql-update"
+    
+    assert store._execute_sparql_update(iter(["INSERT DATA { ", "<a> <b> <c>", " }"]))
+    assert sent["data"] == b"INSERT DATA { <a> <b> <c> }"
+
+
+def test_oxigraph_query_entities_fans_out_in_order(oxigraph_store, monkeypatch):
+    """Per-entity lookups run on the thread pool and keep result order"""
+    store, _ = oxigraph_store
+    ids = [f"e{i}" for i in range(8)]
+    bindings = [{"s": {"value": f"http://sundaygraph.org/entity/{i}"}} for i in ids]
+    monkeypatch.setattr(store, "_execute_sparql_query", lambda query: bindings)
+    monkeypatch.setattr(
+        store, "get_entity",
+        lambda entity_id, workspace_id=None: None if entity_id == "e3" else {"id": entity_id}
+    )
+    
+    entities = store.query_entities(entity_type="Person")
+    assert [e["id"] for e in entities] == [i for i in ids if i != "e3"]
+    store.close()
+
+
+def test_oxigraph_literal_escaping():
+    """String literals escape quotes, backslashes and control characters"""
+    from src.graph.oxigraph_store import _escape_literal
+    
+    assert _escape_literal('say "hi"') == 'say \\"hi\\"'
+    assert _escape_literal("C:\\temp") == "C:\\\\temp"
+    assert _escape_literal("a\nb\tc\r") == "a\\nb\\tc\\r"
+
+
+def test_oxigraph_typed_literals(oxigraph_store):
+    """Numbers and booleans are written with their XSD datatypes"""
+    store, _ = oxigraph_store
+    xsd = "http://www.w3.org/2001/XMLSchema#"
+    
+    assert store._format_literal("x") == '"x"'
+    assert store._format_literal(True) == f'"true"^^<{xsd}boolean>'
+    assert store._format_literal(42) == f'"42"^^<{xsd}integer>'
+    assert store._format_literal(1.5) == f'"1.5"^^<{xsd}double>'
+    assert store._format_literal(float("inf")) == f'"INF"^^<{xsd}double>'
+
+
+def test_oxigraph_add_relation_single_edge_triple(oxigraph_store, monkeypatch):
+    """add_relation writes the subject-relation-object triple exactly once"""
+    store, _ = oxigraph_store
+    sent = {}
+    
+    def fake_post(url, data=None, headers=None, timeout=None):
+        sent["data"] = data.decode("utf-8")
+        return _FakeResponse()
+    
+    monkeypatch.setattr(store._session, "post", fake_post)
+    
+    assert store.add_relation("KNOWS", "person1", "person2", workspace_id="ws1")
+    edge = "<http://sundaygraph.org/entity/person1> <http://sundaygraph.org/relation/KNOWS> <http://sundaygraph.org/entity/person2>"
+    assert sent["data"].count(edge) == 1
+
+
+def test_oxigraph_decodes_compressed_responses():
+    """The session advertises every decodable encoding and decodes compressed results"""
+    from src.graph.oxigraph_store import OxigraphGraphStore
+    from urllib3.util.request import ACCEPT_ENCODING
+    
+    body = json.dumps({"results": {"bindings": [{"key": {"value": "name"}, "o": {"value": "John"}}]}}).encode("utf-8")
+    seen = []
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            seen.append(self.headers.get("Accept-Encoding"))
+            payload = gzip.compress(body)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/sparql-results+json")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    endpoint = f"http://127.0.0.1:{server.server_port}/query"
+    store = OxigraphGraphStore(endpoint, endpoint.replace("query", "update"))
+    try:
+        assert store._run_sparql_query("SELECT * WHERE { ?s ?p ?o }") == [
+            {"key": {"value": "name"}, "o": {"value": "John"}}
+        ]
+        assert seen and all(header == ACCEPT_ENCODING for header in seen)
+    finally:
+        store.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_oxigraph_http2_falls_back_to_requests(monkeypatch):
+    """Requesting HTTP/2 without httpx installed keeps the requests session"""
+    from src.graph import oxigraph_store as module
+    monkeypatch.setattr(module, "httpx", None)
+    monkeypatch.setattr(module.requests.Session, "get", lambda *args, **kwargs: _FakeResponse())
+    
+    store = module.OxigraphGraphStore("http://localhost:7878/query", "http://localhost:7878/update", http2=True)
+    assert isinstance(store._session, module.requests.Session)
+    store.close()
+
+
+def test_oxigraph_get_stats_queries_and_counts(oxigraph_store, monkeypatch):
+    """get_stats counts typed subjects and IRI-valued relation triples, and parses both counts"""
+    store, _ = oxigraph_store
+    queries = []
+    
+    def fake_get(url, params=None, headers=None, timeout=None):
+        query = params["query"]
+        queries.append(query)
+        key = "nodes" if "?nodes" in query else "edges"
+        count = {"nodes": "3", "edges": "5"}[key]
+        return _FakeResponse({"results": {"bindings": [{key: {"value": count}}]}})
+    
+    monkeypatch.setattr(store._session, "get", fake_get)
+    
+    stats = store.get_stats(workspace_id="ws1")
+    assert stats == {"nodes": 3, "edges": 5, "workspace_id": "ws1", "backend": "oxigraph"}
+    
+    nodes_query, edges_query = (" ".join(query.split()) for query in queries)
+    graph = f"GRAPH <{store.default_graph_uri}/workspace/ws1>"
+    assert "SELECT (COUNT(DISTINCT ?s) AS ?nodes)" in nodes_query
+    assert f"{graph} {{ ?s <{store._RDF_TYPE}> ?t }}" in nodes_query
+    assert "SELECT (COUNT(*) AS ?edges)" in edges_query
+    assert graph in edges_query
+    assert f'FILTER(STRSTARTS(STR(?p), "{store._RELATION_PREFIX}") && isIRI(?o))' in edges_query
+
+
+def test_oxigraph_get_stats_empty_results(oxigraph_store, monkeypatch):
+    """get_stats reports zero counts when the endpoint returns no rows"""
+    store, _ = oxigraph_store
+    monkeypatch.setattr(store._session, "get", lambda *args, **kwargs: _FakeResponse())
+    
+    assert store.get_stats() == {"nodes": 0, "edges": 0, "workspace_id": None, "backend": "oxigraph"}
+
+
+def test_oxigraph_graph_uri_cache(oxigraph_store):
+    """Workspace graph URIs are cached and the cache is reset once it reaches its cap"""
+    store, _ = oxigraph_store
+    
+    assert store._get_graph_uri(None) == store.default_graph_uri
+    assert store._graph_uri_cache == {}
+    
+    uri = store._get_graph_uri("ws1")
+    assert uri == f"{store.default_graph_uri}/workspace/ws1"
+    assert store._get_graph_uri("ws1") is uri
+    assert len(store._graph_uri_cache) == 1
+    
+    for i in range(2, store._GRAPH_URI_CACHE_SIZE + 1):
+        store._get_graph_uri(f"ws{i}")
+    assert len(store._graph_uri_cache) == store._GRAPH_URI_CACHE_SIZE
+    assert store._get_graph_uri("ws1") is uri
+    
+    # One more workspace overflows the cap: the cache starts over with just it
+    assert store._get_graph_uri("overflow") == f"{store.default_graph_uri}/workspace/overflow"
+    assert list(store._graph_uri_cache) == ["overflow"]
+    assert store._get_graph_uri("ws1") == uri
+    assert len(store._graph_uri_cache) == 2
@@ -41,6 +41,73 @@ class TestODLLoader:
         data = loader.load_from_string('{"version": "1.0.0", "objects": []}')
         
         assert data["version"] == "1.0.0"
+    
+    def test_lazy_load_normalizes_like_eager(self, tmp_path):
+        """Test lazily loaded documents normalize to the same IR."""
+        odl_file = tmp_path / "test.odl.json"
+        odl_file.write_text(json.dumps({
+            "version": "1.0.0",
+            "objects": [
+                {"name": "Order", "identifiers": ["id"], "properties": [{"name": "id", "type": "string"}]},
+                {"name": "Customer", "identifiers": ["id"], "properties": [{"name": "id", "type": "string"}]}
+            ],
+            "relationships": [{"name": "placed_by", "from": "Order", "to": "Customer", "joinKeys": [["id", "id"]]}],
+            "snowflake": {"database": "DB", "schema": "PUBLIC", "tableMappings": {"Order": "ORDERS"}}
+        }))
+        
+        loader = ODLLoader()
+        normalizer = ODLNormalizer()
+        eager = normalizer.normalize(loader.load(odl_file))
+        lazy = normalizer.normalize(loader.load(odl_file, lazy=True))
+        streamed = loader.load_and_normalize(odl_file)
+        
+        assert lazy.content_key() == eager.content_key()
+        assert lazy.snowflake == eager.snowflake
+        assert streamed.content_key() == eager.content_key()
+    
+    def test_load_memory_mapped(self, tmp_path, monkeypatch):
+        """Test large files are parsed from a memory mapping when supported."""
+        from src.odl import loader as loader_module
+        
+        odl_file = tmp_path / "test.odl.json"
+        odl_file.write_text(json.dumps({
+            "version": "1.0.0",
+            "objects": [{"name": "Customer", "identifiers": ["id"]}]
+        }))
+        monkeypatch.setattr(loader_module, "_MMAP_MIN_BYTES", 0)
+        
+        data = ODLLoader.load(odl_file)
+        
+        assert data["objects"][0]["name"] == "Customer"
+    
+    def test_small_documents_use_orjson(self, monkeypatch):
+        """Test small documents skip simdjson when orjson is installed."""
+        from src.odl import loader as loader_module
+        
+        class FailingParser:
+            def parse(self, buf, recursive=False):
+                raise AssertionError("simdjson used for a small document")
+        
+        monkeypatch.setattr(loader_module, "SIMDJSON_AVAILABLE", True)
+        monkeypatch.setattr(loader_module, "ORJSON_AVAILABLE", True)
+        monkeypatch.setattr(loader_module, "_get_parser", FailingParser)
+        monkeypatch.setattr(loader_module, "_json_loads", json.loads)
+        
+        data = ODLLoader.load_from_string('{"version": "1.0.0", "objects": []}')
+        
+        assert data["version"] == "1.0.0"
+    
+    def test_load_many_preserves_order(self, tmp_path):
+        """Test loading several files returns them in input order."""
+        paths = []
+        for i in range(5):
+            odl_file = tmp_path / f"test{i}.odl.json"
+            odl_file.write_text(json.dumps({"version": "1.0.0", "name": f"odl{i}", "objects": []}))
+            paths.append(odl_file)
+        
+        data = ODLLoader.load_many(paths)
+        
+        assert [d["name"] for d in data] == [f"odl{i}" for i in range(5)]
 
 
 class TestODLValidator:
@@ -72,6 +139,26 @@ class TestODLValidator:
         assert any("Order" in error and "unknown object" in error.lower() for error in errors)
         assert any("Available objects" in error for error in errors)
     
+    def test_available_objects_reset_between_validations(self):
+        """Test "Available objects" hints reflect the ODL being validated."""
+        validator = ODLValidator()
+        
+        def odl_with(object_name):
+            return {
+                "version": "1.0.0",
+                "objects": [{"name": object_name, "identifiers": ["id"], "properties": []}],
+                "relationships": [
+                    {"name": "a", "from": "Missing", "to": object_name},
+                    {"name": "b", "from": object_name, "to": "Missing"}
+                ]
+            }
+        
+        _, errors = validator.validate(odl_with("Customer"))
+        assert sum("Available objects: ['Customer']" in error for error in errors) == 2
+        
+        _, errors = validator.validate(odl_with("Account"))
+        assert sum("Available objects: ['Account']" in error for error in errors) == 2
+    
     def test_duplicate_metric_name(self):
         """Test validation error for duplicate metric names."""
         validator = ODLValidator()
@@ -102,6 +189,30 @@ class TestODLValidator:
         assert any("Duplicate metric name" in error and "TotalRevenue" in error for error in errors)
         assert any("First occurrence" in error for error in errors)
     
+    def test_duplicate_object_names_point_to_first_occurrence(self):
+        """Test every repeated object name is reported against its first occurrence."""
+        validator = ODLValidator()
+        
+        odl_data = {
+            "version": "1.0.0",
+            "objects": [
+                {"name": "Order", "identifiers": ["id"], "properties": []},
+                {"name": "Customer", "identifiers": ["id"], "properties": []},
+                {"name": "Order", "identifiers": ["id"], "properties": []},
+                {"name": "Order", "identifiers": ["id"], "properties": []}
+            ]
+        }
+        
+        is_valid, errors = validator.validate(odl_data)
+        
+        assert not is_valid
+        duplicates = [error for error in errors if "Duplicate object name" in error]
+        assert [error.split(". ")[0] for error in duplicates] == [
+            "Duplicate object name 'Order' found at objects[2]",
+            "Duplicate object name 'Order' found at objects[3]"
+        ]
+        assert all("First occurrence at objects[0]" in error for error in duplicates)
+    
     def test_invalid_relationship_cardinality(self):
         """Test validation error for invalid relationship cardinality."""
         validator = ODLValidator()
@@ -272,6 +383,17 @@ class TestODLNormalizer:
         assert len(ir.objects) == 1
         assert ir.objects[0].name == "Customer"
         assert ir.objects[0].identifiers == ["customer_id"]  # Sorted
+    
+    def test_normalize_non_string_identifiers(self):
+        """Test identifiers that are not strings are kept as-is."""
+        normalizer = ODLNormalizer()
+        
+        ir = normalizer.normalize({
+            "version": "1.0.0",
+            "objects": [{"name": "Customer", "identifiers": [7, 3], "properties": []}]
+        })
+        
+        assert ir.objects[0].identifiers == [3, 7]
 
 
 class TestODLProcessor:
@@ -327,6 +449,95 @@ class TestODLProcessor:
         assert len(errors) > 0
         # Should still normalize (for debugging)
         assert ir is not None
+    
+    def test_process_from_dict_non_string_keys(self):
+        """Test invalid ODL with numeric join keys and grain still normalizes."""
+        processor = ODLProcessor()
+        ir, is_valid, errors = processor.process_from_dict({
+            "version": "1.0.0",
+            "objects": [
+                {"name": "Order", "identifiers": ["id"], "properties": [{"name": "id", "type": "string"}]},
+                {"name": "Customer", "identifiers": ["id"], "properties": [{"name": "id", "type": "string"}]}
+            ],
+            "relationships": [{"name": "placed_by", "from": "Order", "to": "Customer", "joinKeys": [[1, "id"]]}],
+            "metrics": [{"name": "count", "expression": "COUNT(*)", "grain": [5]}],
+            "snowflake": {"database": "DB", "schema": "PUBLIC"}
+        })
+        
+        assert not is_valid
+        assert ir.relationships[0].join_keys == [(1, "id")]
+        assert ir.metrics[0].grain == [5]
+    
+    def test_process_from_dict_is_memoized(self, monkeypatch):
+        """Test identical dicts skip re-validation and return independent IRs."""
+        processor = ODLProcessor(cache_size=128)
+        odl_data = {
+            "version": "1.0.0",
+            "objects": [{"name": "Customer", "identifiers": ["id"], "properties": []}]
+        }
+        calls = []
+        original_validate = processor.validator.validate
+        monkeypatch.setattr(
+            processor.validator, "validate",
+            lambda data: calls.append(1) or original_validate(data)
+        )
+        
+        ir1, valid1, _ = processor.process_from_dict(odl_data)
+        ir1.objects[0].name = "Mutated"
+        ir2, valid2, _ = processor.process_from_dict(dict(odl_data))
+        
+        assert len(calls) == 1
+        assert valid1 and valid2
+        assert ir2.objects[0].name == "Customer"
+        
+        processor.clear_cache()
+        processor.process_from_dict(odl_data)
+        assert len(calls) == 2
+    
+    def test_process_cache_is_opt_in(self, monkeypatch):
+        """Test results are not memoized by default."""
+        processor = ODLProcessor()
+        odl_data = {"version": "1.0.0", "objects": []}
+        monkeypatch.setattr(
+            processor, "_dict_cache_key",
+            lambda data: pytest.fail("cache key computed with caching disabled")
+        )
+        
+        processor.process_from_dict(odl_data)
+        processor.process_from_dict(odl_data)
+        
+        assert not processor._process_cache
+    
+    def test_process_file_cache_tracks_changes(self, tmp_path):
+        """Test rewriting a file invalidates its cached result."""
+        odl_file = tmp_path / "test.odl.json"
+        odl_file.write_text(json.dumps({"version": "1.0.0", "objects": []}))
+        processor = ODLProcessor(cache_size=128)
+        
+        ir, _, _ = processor.process(odl_file)
+        assert ir.version == "1.0.0"
+        
+        odl_file.write_text(json.dumps({"version": "2.0.0", "objects": [], "name": "changed"}))
+        ir, _, _ = processor.process(odl_file)
+        assert ir.version == "2.0.0"
+    
+    def test_process_many_preserves_order(self, tmp_path):
+        """Test batch processing across workers returns results in input order."""
+        paths = []
+        for i in range(4):
+            odl_file = tmp_path / f"test{i}.odl.json"
+            odl_file.write_text(json.dumps({
+                "version": "1.0.0",
+                "name": f"model_{i}",
+                "objects": [{"name": "Customer", "identifiers": ["id"], "properties": []}]
+            }))
+            paths.append(odl_file)
+        
+        processor = ODLProcessor()
+        results = processor.process_many(paths, workers=2)
+        
+        assert [ir.name for ir, _, _ in results] == ["model_0", "model_1", "model_2", "model_3"]
+        assert all(is_valid for _, is_valid, _ in results)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 """Comprehensive tests for ODL diff engine."""
 
+import copy
+import io
+import json
 import sys
 from pathlib import Path
 
@@ -461,6 +464,186 @@ def test_complex_diff():
     print(f"    - Non-breaking: {result.summary['total_non_breaking']}")
 
 
+def test_name_index_follows_reassignment():
+    """Test: Cached name indexes are rebuilt when a collection is reassigned."""
+    print("\nTest 14: Name index follows reassignment")
+    
+    ir = create_minimal_odl_ir("v1", "1.0.0")
+    ir.objects = [ObjectIR(name="Customer", identifiers=["customer_id"])]
+    assert list(ir.objects_by_name) == ["Customer"]
+    
+    ir.objects = [ObjectIR(name="Order", identifiers=["order_id"])]
+    assert list(ir.objects_by_name) == ["Order"]
+    
+    ir.objects.append(ObjectIR(name="Product", identifiers=["product_id"]))
+    ir.invalidate_indexes()
+    assert sorted(ir.objects_by_name) == ["Order", "Product"]
+    
+    print("  [PASS] Name index rebuilt after reassignment and invalidation")
+
+
+def test_equal_elements_skipped():
+    """Test: Equal elements report nothing and field updates are still diffed."""
+    print("\nTest 15: Equal elements skipped")
+    
+    old_obj = ObjectIR(
+        name="Customer",
+        identifiers=["customer_id"],
+        properties=[PropertyIR(name="email", type="string")]
+    )
+    new_obj = ObjectIR(
+        name="Customer",
+        identifiers=["customer_id"],
+        properties=[PropertyIR(name="email", type="string")]
+    )
+    old_ir = create_minimal_odl_ir("v1", "1.0.0")
+    new_ir = create_minimal_odl_ir("v2", "2.0.0")
+    old_ir.objects = [old_obj]
+    new_ir.objects = [new_obj]
+    engine = ODLDiffEngine()
+    unchanged = engine.diff(old_ir, new_ir)
+    assert not unchanged.breaking_changes and not unchanged.non_breaking_changes
+    
+    new_obj.properties[0].type = "int"
+    assert [c.category for c in engine.diff(old_ir, new_ir).breaking_changes] == [
+        ChangeCategory.PROPERTY_TYPE_CHANGED
+    ]
+    
+    new_obj.properties[0].type = "string"
+    new_obj.description = "Customers"
+    result = engine.diff(old_ir, new_ir)
+    assert [c.category for c in result.non_breaking_changes] == [
+        ChangeCategory.OBJECT_DESCRIPTION_CHANGED
+    ]
+    assert not result.breaking_changes
+    
+    print("  [PASS] Field updates are diffed")
+
+
+def test_diff_sees_in_place_edits():
+    """Test: In-place list edits show up in the diff."""
+    print("\nTest 16: Diff sees in-place edits")
+    
+    old_ir = create_minimal_odl_ir("v1", "1.0.0")
+    new_ir = create_minimal_odl_ir("v2", "2.0.0")
+    old_ir.objects = [ObjectIR(name="Customer", identifiers=["customer_id"])]
+    new_ir.objects = [ObjectIR(name="Customer", identifiers=["customer_id"])]
+    old_ir.relationships = [RelationshipIR(
+        name="customer_orders", from_object="Order", to_object="Customer",
+        join_keys=[("customer_id", "customer_id")]
+    )]
+    new_ir.relationships = [RelationshipIR(
+        name="customer_orders", from_object="Order", to_object="Customer",
+        join_keys=[("customer_id", "customer_id")]
+    )]
+    engine = ODLDiffEngine()
+    assert not engine.diff(old_ir, new_ir).breaking_changes
+    new_obj = new_ir.objects[0]
+    new_rel = new_ir.relationships[0]
+    
+    new_obj.identifiers.append("email")
+    new_obj.properties.append(PropertyIR(name="email", type="string"))
+    new_rel.join_keys.append(("region", "region"))
+    
+    result = engine.diff(old_ir, new_ir)
+    categories = {c.category for c in result.breaking_changes + result.non_breaking_changes}
+    assert ChangeCategory.IDENTIFIER_ADDED in categories
+    assert ChangeCategory.PROPERTY_ADDED in categories
+    assert ChangeCategory.RELATIONSHIP_JOIN_KEYS_CHANGED in categories
+    
+    print("  [PASS] In-place edits are detected by the diff")
+
+
+def test_diff_sees_appended_elements():
+    """Test: Elements appended after an earlier diff are reported by the next one."""
+    print("\nTest 17: Diff sees appended elements")
+    
+    old_ir = create_minimal_odl_ir("v1", "1.0.0")
+    new_ir = create_minimal_odl_ir("v2", "2.0.0")
+    old_ir.objects = [ObjectIR(name="Customer", identifiers=["customer_id"])]
+    new_ir.objects = [ObjectIR(name="Customer", identifiers=["customer_id"])]
+    engine = ODLDiffEngine()
+    assert not engine.diff(old_ir, new_ir).non_breaking_changes
+    assert list(new_ir.objects_by_name) == ["Customer"]
+    
+    new_ir.objects.append(ObjectIR(name="Order", identifiers=["order_id"]))
+    result = engine.diff(old_ir, new_ir)
+    assert [(c.category, c.element_name) for c in result.non_breaking_changes] == [
+        (ChangeCategory.OBJECT_ADDED, "Order")
+    ]
+    assert sorted(new_ir.objects_by_name) == ["Customer", "Order"]
+    
+    print("  [PASS] Appended object reported")
+
+
+def test_parallel_diff_matches_sequential():
+    """Test: Running diff sections in worker processes gives the same result."""
+    print("\nTest 18: Parallel diff matches sequential diff")
+    
+    old_ir = create_minimal_odl_ir("v1", "1.0.0")
+    old_ir.objects = [ObjectIR(name="Customer", identifiers=["customer_id"])]
+    old_ir.metrics = [MetricIR(name="TotalRevenue", expression="SUM(amount)")]
+    
+    new_ir = create_minimal_odl_ir("v2", "2.0.0")
+    new_ir.objects = [
+        ObjectIR(name="Customer", identifiers=["email"]),
+        ObjectIR(name="Order", identifiers=["order_id"])
+    ]
+    new_ir.metrics = [MetricIR(name="TotalRevenue", expression="SUM(amount * quantity)")]
+    new_ir.dimensions = [DimensionIR(name="Region", source_property="Customer.region")]
+    
+    sequential = ODLDiffEngine(parallel_threshold=None).diff(old_ir, new_ir)
+    parallel = ODLDiffEngine(parallel_threshold=0, max_workers=2).diff(old_ir, new_ir)
+    assert parallel.to_dict() == sequential.to_dict()
+    
+    print("  [PASS] Parallel diff matches sequential diff")
+
+
+def test_collection_fingerprint_skips_unchanged():
+    """Test: Collection fingerprints match for copies and edits are still diffed."""
+    print("\nTest 19: Collection fingerprint skips unchanged collections")
+    
+    old_ir = create_minimal_odl_ir("v1", "1.0.0")
+    old_ir.objects = [
+        ObjectIR(name="Customer", identifiers=["customer_id"],
+                 properties=[PropertyIR(name="email", type="string")])
+    ]
+    new_ir = copy.deepcopy(old_ir)
+    new_ir.version = "2.0.0"
+    assert old_ir.fingerprint("objects") == new_ir.fingerprint("objects")
+    assert not ODLDiffEngine().diff(old_ir, new_ir).to_dict()["summary"]["total_changes"]
+    
+    # The cached fingerprint misses an in-place edit; the == check does not
+    new_ir.objects[0].properties[0].type = "int"
+    assert old_ir.fingerprint("objects") == new_ir.fingerprint("objects")
+    assert old_ir.collection_digest("objects") != new_ir.collection_digest("objects")
+    result = ODLDiffEngine().diff(old_ir, new_ir)
+    assert [c.category for c in result.breaking_changes] == [ChangeCategory.PROPERTY_TYPE_CHANGED]
+    
+    print("  [PASS] Unchanged collections skipped, edits still detected")
+
+
+def test_dump_json_matches_to_dict():
+    """Test: Streaming JSON output decodes to the to_dict() document."""
+    print("\nTest 20: Streaming JSON matches to_dict")
+    
+    old_ir = create_minimal_odl_ir("v1", "1.0.0")
+    old_ir.objects = [ObjectIR(name="Customer", identifiers=["customer_id"])]
+    new_ir = create_minimal_odl_ir("v2", "2.0.0")
+    new_ir.objects = [
+        ObjectIR(name="Customer", identifiers=["customer_id", "email"]),
+        ObjectIR(name="Order", identifiers=["order_id"])
+    ]
+    result = ODLDiffEngine().diff(old_ir, new_ir)
+    
+    buffer = io.StringIO()
+    result.dump_json(buffer)
+    assert json.loads(buffer.getvalue()) == result.to_dict()
+    assert len(list(result.iter_change_dicts())) == result.summary["total_changes"]
+    
+    print("  [PASS] Streaming JSON matches to_dict")
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -481,6 +664,13 @@ def main():
         test_description_changes_non_breaking,
         test_property_type_changed_breaking,
         test_complex_diff,
+        test_name_index_follows_reassignment,
+        test_equal_elements_skipped,
+        test_diff_sees_in_place_edits,
+        test_diff_sees_appended_elements,
+        test_parallel_diff_matches_sequential,
+        test_collection_fingerprint_skips_unchanged,
+        test_dump_json_matches_to_dict,
     ]
     
     passed = 0
@@ -0,0 +1,373 @@
+"""Tests for ODL evaluation gates."""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.odl.evaluation import ODLEvaluator, GateStatus
+from src.odl.ir import (
+    ODLIR, ObjectIR, PropertyIR, RelationshipIR, MetricIR, DimensionIR,
+    SnowflakeMappingIR
+)
+
+
+def create_test_odl_ir() -> ODLIR:
+    """Create a test ODL IR."""
+    return ODLIR(
+        version="1.0.0",
+        name="Test Ontology",
+        objects=[
+            ObjectIR(
+                name="Customer",
+                identifiers=["customer_id"],
+                properties=[
+                    PropertyIR(name="customer_id", type="string"),
+                    PropertyIR(name="region", type="string")
+                ]
+            ),
+            ObjectIR(
+                name="Order",
+                identifiers=["order_id"],
+                properties=[
+                    PropertyIR(name="order_id", type="string"),
+                    PropertyIR(name="customer_id", type="string"),
+                    PropertyIR(name="amount", type="decimal")
+                ]
+            )
+        ],
+        relationships=[
+            RelationshipIR(
+                name="placed_by",
+                from_object="Order",
+                to_object="Customer",
+                join_keys=[("customer_id", "customer_id")]
+            )
+        ],
+        metrics=[
+            MetricIR(name="revenue", expression="SUM(amount)", grain=["Order"])
+        ],
+        dimensions=[
+            DimensionIR(name="customer_region", source_property="Customer.region")
+        ],
+        snowflake=SnowflakeMappingIR(database="TEST_DB", schema="PUBLIC")
+    )
+
+
+def gate(result, gate_name):
+    """Get a gate result by name."""
+    return next(g for g in result.gate_results if g.gate_name == gate_name)
+
+
+def test_references_resolved():
+    """Test: Valid references pass, unknown objects and properties fail."""
+    print("\nTest 1: References resolved")
+    
+    evaluator = ODLEvaluator()
+    result = evaluator.evaluate(create_test_odl_ir(), version_id=1)
+    assert gate(result, "references_resolved").status == GateStatus.PASS
+    
+    odl_ir = create_test_odl_ir()
+    odl_ir.dimensions.append(DimensionIR(name="bad_prop", source_property="Customer.missing"))
+    odl_ir.dimensions.append(DimensionIR(name="bad_obj", source_property="Product.name"))
+    result = evaluator.evaluate(odl_ir, version_id=1)
+    references = gate(result, "references_resolved")
+    assert references.status == GateStatus.FAIL
+    assert len(references.details["unresolved_references"]) == 2
+    
+    print("  [PASS] References resolved")
+
+
+def test_join_key_mismatch():
+    """Test: Join keys missing from either side are reported."""
+    print("\nTest 2: Join key mismatch")
+    
+    odl_ir = create_test_odl_ir()
+    odl_ir.relationships[0].join_keys = [("customer_ref", "customer_id")]
+    
+    result = ODLEvaluator().evaluate(odl_ir, version_id=1)
+    joins = gate(result, "no_ambiguous_joins")
+    assert joins.status == GateStatus.FAIL
+    assert joins.details["join_key_mismatches"] == [
+        "Relationship 'placed_by': join key 'customer_ref' not found in 'Order'"
+    ]
+    
+    print("  [PASS] Join key mismatch")
+
+
+def test_join_graph_connectivity():
+    """Test: Objects without a relationship path are reported as disconnected."""
+    print("\nTest 3: Join graph connectivity")
+    
+    odl_ir = create_test_odl_ir()
+    odl_ir.objects.append(ObjectIR(
+        name="Product",
+        identifiers=["product_id"],
+        properties=[PropertyIR(name="product_id", type="string")]
+    ))
+    
+    result = ODLEvaluator().evaluate(odl_ir, version_id=1)
+    connected = gate(result, "connected_join_graph")
+    assert connected.status == GateStatus.FAIL
+    assert connected.details["disconnected_objects"] == ["Product"]
+    
+    print("  [PASS] Join graph connectivity")
+
+
+def test_ambiguous_join_paths():
+    """Test: A cycle in the relationship graph is reported as an ambiguous join."""
+    print("\nTest 4: Ambiguous join paths")
+    
+    result = ODLEvaluator().evaluate(create_test_odl_ir(), version_id=1)
+    assert gate(result, "no_ambiguous_joins").status == GateStatus.PASS
+    
+    odl_ir = create_test_odl_ir()
+    odl_ir.objects.append(ObjectIR(
+        name="Account",
+        identifiers=["customer_id"],
+        properties=[PropertyIR(name="customer_id", type="string")]
+    ))
+    odl_ir.relationships.extend([
+        RelationshipIR(
+            name="billed_to",
+            from_object="Order",
+            to_object="Account",
+            join_keys=[("customer_id", "customer_id")]
+        ),
+        RelationshipIR(
+            name="owned_by",
+            from_object="Account",
+            to_object="Customer",
+            join_keys=[("customer_id", "customer_id")]
+        )
+    ])
+    
+    result = ODLEvaluator().evaluate(odl_ir, version_id=1)
+    joins = gate(result, "no_ambiguous_joins")
+    assert joins.status == GateStatus.FAIL
+    assert [(a, b, len(paths)) for a, b, paths in joins.details["ambiguous_paths"]] == [
+        ("Customer", "Order", 2),
+        ("Customer", "Account", 2),
+        ("Order", "Account", 2)
+    ]
+    
+    print("  [PASS] Ambiguous join paths")
+
+
+def test_evaluate_update_reuses_unchanged_gates():
+    """Test: Incremental evaluation reruns only gates whose inputs changed."""
+    print("\nTest 5: Incremental evaluation")
+    
+    evaluator = ODLEvaluator()
+    prev_ir = create_test_odl_ir()
+    prev_result = evaluator.evaluate(prev_ir, version_id=1)
+    
+    new_ir = create_test_odl_ir()
+    new_ir.objects[0].description = "Changed"
+    new_ir.relationships[0].join_keys = [("customer_ref", "customer_id")]
+    updated = evaluator.evaluate_update(prev_ir, new_ir, prev_result, version_id=2)
+    
+    expected = evaluator.evaluate(new_ir, version_id=2).to_dict()
+    assert updated.to_dict() == expected
+    assert updated._input_hashes
+    
+    # Only the header changed: structural and semantic gates are carried over
+    next_ir = create_test_odl_ir()
+    next_ir.objects[0].description = "Changed"
+    next_ir.relationships[0].join_keys = [("customer_ref", "customer_id")]
+    next_ir.description = "Next version"
+    again = evaluator.evaluate_update(new_ir, next_ir, updated)
+    assert again.version_id == 2
+    assert gate(again, "references_resolved") is gate(updated, "references_resolved")
+    assert gate(again, "no_ambiguous_joins") is gate(updated, "no_ambiguous_joins")
+    assert gate(again, "yaml_verify_passes") is not gate(updated, "yaml_verify_passes")
+    
+    print("  [PASS] Incremental evaluation")
+
+
+def test_graph_gates_skipped_on_unresolved_references():
+    """Test: Join graph gates are skipped when references fail to resolve."""
+    print("\nTest 6: Graph gates skipped on unresolved references")
+    
+    odl_ir = create_test_odl_ir()
+    odl_ir.relationships[0].to_object = "Client"
+    
+    result = ODLEvaluator().evaluate(odl_ir, version_id=1)
+    assert gate(result, "references_resolved").status == GateStatus.FAIL
+    assert gate(result, "connected_join_graph").status == GateStatus.SKIP
+    assert gate(result, "no_ambiguous_joins").status == GateStatus.SKIP
+    assert not result.overall_pass
+    
+    # Warnings in the relaxed profile still run the graph gates
+    result = ODLEvaluator("relaxed").evaluate(odl_ir, version_id=1)
+    assert gate(result, "references_resolved").status == GateStatus.WARNING
+    assert gate(result, "connected_join_graph").status == GateStatus.FAIL
+    
+    print("  [PASS] Graph gates skipped on unresolved references")
+
+
+def test_verify_compile_cached():
+    """Test: Re-evaluating an unchanged IR does not recompile it."""
+    print("\nTest 7: verify.sql compile cached")
+    
+    from src.snowflake.snowflake_compiler import SnowflakeCompiler
+    
+    calls = []
+    original_compile = SnowflakeCompiler.compile
+    
+    def counting_compile(self, odl_ir, options):
+        calls.append(options)
+        return original_compile(self, odl_ir, options)
+    
+    SnowflakeCompiler.compile = counting_compile
+    try:
+        evaluator = ODLEvaluator()
+        odl_ir = create_test_odl_ir()
+        odl_ir.name = "Compile Cache Test"
+        first = evaluator.evaluate(odl_ir, version_id=1)
+        
+        # An equal IR built separately hits the same cache entry
+        same_ir = create_test_odl_ir()
+        same_ir.name = "Compile Cache Test"
+        second = evaluator.evaluate(same_ir, version_id=2)
+        assert len(calls) == 1
+        assert gate(second, "yaml_verify_passes").status == gate(first, "yaml_verify_passes").status
+        
+        odl_ir.metrics[0].expression = "SUM(amount) * 2"
+        evaluator.evaluate(odl_ir, version_id=1)
+        assert len(calls) == 2
+        
+        # The cache belongs to the evaluator and can be cleared
+        ODLEvaluator().evaluate(odl_ir, version_id=1)
+        assert len(calls) == 3
+        evaluator.invalidate_cache()
+        evaluator.evaluate(odl_ir, version_id=1)
+        assert len(calls) == 4
+        uncached = ODLEvaluator(cache_max_entries=0)
+        uncached.evaluate(same_ir, version_id=2)
+        uncached.evaluate(same_ir, version_id=2)
+        assert len(calls) == 6
+    finally:
+        SnowflakeCompiler.compile = original_compile
+    
+    print("  [PASS] verify.sql compile cached")
+
+
+def test_metrics_counts():
+    """Test: Metrics count gate statuses overall and per category."""
+    print("\nTest 8: Metrics counts")
+    
+    odl_ir = create_test_odl_ir()
+    odl_ir.relationships[0].to_object = "Client"
+    
+    metrics = ODLEvaluator().evaluate(odl_ir, version_id=1).metrics
+    assert metrics["total_gates"] == 7
+    assert metrics["skipped"] == 2
+    assert metrics["passed"] + metrics["failed"] + metrics["warnings"] + metrics["skipped"] == 7
+    assert metrics["by_category"]["structural"]["failed"] == 1
+    assert metrics["by_category"]["semantic"] == {"total": 3, "passed": 1, "failed": 0, "warnings": 0}
+    
+    print("  [PASS] Metrics counts")
+
+
+def test_graph_kernel_matches_python():
+    """Test: The optional graph kernel agrees with the pure-Python analysis."""
+    print("\nTest 9: Graph kernel matches Python analysis")
+    
+    import random
+    try:
+        from src.odl import _graph_numba
+    except ImportError:
+        print("  [SKIP] numpy not available")
+        return
+    
+    rng = random.Random(7)
+    names = [f"Object{i}" for i in range(40)]
+    odl_ir = ODLIR(
+        version="1.0.0",
+        objects=[ObjectIR(name=name) for name in names],
+        relationships=[
+            RelationshipIR(name=f"rel{i}", from_object=rng.choice(names), to_object=rng.choice(names))
+            for i in range(45)
+        ]
+    )
+    edges = [(rel.from_object, rel.to_object, rel.name) for rel in odl_ir.relationships]
+    
+    expected = ODLEvaluator()._analyze_relationship_graph(odl_ir)
+    assert _graph_numba.analyze_relationship_graph(names, edges) == expected
+    
+    print("  [PASS] Graph kernel matches Python analysis")
+
+
+def test_long_cycle_is_ambiguous():
+    """Test: A six-object relationship cycle fails the ambiguous join gate."""
+    print("\nTest 10: Long relationship cycle")
+    
+    names = [f"Object{i}" for i in range(6)]
+    odl_ir = ODLIR(
+        version="1.0.0",
+        objects=[ObjectIR(name=name) for name in names],
+        relationships=[
+            RelationshipIR(name=f"rel{i}", from_object=names[i], to_object=names[(i + 1) % 6])
+            for i in range(6)
+        ]
+    )
+    
+    result = ODLEvaluator().evaluate(odl_ir, version_id=1)
+    joins = gate(result, "no_ambiguous_joins")
+    assert joins.status == GateStatus.FAIL
+    # Objects two apart have a second path within the depth limit; for
+    # neighbours the long way round takes 6 nodes, which is beyond it
+    pairs = {(a, b) for a, b, _ in joins.details["ambiguous_paths"]}
+    assert ("Object0", "Object2") in pairs
+    assert ("Object0", "Object1") not in pairs
+    
+    print("  [PASS] Long relationship cycle")
+
+
+def main():
+    """Run all tests."""
+    print("=" * 60)
+    print("ODL Evaluation Tests")
+    print("=" * 60)
+    
+    tests = [
+        test_references_resolved,
+        test_join_key_mismatch,
+        test_join_graph_connectivity,
+        test_ambiguous_join_paths,
+        test_evaluate_update_reuses_unchanged_gates,
+        test_graph_gates_skipped_on_unresolved_references,
+        test_verify_compile_cached,
+        test_metrics_counts,
+        test_graph_kernel_matches_python,
+        test_long_cycle_is_ambiguous,
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except AssertionError as e:
+            print(f"  [FAIL] {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  [ERROR] {e}")
+            import traceback
+            traceback.print_exc()
+            failed += 1
+    
+    print("\n" + "=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
+    
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
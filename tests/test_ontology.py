@@ -3,6 +3,8 @@
 import pytest
 from pathlib import Path
 from src.ontology import OntologyManager
+from src.ontology.evaluation_metrics import OntologyEvaluator
+from src.ontology.schema import OntologySchema, Entity, Relation, Constraint, Property
 
 
 def test_ontology_manager_initialization():
@@ -36,3 +38,76 @@ def test_relation_validation():
     )
     assert is_valid or len(errors) == 0
 
+
+def test_consistency_reports_duplicate_names():
+    """Test consistency evaluation reports duplicate entity and relation names"""
+    schema = OntologySchema(
+        entities=[Entity(name="Person"), Entity(name="Person"), Entity(name="Organization")],
+        relations=[
+            Relation(name="WORKS_FOR", source="Person", target="Organization"),
+            Relation(name="WORKS_FOR", source="Person", target="Organization")
+        ]
+    )
+    
+    consistency = OntologyEvaluator().evaluate_schema(schema)["consistency"]
+    
+    assert "Duplicate entity names: {'Person'}" in consistency["issues"]
+    assert "Duplicate relation names: {'WORKS_FOR'}" in consistency["issues"]
+    assert consistency["score"] == pytest.approx(0.6)
+
+
+def test_schema_lookups_track_changes():
+    """Test schema lookups see reassigned and invalidated lists"""
+    schema = OntologySchema(
+        entities=[Entity(name="Person", description="first"), Entity(name="Person", description="second")],
+        constraints=[Constraint(type="pattern", entity="Person", property="email", pattern=".+@.+")]
+    )
+    
+    assert schema.get_entity("Person").description == "first"
+    assert schema.get_entity("Organization") is None
+    assert [c.property for c in schema.get_constraints("Person")] == ["email"]
+    
+    schema.entities = [Entity(name="Organization")]
+    assert schema.get_entity("Person") is None
+    assert schema.validate_entity_type("Organization")
+    
+    schema.constraints.append(Constraint(type="range", entity="Person", property="age", min=0))
+    schema.invalidate_indexes()
+    assert [c.property for c in schema.get_constraints("Person")] == ["email", "age"]
+    
+    copied = schema.model_copy(update={"entities": [Entity(name="Person")]})
+    assert copied.get_entity("Person") is not None
+    assert copied.get_entity("Organization") is None
+    assert schema.validate_entity_type("Organization")
+
+
+def test_validators_follow_schema_assignment():
+    """Test cached entity validators are rebuilt when the schema is replaced"""
+    manager = OntologyManager(schema_path=Path("nonexistent.yaml"))
+    manager.schema = OntologySchema(entities=[
+        Entity(name="Person", properties=[Property(name="name", type="string", required=True)])
+    ])
+    
+    assert manager.validate_entity("Person", {}) == (False, ["Missing required property: name"])
+    assert manager.validate_entity("Person", {"name": 1}) == (
+        False, ["Property name has wrong type. Expected string, got int"]
+    )
+    
+    manager.schema = OntologySchema(entities=[
+        Entity(name="Person", properties=[Property(name="age", type="integer")])
+    ])
+    assert manager.validate_entity("Person", {}) == (True, [])
+
+
+def test_pattern_constraints():
+    """Test pattern constraints on entity properties"""
+    manager = OntologyManager(schema_path=Path("nonexistent.yaml"))
+    manager.schema = OntologySchema(
+        entities=[Entity(name="Person", properties=[Property(name="email", type="string")])],
+        constraints=[Constraint(type="pattern", entity="Person", property="email", pattern=r"[^@]+@[^@]+$")]
+    )
+    
+    assert manager.validate_entity("Person", {"email": "a@b.com"}) == (True, [])
+    assert manager.validate_entity("Person", {"email": "nope"}) == (
+        False, [r"Value nope does not match pattern [^@]+@[^@]+$"]
+    )